@@ -0,0 +1,37 @@
+"""Add attendance_monthly rollup table
+
+Revision ID: add_attendance_monthly
+Revises: add_attendance_sync_events
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'add_attendance_monthly'
+down_revision = 'add_attendance_sync_events'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Create attendance_monthly table; fill it with rebuild_attendance_rollups.py
+    op.create_table(
+        'attendance_monthly',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('year_month', sa.String(length=7), nullable=False),
+        sa.Column('present_days', sa.Integer(), nullable=False),
+        sa.Column('late_days', sa.Integer(), nullable=False),
+        sa.Column('auto_hours', sa.Numeric(precision=7, scale=2), nullable=False),
+        sa.Column('manual_hours', sa.Numeric(precision=7, scale=2), nullable=False),
+        sa.Column('approved_hours', sa.Numeric(precision=7, scale=2), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'year_month')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('attendance_monthly')
@@ -0,0 +1,36 @@
+"""Add attendance_sync_events table
+
+Revision ID: add_attendance_sync_events
+Revises: add_timesheet_user_date_unique
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'add_attendance_sync_events'
+down_revision = 'add_timesheet_user_date_unique'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Create attendance_sync_events table
+    op.create_table(
+        'attendance_sync_events',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('event_id', sa.String(length=64), nullable=False),
+        sa.Column('event_type', sa.String(length=20), nullable=False),
+        sa.Column('occurred_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('attendance_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['attendance_id'], ['attendance.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'event_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('attendance_sync_events')
@@ -0,0 +1,67 @@
+"""Add unique (user_id, date) on attendance and check-in idempotency key
+
+Revision ID: add_attendance_user_date_unique
+Revises: add_sites
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_attendance_user_date_unique'
+down_revision = 'add_sites'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Concurrent check-ins could create several rows for one user and day.
+    # Keep the earliest check-in, carry over the latest check-out if it has
+    # none, and drop the rest.
+    op.execute("""
+        CREATE TEMPORARY TABLE attendance_ranked ON COMMIT DROP AS
+        SELECT id, user_id, date,
+               row_number() OVER (
+                   PARTITION BY user_id, date
+                   ORDER BY check_in IS NULL, check_in, created_at, id
+               ) AS position
+        FROM attendance
+    """)
+    op.execute("""
+        UPDATE attendance AS kept
+        SET check_out = latest.check_out,
+            check_out_latitude = latest.check_out_latitude,
+            check_out_longitude = latest.check_out_longitude,
+            check_out_address = latest.check_out_address,
+            check_out_site_id = latest.check_out_site_id
+        FROM attendance_ranked AS ranked,
+             LATERAL (
+                 SELECT * FROM attendance AS duplicate
+                 WHERE duplicate.user_id = ranked.user_id
+                   AND duplicate.date = ranked.date
+                   AND duplicate.check_out IS NOT NULL
+                 ORDER BY duplicate.check_out DESC
+                 LIMIT 1
+             ) AS latest
+        WHERE kept.id = ranked.id
+          AND ranked.position = 1
+          AND kept.check_out IS NULL
+          AND EXISTS (
+              SELECT 1 FROM attendance_ranked AS other
+              WHERE other.user_id = ranked.user_id AND other.date = ranked.date AND other.position > 1
+          )
+    """)
+    op.execute("""
+        DELETE FROM attendance
+        USING attendance_ranked AS ranked
+        WHERE attendance.id = ranked.id AND ranked.position > 1
+    """)
+
+    op.create_unique_constraint('uq_attendance_user_date', 'attendance', ['user_id', 'date'])
+    op.add_column('attendance', sa.Column('check_in_idempotency_key', sa.String(length=100), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('attendance', 'check_in_idempotency_key')
+    op.drop_constraint('uq_attendance_user_date', 'attendance', type_='unique')
@@ -0,0 +1,27 @@
+"""Add auto check-out columns
+
+Revision ID: add_auto_checkout
+Revises: add_job_runs
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_auto_checkout'
+down_revision = 'add_job_runs'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('sites', sa.Column('closing_time', sa.Time(), nullable=True))
+    op.add_column('attendance', sa.Column('auto_closed', sa.Boolean(), server_default='false', nullable=False))
+    op.add_column('timesheets', sa.Column('needs_review', sa.Boolean(), server_default='false', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('timesheets', 'needs_review')
+    op.drop_column('attendance', 'auto_closed')
+    op.drop_column('sites', 'closing_time')
@@ -0,0 +1,56 @@
+"""Add import_jobs and import_row_hashes tables
+
+Revision ID: add_import_jobs
+Revises: add_inventory_name_lower
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'add_import_jobs'
+down_revision = 'add_inventory_name_lower'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Create import_jobs table
+    op.create_table(
+        'import_jobs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('source', sa.String(255), nullable=False),
+        sa.Column('file_hash', sa.String(64), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('last_row', sa.Integer(), nullable=False),
+        sa.Column('applied_rows', sa.Integer(), nullable=False),
+        sa.Column('skipped_rows', sa.Integer(), nullable=False),
+        sa.Column('created_by', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_import_jobs_file_hash', 'import_jobs', ['file_hash'])
+
+    # Create import_row_hashes table
+    op.create_table(
+        'import_row_hashes',
+        sa.Column('source', sa.String(255), nullable=False),
+        sa.Column('row_hash', sa.String(64), nullable=False),
+        sa.Column('job_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['job_id'], ['import_jobs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('source', 'row_hash')
+    )
+    op.create_index('ix_import_row_hashes_job_id', 'import_row_hashes', ['job_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_import_row_hashes_job_id', table_name='import_row_hashes')
+    op.drop_table('import_row_hashes')
+    op.drop_index('ix_import_jobs_file_hash', table_name='import_jobs')
+    op.drop_table('import_jobs')
@@ -0,0 +1,28 @@
+"""Add normalized name index on inventory_items
+
+Revision ID: add_inventory_name_lower
+Revises: add_procurement_items
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_inventory_name_lower'
+down_revision = 'add_procurement_items'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Index for name matching during bulk imports: lower-cased, whitespace collapsed
+    op.create_index(
+        'ix_inventory_items_name_lower',
+        'inventory_items',
+        [sa.text(r"lower(btrim(regexp_replace(name, '\s+', ' ', 'g')))")]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_inventory_items_name_lower', table_name='inventory_items')
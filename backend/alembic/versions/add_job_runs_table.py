@@ -0,0 +1,37 @@
+"""Add job_runs table
+
+Revision ID: add_job_runs
+Revises: add_attendance_monthly
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'add_job_runs'
+down_revision = 'add_attendance_monthly'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Create job_runs table
+    op.create_table(
+        'job_runs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('job_name', sa.String(length=100), nullable=False),
+        sa.Column('scheduled_for', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('started_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('duration_ms', sa.Integer(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('job_name', 'scheduled_for', name='uq_job_runs_job_slot')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('job_runs')
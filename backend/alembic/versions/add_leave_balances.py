@@ -0,0 +1,95 @@
+"""Add leave policies, balances, ledger, holidays and working-day calendar
+
+Revision ID: add_leave_balances
+Revises: add_leave_overlap_constraint
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'add_leave_balances'
+down_revision = 'add_leave_overlap_constraint'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'leave_policies',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('days_per_month', sa.Numeric(precision=5, scale=2), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name')
+    )
+
+    op.create_table(
+        'leave_balances',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('policy_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('balance', sa.Numeric(precision=7, scale=2), nullable=False),
+        sa.Column('accrued_through', sa.Date(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['policy_id'], ['leave_policies.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('user_id')
+    )
+
+    op.create_table(
+        'leave_ledger',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('entry_type', sa.String(length=20), nullable=False),
+        sa.Column('days', sa.Numeric(precision=7, scale=2), nullable=False),
+        sa.Column('effective_date', sa.Date(), nullable=False),
+        sa.Column('leave_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('note', sa.Text(), nullable=True),
+        sa.Column('created_by_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['leave_id'], ['leaves.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['created_by_id'], ['users.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_leave_ledger_user_created', 'leave_ledger', ['user_id', 'created_at'])
+    op.create_index(
+        'uq_leave_ledger_accrual',
+        'leave_ledger',
+        ['user_id', 'effective_date'],
+        unique=True,
+        postgresql_where=sa.text("entry_type = 'accrual'")
+    )
+
+    op.create_table(
+        'holidays',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('date')
+    )
+
+    # Filled on first use and by the nightly accrue-leave job
+    op.create_table(
+        'working_days',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('is_working', sa.Boolean(), nullable=False),
+        sa.Column('working_day_number', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('day')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('working_days')
+    op.drop_table('holidays')
+    op.drop_index('uq_leave_ledger_accrual', table_name='leave_ledger')
+    op.drop_index('ix_leave_ledger_user_created', table_name='leave_ledger')
+    op.drop_table('leave_ledger')
+    op.drop_table('leave_balances')
+    op.drop_table('leave_policies')
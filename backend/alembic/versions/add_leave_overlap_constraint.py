@@ -0,0 +1,111 @@
+"""Add leave period column and overlap exclusion constraint
+
+Revision ID: add_leave_overlap_constraint
+Revises: add_leaves_table
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from collections import defaultdict
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_leave_overlap_constraint'
+down_revision = 'add_leaves_table'
+branch_labels = None
+depends_on = None
+
+
+def _reject_overlapping_approved(conn) -> None:
+    """
+    Reject approved leaves that overlap an approved leave of the same user
+    that is kept. Leaves are kept in order of (approved_at, created_at, id),
+    so the leave approved first wins and the outcome does not depend on
+    row order.
+    """
+    rows = conn.execute(sa.text("""
+        SELECT l.id, l.user_id, l.period
+        FROM leaves l
+        WHERE l.status = 'APPROVED'
+          AND EXISTS (
+              SELECT 1 FROM leaves o
+              WHERE o.user_id = l.user_id
+                AND o.id <> l.id
+                AND o.status = 'APPROVED'
+                AND o.period && l.period
+          )
+        ORDER BY l.user_id, l.approved_at NULLS LAST, l.created_at, l.id
+    """)).all()
+
+    kept = defaultdict(list)
+    rejected = []
+    for leave_id, user_id, period in rows:
+        if any(_overlaps(period, other) for other in kept[user_id]):
+            rejected.append(leave_id)
+        else:
+            kept[user_id].append(period)
+
+    if rejected:
+        conn.execute(
+            sa.text("""
+                UPDATE leaves
+                SET status = 'REJECTED',
+                    rejection_reason = 'Overlaps an earlier approved leave',
+                    updated_at = now()
+                WHERE id = ANY(:ids)
+            """),
+            {"ids": rejected}
+        )
+
+
+def _overlaps(a, b) -> bool:
+    # Both ranges are canonical daterange values: inclusive lower, exclusive upper
+    return a.lower < b.upper and b.lower < a.upper
+
+
+def upgrade() -> None:
+    # GiST equality on user_id
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    # IF NOT EXISTS: create_all on startup already adds the column to new databases
+    op.execute(
+        "ALTER TABLE leaves ADD COLUMN IF NOT EXISTS period daterange "
+        "GENERATED ALWAYS AS (daterange(start_date, end_date, '[]')) STORED"
+    )
+
+    # Approved leaves could already overlap: updates were never re-checked and
+    # the check on create could race
+    _reject_overlapping_approved(op.get_bind())
+
+    # Reject pending requests that overlap an approved or earlier request of
+    # the same user, so the constraint can be created
+    op.execute("""
+        UPDATE leaves l
+        SET status = 'REJECTED',
+            rejection_reason = 'Overlaps another leave request',
+            updated_at = now()
+        WHERE l.status = 'PENDING'
+          AND EXISTS (
+              SELECT 1 FROM leaves o
+              WHERE o.user_id = l.user_id
+                AND o.id <> l.id
+                AND o.status IN ('PENDING', 'APPROVED')
+                AND o.period && l.period
+                AND (o.status = 'APPROVED' OR (o.created_at, o.id) < (l.created_at, l.id))
+          )
+    """)
+
+    op.create_exclude_constraint(
+        'ex_leaves_user_period',
+        'leaves',
+        ('user_id', '='),
+        ('period', '&&'),
+        using='gist',
+        where="status IN ('PENDING', 'APPROVED')"
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('ex_leaves_user_period', 'leaves')
+    op.drop_column('leaves', 'period')
@@ -0,0 +1,46 @@
+"""Add leaves table
+
+Revision ID: add_leaves_table
+Revises: add_reconciliation_indexes
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'add_leaves_table'
+down_revision = 'add_reconciliation_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing databases got leaves from create_all on startup; only
+    # databases built from migrations alone still need it
+    if sa.inspect(op.get_bind()).has_table('leaves'):
+        return
+
+    op.create_table(
+        'leaves',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('start_date', sa.Date(), nullable=False),
+        sa.Column('end_date', sa.Date(), nullable=False),
+        sa.Column('reason', sa.Text(), nullable=True),
+        sa.Column('status', sa.Enum('PENDING', 'APPROVED', 'REJECTED', name='leavestatus'), nullable=False),
+        sa.Column('approved_by_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('approved_at', sa.DateTime(), nullable=True),
+        sa.Column('rejection_reason', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['approved_by_id'], ['users.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    # Left in place: on most databases the table predates this revision
+    pass
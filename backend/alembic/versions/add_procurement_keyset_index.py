@@ -0,0 +1,28 @@
+"""Add keyset pagination index on procurement_items
+
+Revision ID: add_procurement_keyset_index
+Revises: add_import_jobs
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_procurement_keyset_index'
+down_revision = 'add_import_jobs'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves the newest-first procurement list filtered by status
+    op.create_index(
+        'ix_procurement_items_status_created_at_id',
+        'procurement_items',
+        ['status', sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_procurement_items_status_created_at_id', table_name='procurement_items')
@@ -0,0 +1,34 @@
+"""Add covering indexes for the reconciliation report
+
+Revision ID: add_reconciliation_indexes
+Revises: add_auto_checkout
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_reconciliation_indexes'
+down_revision = 'add_auto_checkout'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_daily_logs_user_date_hours', 'daily_logs', ['user_id', 'date'],
+                    postgresql_include=['hours_spent'])
+    op.create_index('ix_timesheets_user_date_hours', 'timesheets', ['user_id', 'date'],
+                    postgresql_include=['total_hours', 'status'])
+    op.create_index('ix_attendance_user_date_times', 'attendance', ['user_id', 'date'],
+                    postgresql_include=['check_in', 'check_out'])
+
+    # Lets the planner estimate per-(user, date) groups of daily logs
+    op.execute("CREATE STATISTICS IF NOT EXISTS st_daily_logs_user_date (ndistinct) ON user_id, date FROM daily_logs")
+    op.execute("ANALYZE daily_logs")
+
+
+def downgrade() -> None:
+    op.execute("DROP STATISTICS IF EXISTS st_daily_logs_user_date")
+    op.drop_index('ix_attendance_user_date_times', table_name='attendance')
+    op.drop_index('ix_timesheets_user_date_hours', table_name='timesheets')
+    op.drop_index('ix_daily_logs_user_date_hours', table_name='daily_logs')
@@ -0,0 +1,46 @@
+"""Add sites table and matched sites on attendance
+
+Revision ID: add_sites
+Revises: add_procurement_keyset_index
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'add_sites'
+down_revision = 'add_procurement_keyset_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Create sites table
+    op.create_table(
+        'sites',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('latitude', sa.Numeric(precision=10, scale=8), nullable=False),
+        sa.Column('longitude', sa.Numeric(precision=11, scale=8), nullable=False),
+        sa.Column('radius_meters', sa.Integer(), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    # Record which site each check-in and check-out matched
+    op.add_column('attendance', sa.Column('check_in_site_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.add_column('attendance', sa.Column('check_out_site_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.create_foreign_key('fk_attendance_check_in_site_id', 'attendance', 'sites', ['check_in_site_id'], ['id'], ondelete='SET NULL')
+    op.create_foreign_key('fk_attendance_check_out_site_id', 'attendance', 'sites', ['check_out_site_id'], ['id'], ondelete='SET NULL')
+
+
+def downgrade() -> None:
+    op.drop_constraint('fk_attendance_check_out_site_id', 'attendance', type_='foreignkey')
+    op.drop_constraint('fk_attendance_check_in_site_id', 'attendance', type_='foreignkey')
+    op.drop_column('attendance', 'check_out_site_id')
+    op.drop_column('attendance', 'check_in_site_id')
+    op.drop_table('sites')
@@ -0,0 +1,49 @@
+"""Add unique (user_id, date) on timesheets
+
+Revision ID: add_timesheet_user_date_unique
+Revises: add_attendance_user_date_unique
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_timesheet_user_date_unique'
+down_revision = 'add_attendance_user_date_unique'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keep one timesheet per user and day, preferring an approved one, with
+    # the largest hours recorded on any of the duplicates
+    op.execute("""
+        CREATE TEMPORARY TABLE timesheets_ranked ON COMMIT DROP AS
+        SELECT id, user_id, date,
+               row_number() OVER (
+                   PARTITION BY user_id, date
+                   ORDER BY status = 'approved' DESC, updated_at DESC, created_at, id
+               ) AS position,
+               max(auto_hours) OVER (PARTITION BY user_id, date) AS max_auto_hours,
+               max(manual_hours) OVER (PARTITION BY user_id, date) AS max_manual_hours,
+               count(*) OVER (PARTITION BY user_id, date) AS copies
+        FROM timesheets
+    """)
+    op.execute("""
+        UPDATE timesheets
+        SET auto_hours = ranked.max_auto_hours,
+            manual_hours = ranked.max_manual_hours
+        FROM timesheets_ranked AS ranked
+        WHERE timesheets.id = ranked.id AND ranked.position = 1 AND ranked.copies > 1
+    """)
+    op.execute("""
+        DELETE FROM timesheets
+        USING timesheets_ranked AS ranked
+        WHERE timesheets.id = ranked.id AND ranked.position > 1
+    """)
+
+    op.create_unique_constraint('uq_timesheets_user_date', 'timesheets', ['user_id', 'date'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_timesheets_user_date', 'timesheets', type_='unique')
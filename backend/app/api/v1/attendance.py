@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date, datetime
@@ -7,14 +8,22 @@ from app.database import get_db
 from app.schemas.attendance import (
     CheckInRequest,
     CheckOutRequest,
-    AttendanceResponse
+    AttendanceResponse,
+    AttendanceSyncRequest,
+    AttendanceSyncResult,
+    AttendanceMonthlyResponse,
+    AttendanceCalendar
 )
 from app.models.attendance import Attendance
+from app.models.attendance_monthly import AttendanceMonthly
 from app.models.user import User
 from app.core.permissions import require_role, Permission
 from app.api.deps import get_current_user
-from app.services.attendance import validate_location
+from app.services.attendance import find_site, upsert_check_in
 from app.services.timesheet import process_checkout
+from app.services.attendance_sync import sync_events
+from app.services.attendance_calendar import attendance_calendar
+from app.services.rollups import refresh_monthly_rollup
 
 router = APIRouter()
 
@@ -22,58 +31,52 @@ router = APIRouter()
 @router.post("/check-in", response_model=AttendanceResponse, status_code=status.HTTP_201_CREATED)
 def check_in(
     check_in_data: CheckInRequest,
+    idempotency_key: Optional[str] = Header(None, max_length=100),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Check-in with GPS validation.
 
-    Validates that the user is within 200 meters of the lab location.
-    Creates a new attendance record for today.
+    Validates that the user is within the radius of one of the sites and
+    records the nearest matching site. Creates a new attendance record for today.
+
+    Retrying with the same Idempotency-Key header returns the original record.
     """
     # Validate GPS location
-    if not validate_location(check_in_data.latitude, check_in_data.longitude):
+    match = find_site(db, check_in_data.latitude, check_in_data.longitude)
+    if not match:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="You are not within 200 meters of the office location. Please check-in from the office premises."
+            detail="You are not within range of any office site. Please check-in from the office premises."
         )
 
-    # Check if user has already checked in today
-    today = date.today()
-    existing_attendance = db.query(Attendance).filter(
-        Attendance.user_id == current_user.id,
-        Attendance.date == today
-    ).first()
-
-    if existing_attendance and existing_attendance.check_in:
+    # Create today's record, or complete one without a check-in, in one statement
+    attendance = upsert_check_in(
+        db,
+        current_user.id,
+        date.today(),
+        {
+            "check_in_latitude": check_in_data.latitude,
+            "check_in_longitude": check_in_data.longitude,
+            "check_in_address": check_in_data.address,
+            "check_in_site_id": match.site.key,
+        },
+        idempotency_key=idempotency_key
+    )
+
+    if attendance is None:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="You have already checked in today"
         )
 
-    # Create or update attendance record
-    if existing_attendance:
-        # Update existing record
-        existing_attendance.check_in = datetime.utcnow()
-        existing_attendance.check_in_latitude = check_in_data.latitude
-        existing_attendance.check_in_longitude = check_in_data.longitude
-        existing_attendance.check_in_address = check_in_data.address
-        attendance = existing_attendance
-    else:
-        # Create new record
-        attendance = Attendance(
-            user_id=current_user.id,
-            date=today,
-            check_in=datetime.utcnow(),
-            check_in_latitude=check_in_data.latitude,
-            check_in_longitude=check_in_data.longitude,
-            check_in_address=check_in_data.address,
-            status="present"
-        )
-        db.add(attendance)
+    refresh_monthly_rollup(db, current_user.id, attendance.date)
 
+    # The RETURNING row is complete; detach it so the commit does not expire it
+    db.expunge(attendance)
     db.commit()
-    db.refresh(attendance)
 
     return attendance
 
@@ -88,21 +91,22 @@ def check_out(
     Check-out with GPS validation.
 
     Validates GPS location and updates attendance record.
-    Automatically generates/updates timesheet entry.
+    Automatically generates/updates timesheet entry in the same transaction.
     """
     # Validate GPS location
-    if not validate_location(check_out_data.latitude, check_out_data.longitude):
+    match = find_site(db, check_out_data.latitude, check_out_data.longitude)
+    if not match:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="You are not within 200 meters of the office location. Please check-out from the office premises."
+            detail="You are not within range of any office site. Please check-out from the office premises."
         )
 
-    # Get today's attendance
+    # Get today's attendance, locked so concurrent check-outs queue up
     today = date.today()
     attendance = db.query(Attendance).filter(
         Attendance.user_id == current_user.id,
         Attendance.date == today
-    ).first()
+    ).with_for_update().first()
 
     if not attendance or not attendance.check_in:
         raise HTTPException(
@@ -121,19 +125,48 @@ def check_out(
     attendance.check_out_latitude = check_out_data.latitude
     attendance.check_out_longitude = check_out_data.longitude
     attendance.check_out_address = check_out_data.address
+    attendance.check_out_site_id = match.site.key
 
     if check_out_data.notes:
         attendance.notes = check_out_data.notes
 
-    db.commit()
-    db.refresh(attendance)
-
     # Auto-generate/update timesheet
     process_checkout(attendance, db)
+    refresh_monthly_rollup(db, current_user.id, attendance.date)
+
+    db.commit()
+    db.refresh(attendance)
 
     return attendance
 
 
+@router.post("/sync", response_model=AttendanceSyncResult)
+def sync_attendance(
+    sync_data: AttendanceSyncRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Apply check-in/check-out events queued on a device while offline.
+
+    Events are accepted for the authenticated user only. They are validated
+    and applied in the order they happened, in one transaction per batch. Each event gets an outcome: applied, duplicate (already
+    synced) or rejected with a reason. Resending a batch is safe.
+    """
+    try:
+        result = sync_events(db, current_user.id, sync_data.events)
+        db.commit()
+    except IntegrityError:
+        # An online check-in or another sync for the same user won the race
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Attendance changed while syncing. Please retry."
+        )
+
+    return result
+
+
 @router.get("/today", response_model=Optional[AttendanceResponse])
 def get_today_attendance(
     db: Session = Depends(get_db),
@@ -204,6 +237,59 @@ def get_all_attendance(
     return attendances
 
 
+@router.get("/monthly", response_model=List[AttendanceMonthlyResponse])
+def get_monthly_attendance(
+    year_month: str = Query(..., pattern=r"^\d{4}-(0[1-9]|1[0-2])$"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get every user's attendance and hours totals for a month (admin and manager only).
+
+    Reads the maintained monthly rollups, one row per user.
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN, Permission.MANAGER])
+
+    rows = db.query(AttendanceMonthly, User.full_name).join(
+        User, User.id == AttendanceMonthly.user_id
+    ).filter(
+        AttendanceMonthly.year_month == year_month
+    ).order_by(User.full_name).all()
+
+    return [
+        AttendanceMonthlyResponse(
+            user_id=rollup.user_id,
+            full_name=full_name,
+            year_month=rollup.year_month,
+            present_days=rollup.present_days,
+            late_days=rollup.late_days,
+            auto_hours=rollup.auto_hours,
+            manual_hours=rollup.manual_hours,
+            approved_hours=rollup.approved_hours
+        )
+        for rollup, full_name in rows
+    ]
+
+
+@router.get("/calendar", response_model=AttendanceCalendar)
+def get_attendance_calendar(
+    month: str = Query(..., pattern=r"^\d{4}-(0[1-9]|1[0-2])$"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get the team's attendance calendar for a month (admin and manager only).
+
+    Each user's month is a string with one status character per day; see
+    `legend` for the codes.
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN, Permission.MANAGER])
+
+    return attendance_calendar(db, month)
+
+
 @router.get("/user/{user_id}", response_model=List[AttendanceResponse])
 def get_user_attendance(
     user_id: UUID,
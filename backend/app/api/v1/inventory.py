@@ -1,6 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from sqlalchemy.orm import Session, joinedload
+from typing import List, Optional
 from uuid import UUID
 from app.database import get_db
 from app.schemas.inventory import (
@@ -12,12 +12,32 @@ from app.schemas.inventory import (
     InventoryItemResponse,
     StockInRequest,
     StockOutRequest,
-    InventoryTransactionResponse
+    InventoryTransactionResponse,
+    InventoryImportResult,
+    InventoryDuplicateGroup,
+    InventoryMergeRequest,
+    ReorderSupplierGroup,
+    ReorderDraftRequest
 )
+from app.schemas.procurement import ProcurementItemResponse
 from app.models.inventory import InventoryCategory, InventoryItem, InventoryTransaction
+from app.models.procurement import ProcurementItem
 from app.models.user import User
 from app.core.permissions import require_role, Permission
 from app.api.deps import get_current_user
+from app.services.inventory_import import InventoryImport, ImportFileError, inventory_reader
+from app.services.import_jobs import ImportJobTracker, hash_file
+from app.services.dedupe import DEFAULT_THRESHOLD
+from app.services.inventory_merge import MergeError, find_inventory_duplicates, merge_items
+from app.services.procurement import invalidate_procurement_facets
+from app.services.reorder import (
+    DEFAULT_COVER_DAYS,
+    DEFAULT_LEAD_TIME_DAYS,
+    DEFAULT_WINDOW_DAYS,
+    draft_procurement_items,
+    group_by_supplier,
+    reorder_suggestions
+)
 
 router = APIRouter()
 
@@ -179,6 +199,189 @@ def get_low_stock_items(
     return items
 
 
+@router.post("/import", response_model=InventoryImportResult)
+def import_inventory_items(
+    file: UploadFile = File(...),
+    dry_run: bool = True,
+    source: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Bulk import inventory items from a CSV or XLSX file (admin and manager only).
+
+    The file is streamed and processed in batches; the header row is located
+    automatically and blank or totals rows are skipped. Rows are matched to existing
+    items by SKU or name and reported as new, updated or duplicate. With
+    dry_run=true (the default) nothing is written.
+
+    Rows already applied from the same source (the file name unless `source`
+    is given) are skipped by content hash. Real runs are tracked as import
+    jobs that commit after every batch, so re-uploading a file whose import
+    was interrupted resumes after the last committed batch.
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN, Permission.MANAGER])
+
+    source = source or file.filename
+    job = None
+    if not dry_run:
+        job = ImportJobTracker(db, source, hash_file(file.file), current_user.id)
+
+    importer = InventoryImport(db, current_user.id, dry_run=dry_run, source=source, job=job)
+
+    try:
+        result = importer.run(inventory_reader(file.file, file.filename))
+    except Exception as e:
+        # Batches committed before the failure stay applied; the job resumes after them
+        if job:
+            job.fail()
+        else:
+            db.rollback()
+        if isinstance(e, ImportFileError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        raise
+
+    if job:
+        job.complete()
+
+    return result
+
+
+@router.get("/duplicates", response_model=List[InventoryDuplicateGroup])
+def get_duplicate_items(
+    threshold: float = Query(DEFAULT_THRESHOLD, gt=0, le=1),
+    category_id: UUID = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Find groups of likely duplicate items (admin and manager only).
+
+    Items are compared within their category and only when their names
+    carry the same values and part numbers, so "10K Ohm 0805 Resistor" and
+    "Resistor 10k 0805" are grouped while "1k 0805 Resistor" is not.
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN, Permission.MANAGER])
+
+    groups = find_inventory_duplicates(db, threshold, category_id)
+
+    return [
+        {
+            "items": [
+                {
+                    "id": item.id,
+                    "name": item.name,
+                    "sku": item.sku,
+                    "category_id": item.category_id,
+                    "quantity": item.quantity,
+                    "similarity": similarity
+                }
+                for item, similarity in group
+            ]
+        }
+        for group in groups
+    ]
+
+
+@router.post("/merge", response_model=InventoryItemResponse)
+def merge_inventory_items(
+    merge_data: InventoryMergeRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Merge duplicate items into a target item (admin only).
+
+    Transactions of the merged items move to the target, their quantities
+    are added to it and the merged items are deleted.
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN])
+
+    try:
+        item = merge_items(db, merge_data.target_id, merge_data.source_ids)
+    except MergeError as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except LookupError as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+    db.commit()
+    db.refresh(item)
+
+    return item
+
+
+@router.get("/reorder-suggestions", response_model=List[ReorderSupplierGroup])
+def get_reorder_suggestions(
+    window_days: int = Query(DEFAULT_WINDOW_DAYS, ge=7, le=730),
+    lead_time_days: int = Query(DEFAULT_LEAD_TIME_DAYS, ge=1, le=365),
+    cover_days: int = Query(DEFAULT_COVER_DAYS, ge=1, le=365),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Forecast items to reorder from their consumption (admin and manager only).
+
+    Daily usage over the last `window_days` sets a reorder point of
+    lead-time demand plus safety stock. Items at or below it, counting
+    quantities already on pending procurement requests, are suggested with
+    enough to cover the lead time plus `cover_days`, grouped by supplier.
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN, Permission.MANAGER])
+
+    suggestions = reorder_suggestions(db, window_days, lead_time_days, cover_days)
+    return group_by_supplier(suggestions)
+
+
+@router.post("/reorder-suggestions/draft", response_model=List[ProcurementItemResponse], status_code=status.HTTP_201_CREATED)
+def draft_reorder_requests(
+    draft_data: ReorderDraftRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Draft procurement requests from the reorder forecast (admin and manager only).
+
+    Drafts every current suggestion, or only those for `item_ids`.
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN, Permission.MANAGER])
+
+    suggestions = reorder_suggestions(
+        db,
+        draft_data.window_days,
+        draft_data.lead_time_days,
+        draft_data.cover_days,
+        item_ids=draft_data.item_ids
+    )
+    draft_ids = [item.id for item in draft_procurement_items(db, suggestions, current_user.id)]
+    db.commit()
+    invalidate_procurement_facets()
+
+    # Reload the drafts with their requester in one query, in draft order
+    drafted = {
+        item.id: item
+        for item in db.query(ProcurementItem).options(
+            joinedload(ProcurementItem.requester)
+        ).filter(ProcurementItem.id.in_(draft_ids))
+    }
+    return [drafted[item_id] for item_id in draft_ids]
+
+
 @router.post("/", response_model=InventoryItemResponse, status_code=status.HTTP_201_CREATED)
 def create_inventory_item(
     item_data: InventoryItemCreate,
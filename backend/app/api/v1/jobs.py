@@ -0,0 +1,56 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from app.database import get_db
+from app.schemas.job import JobResponse, JobRunResponse
+from app.models.job_run import JobRun
+from app.models.user import User
+from app.core.permissions import require_role, Permission
+from app.core.scheduler import scheduler
+from app.api.deps import get_current_user
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[JobResponse])
+def list_jobs(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get the background jobs scheduled in this worker (admin only).
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN])
+
+    return [
+        JobResponse(
+            name=job.name,
+            schedule=job.schedule.expression if job.schedule else None,
+            next_run_at=job.next_run_at
+        )
+        for job in sorted(scheduler.jobs.values(), key=lambda job: job.name)
+    ]
+
+
+@router.get("/runs", response_model=List[JobRunResponse])
+def list_job_runs(
+    job_name: Optional[str] = None,
+    status_filter: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 50,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get recent background job runs, newest first (admin only).
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN])
+
+    query = db.query(JobRun)
+    if job_name:
+        query = query.filter(JobRun.job_name == job_name)
+    if status_filter:
+        query = query.filter(JobRun.status == status_filter)
+
+    return query.order_by(JobRun.started_at.desc()).offset(skip).limit(limit).all()
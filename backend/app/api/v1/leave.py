@@ -1,18 +1,37 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date, datetime
 from uuid import UUID
 from app.database import get_db
-from app.schemas.leave import LeaveCreate, LeaveUpdate, LeaveApprove, LeaveResponse
-from app.models.leave import Leave, LeaveStatus
+from app.schemas.leave import LeaveCreate, LeaveUpdate, LeaveApprove, LeaveResponse, LeaveAvailability
+from app.models.leave import Leave, LeaveStatus, LEAVE_OVERLAP_CONSTRAINT
 from app.models.user import User
 from app.core.permissions import require_role, Permission
 from app.api.deps import get_current_user
+from app.services.leave_availability import MAX_AVAILABILITY_DAYS, team_availability
+from app.services.leave_balance import debit_approved_leave, restore_deleted_leave
 
 router = APIRouter()
 
 
+def _commit_leave(db: Session, leave: Leave) -> None:
+    """Commit a created or changed leave, turning an overlap into a 400."""
+    try:
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        diag = getattr(e.orig, "diag", None)
+        if diag is not None and diag.constraint_name == LEAVE_OVERLAP_CONSTRAINT:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="You already have a leave request for overlapping dates"
+            )
+        raise
+    db.refresh(leave)
+
+
 @router.post("/", response_model=LeaveResponse, status_code=status.HTTP_201_CREATED)
 def create_leave(
     leave_data: LeaveCreate,
@@ -31,21 +50,7 @@ def create_leave(
             detail="End date must be after or equal to start date"
         )
 
-    # Check for overlapping leave
-    existing_leave = db.query(Leave).filter(
-        Leave.user_id == current_user.id,
-        Leave.status.in_([LeaveStatus.PENDING, LeaveStatus.APPROVED]),
-        Leave.start_date <= leave_data.end_date,
-        Leave.end_date >= leave_data.start_date
-    ).first()
-
-    if existing_leave:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="You already have a leave request for overlapping dates"
-        )
-
-    # Create leave
+    # Create leave; the database rejects overlaps with pending or approved leave
     new_leave = Leave(
         user_id=current_user.id,
         start_date=leave_data.start_date,
@@ -55,8 +60,7 @@ def create_leave(
     )
 
     db.add(new_leave)
-    db.commit()
-    db.refresh(new_leave)
+    _commit_leave(db, new_leave)
 
     return new_leave
 
@@ -107,6 +111,36 @@ def get_all_leaves(
     return leaves
 
 
+@router.get("/availability", response_model=LeaveAvailability)
+def get_team_availability(
+    start: date = Query(...),
+    end: date = Query(...),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get how many people are available each day and who is out (admin and manager only).
+
+    Approved and pending leave both count as out; each absentee's status
+    tells them apart.
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN, Permission.MANAGER])
+
+    if end < start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="End date must be after or equal to start date"
+        )
+    if (end - start).days >= MAX_AVAILABILITY_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Availability can cover at most {MAX_AVAILABILITY_DAYS} days"
+        )
+
+    return team_availability(db, start, end)
+
+
 @router.get("/{leave_id}", response_model=LeaveResponse)
 def get_leave(
     leave_id: UUID,
@@ -180,8 +214,7 @@ def update_leave(
     for field, value in update_data.items():
         setattr(leave, field, value)
 
-    db.commit()
-    db.refresh(leave)
+    _commit_leave(db, leave)
 
     return leave
 
@@ -195,10 +228,13 @@ def approve_or_reject_leave(
 ):
     """
     Approve or reject a leave request (admin and manager only).
+
+    Approval takes the leave's working days off the user's leave balance.
     """
     require_role(current_user, [Permission.SUPER_ADMIN, Permission.MANAGER])
 
-    leave = db.query(Leave).filter(Leave.id == leave_id).first()
+    # Locked so a request is only approved, and debited, once
+    leave = db.query(Leave).filter(Leave.id == leave_id).with_for_update().first()
     if not leave:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -219,6 +255,9 @@ def approve_or_reject_leave(
     if approval_data.status == "rejected" and approval_data.rejection_reason:
         leave.rejection_reason = approval_data.rejection_reason
 
+    if leave.status == LeaveStatus.APPROVED:
+        debit_approved_leave(db, leave, current_user.id)
+
     db.commit()
     db.refresh(leave)
 
@@ -235,9 +274,9 @@ def delete_leave(
     Delete a leave request.
 
     Users can delete their own pending leaves.
-    Admins can delete any leave.
+    Admins can delete any leave; days an approved leave took are given back.
     """
-    leave = db.query(Leave).filter(Leave.id == leave_id).first()
+    leave = db.query(Leave).filter(Leave.id == leave_id).with_for_update().first()
     if not leave:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -261,6 +300,7 @@ def delete_leave(
             detail="You can only delete pending leave requests"
         )
 
+    restore_deleted_leave(db, leave, current_user.id)
     db.delete(leave)
     db.commit()
 
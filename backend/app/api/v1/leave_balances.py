@@ -0,0 +1,303 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import date
+from uuid import UUID
+from app.database import get_db
+from app.schemas.leave import (
+    LeavePolicyCreate,
+    LeavePolicyResponse,
+    LeavePolicyAssign,
+    LeaveBalanceResponse,
+    LeaveAdjustment,
+    LeaveLedgerEntryResponse,
+    HolidayCreate,
+    HolidayResponse
+)
+from app.models.leave_balance import Holiday, LeaveBalance, LeaveLedgerEntry, LeavePolicy
+from app.models.user import User
+from app.core.permissions import require_role, Permission
+from app.api.deps import get_current_user
+from app.services.leave_balance import ADJUSTMENT, assign_policy, rebuild_working_calendar, record_entry
+
+router = APIRouter()
+
+
+def _balance_query(db: Session):
+    return db.query(User, LeaveBalance, LeavePolicy.name).outerjoin(
+        LeaveBalance, LeaveBalance.user_id == User.id
+    ).outerjoin(
+        LeavePolicy, LeavePolicy.id == LeaveBalance.policy_id
+    )
+
+
+def _balance_response(user: User, balance: Optional[LeaveBalance], policy_name: Optional[str]) -> LeaveBalanceResponse:
+    return LeaveBalanceResponse(
+        user_id=user.id,
+        full_name=user.full_name,
+        policy_id=balance.policy_id if balance else None,
+        policy_name=policy_name,
+        balance=balance.balance if balance else 0,
+        accrued_through=balance.accrued_through if balance else None,
+        updated_at=balance.updated_at if balance else None
+    )
+
+
+def _get_balance(db: Session, user_id: UUID) -> LeaveBalanceResponse:
+    row = _balance_query(db).filter(User.id == user_id).first()
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    return _balance_response(*row)
+
+
+@router.get("/policies", response_model=List[LeavePolicyResponse])
+def list_policies(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get leave accrual policies.
+    """
+    return db.query(LeavePolicy).order_by(LeavePolicy.name).all()
+
+
+@router.post("/policies", response_model=LeavePolicyResponse, status_code=status.HTTP_201_CREATED)
+def create_policy(
+    policy_data: LeavePolicyCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Create a leave accrual policy (admin only).
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN])
+
+    policy = LeavePolicy(name=policy_data.name, days_per_month=policy_data.days_per_month, is_active=True)
+    db.add(policy)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="A policy with this name already exists"
+        )
+    db.refresh(policy)
+
+    return policy
+
+
+@router.get("/holidays", response_model=List[HolidayResponse])
+def list_holidays(
+    year: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get holidays, optionally for one year.
+    """
+    query = db.query(Holiday)
+    if year:
+        query = query.filter(Holiday.date >= date(year, 1, 1), Holiday.date <= date(year, 12, 31))
+    return query.order_by(Holiday.date).all()
+
+
+@router.post("/holidays", response_model=HolidayResponse, status_code=status.HTTP_201_CREATED)
+def create_holiday(
+    holiday_data: HolidayCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Add a holiday (admin only).
+
+    Leave approved from now on no longer counts the day; balances already
+    debited are not changed.
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN])
+
+    holiday = Holiday(date=holiday_data.date, name=holiday_data.name)
+    db.add(holiday)
+    try:
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="There is already a holiday on this date"
+        )
+
+    rebuild_working_calendar(db)
+    db.commit()
+    db.refresh(holiday)
+
+    return holiday
+
+
+@router.delete("/holidays/{holiday_id}", status_code=status.HTTP_200_OK)
+def delete_holiday(
+    holiday_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Remove a holiday (admin only).
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN])
+
+    holiday = db.query(Holiday).filter(Holiday.id == holiday_id).first()
+    if not holiday:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Holiday not found"
+        )
+
+    db.delete(holiday)
+    db.flush()
+    rebuild_working_calendar(db)
+    db.commit()
+
+    return {"message": "Holiday deleted successfully"}
+
+
+@router.get("/me", response_model=LeaveBalanceResponse)
+def get_my_balance(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get current user's leave balance.
+    """
+    return _get_balance(db, current_user.id)
+
+
+@router.get("/", response_model=List[LeaveBalanceResponse])
+def get_all_balances(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get every active user's leave balance (admin and manager only).
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN, Permission.MANAGER])
+
+    rows = _balance_query(db).filter(User.is_active == True).order_by(User.full_name).all()
+    return [_balance_response(*row) for row in rows]
+
+
+@router.get("/{user_id}", response_model=LeaveBalanceResponse)
+def get_user_balance(
+    user_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get a user's leave balance.
+
+    Users can view their own balance, managers and admins can view all.
+    """
+    # Check permissions
+    if user_id != current_user.id:
+        require_role(current_user, [Permission.SUPER_ADMIN, Permission.MANAGER])
+
+    return _get_balance(db, user_id)
+
+
+@router.get("/{user_id}/ledger", response_model=List[LeaveLedgerEntryResponse])
+def get_user_ledger(
+    user_id: UUID,
+    skip: int = 0,
+    limit: int = 50,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get the history of a user's leave balance, newest first.
+
+    Users can view their own history, managers and admins can view all.
+    """
+    # Check permissions
+    if user_id != current_user.id:
+        require_role(current_user, [Permission.SUPER_ADMIN, Permission.MANAGER])
+
+    return db.query(LeaveLedgerEntry).filter(
+        LeaveLedgerEntry.user_id == user_id
+    ).order_by(
+        LeaveLedgerEntry.created_at.desc(), LeaveLedgerEntry.id
+    ).offset(skip).limit(limit).all()
+
+
+@router.put("/{user_id}/policy", response_model=LeaveBalanceResponse)
+def set_user_policy(
+    user_id: UUID,
+    assign_data: LeavePolicyAssign,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Put a user on a leave accrual policy, or take them off it (admin only).
+
+    The current month is credited right away if it has not been yet.
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN])
+
+    if not db.query(User.id).filter(User.id == user_id).first():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+
+    if assign_data.policy_id:
+        policy = db.query(LeavePolicy).filter(LeavePolicy.id == assign_data.policy_id).first()
+        if not policy or not policy.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Leave policy not found or inactive"
+            )
+
+    assign_policy(db, user_id, assign_data.policy_id)
+    db.commit()
+
+    return _get_balance(db, user_id)
+
+
+@router.post("/{user_id}/adjust", response_model=LeaveBalanceResponse)
+def adjust_user_balance(
+    user_id: UUID,
+    adjustment: LeaveAdjustment,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Add or remove leave days by hand, e.g. an opening balance (admin only).
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN])
+
+    if not db.query(User.id).filter(User.id == user_id).first():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    if not adjustment.days:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Adjustment must be non-zero"
+        )
+
+    record_entry(
+        db, user_id, ADJUSTMENT, adjustment.days, adjustment.effective_date or date.today(),
+        note=adjustment.note, created_by_id=current_user.id
+    )
+    db.commit()
+
+    return _get_balance(db, user_id)
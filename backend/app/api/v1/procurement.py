@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 from datetime import datetime
@@ -7,13 +9,25 @@ from app.database import get_db
 from app.schemas.procurement import (
     ProcurementItemCreate,
     ProcurementItemUpdate,
-    ProcurementItemResponse
+    ProcurementItemResponse,
+    ProcurementReceiveRequest,
+    ProcurementReceiveResult,
+    ProcurementItemPage
 )
 from app.models.procurement import ProcurementItem
-from app.models.inventory import InventoryItem, InventoryCategory
+from app.models.inventory import InventoryCategory
 from app.models.user import User
 from app.api.deps import get_current_user
 from app.core.permissions import Permission
+from app.services.non_gem_export import NonGemExport
+from app.services.procurement import (
+    ReceivePermissionError,
+    decode_cursor,
+    encode_cursor,
+    invalidate_procurement_facets,
+    procurement_facets,
+    receive_items
+)
 
 router = APIRouter()
 
@@ -42,6 +56,7 @@ def create_procurement_item(
 
     db.add(procurement_item)
     db.commit()
+    invalidate_procurement_facets()
     db.refresh(procurement_item)
 
     # Load requester relationship
@@ -50,32 +65,61 @@ def create_procurement_item(
     return procurement_item
 
 
-@router.get("/", response_model=List[ProcurementItemResponse])
+@router.get("/", response_model=ProcurementItemPage)
 def list_procurement_items(
-    status_filter: Optional[str] = None,
+    status_filter: Optional[str] = "pending",
     vendor_filter: Optional[str] = None,
     priority_filter: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Get all procurement items (pending only by default).
+    Get procurement items, newest first, one page at a time.
 
-    Optional filters: status, vendor, priority
+    Optional filters: status (pending by default, "all" for every status),
+    vendor, priority. Pass `next_cursor` from a response as `cursor` to get
+    the following page. Facet counts by vendor, priority and status are
+    included with every page.
     """
+    status_value = None if status_filter == "all" else status_filter
+
     query = db.query(ProcurementItem).options(
         joinedload(ProcurementItem.requester)
-    ).filter(ProcurementItem.status == "pending")
+    )
 
-    if status_filter:
-        query = query.filter(ProcurementItem.status == status_filter)
+    if status_value:
+        query = query.filter(ProcurementItem.status == status_value)
     if vendor_filter:
         query = query.filter(ProcurementItem.vendor == vendor_filter)
     if priority_filter:
         query = query.filter(ProcurementItem.priority == priority_filter)
 
-    items = query.order_by(ProcurementItem.created_at.desc()).all()
-    return items
+    if cursor:
+        try:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        # Keyset pagination: continue strictly after the last item returned
+        query = query.filter(
+            tuple_(ProcurementItem.created_at, ProcurementItem.id) < tuple_(cursor_created_at, cursor_id)
+        )
+
+    items = query.order_by(
+        ProcurementItem.created_at.desc(), ProcurementItem.id.desc()
+    ).limit(limit + 1).all()
+
+    next_cursor = encode_cursor(items[limit - 1]) if len(items) > limit else None
+
+    return {
+        "items": items[:limit],
+        "next_cursor": next_cursor,
+        "facets": procurement_facets(db, status_value)
+    }
 
 
 @router.get("/non-gem", response_model=List[ProcurementItemResponse])
@@ -104,6 +148,34 @@ def list_non_gem_items(
     return items
 
 
+@router.get("/non-gem/export")
+def export_non_gem_items(
+    export_format: str = Query("xlsx", alias="format", pattern="^(xlsx|csv)$"),
+    vendor_filter: Optional[str] = None,
+    mark_completed: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Download the Non-Gem list grouped by vendor with subtotals.
+
+    Optional: mark_completed sets the completion date of every exported item.
+    """
+    export = NonGemExport(db, vendor=vendor_filter, mark_completed=mark_completed)
+    filename = f"non_gem_{datetime.utcnow():%Y%m%d}.{export_format}"
+
+    if export_format == "csv":
+        body, media_type = export.csv(), "text/csv"
+    else:
+        body, media_type = export.xlsx(), "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
 @router.put("/{item_id}", response_model=ProcurementItemResponse)
 def update_procurement_item(
     item_id: UUID,
@@ -128,6 +200,7 @@ def update_procurement_item(
         setattr(item, field, value)
 
     db.commit()
+    invalidate_procurement_facets()
     db.refresh(item)
 
     # Load requester
@@ -225,6 +298,56 @@ def complete_non_gem(
     return item
 
 
+@router.post("/receive", response_model=ProcurementReceiveResult)
+def receive_procurement_items(
+    receive_data: ProcurementReceiveRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Receive many procurement items into inventory at once.
+
+    Each item is matched to an existing inventory item by SKU or name and
+    stocked in with a transaction; a new inventory item is created only when
+    there is no match. All changes are applied in a single transaction.
+    Requesters can receive their own items; managers and admins any item.
+    """
+    if receive_data.category_id:
+        # Verify category exists
+        category = db.query(InventoryCategory).filter(InventoryCategory.id == receive_data.category_id).first()
+        if not category:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Inventory category not found"
+            )
+
+    try:
+        result = receive_items(
+            db,
+            receive_data.item_ids,
+            current_user,
+            category_id=receive_data.category_id,
+            min_threshold=receive_data.min_threshold
+        )
+    except LookupError as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except ReceivePermissionError as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e)
+        )
+
+    db.commit()
+    invalidate_procurement_facets()
+
+    return result
+
+
 @router.post("/{item_id}/receive", status_code=status.HTTP_200_OK)
 def mark_as_received(
     item_id: UUID,
@@ -236,7 +359,8 @@ def mark_as_received(
     Mark item as received and optionally move to inventory.
 
     Requester, managers, and admins can mark items as received.
-    If category_id is provided, creates inventory item.
+    If category_id is provided, the quantity is stocked into the matching
+    inventory item, or a new one in that category.
     """
     item = db.query(ProcurementItem).filter(ProcurementItem.id == item_id).first()
 
@@ -256,11 +380,7 @@ def mark_as_received(
             detail="Only the requester, managers, or admins can mark items as received"
         )
 
-    # Mark as received
-    item.status = "received"
-    item.received_at = datetime.utcnow()
-
-    # Optionally create inventory item
+    # Optionally move into inventory
     if category_id:
         # Verify category exists
         category = db.query(InventoryCategory).filter(InventoryCategory.id == category_id).first()
@@ -270,18 +390,14 @@ def mark_as_received(
                 detail="Inventory category not found"
             )
 
-        # Create inventory item
-        inventory_item = InventoryItem(
-            name=item.name,
-            category_id=category_id,
-            quantity=item.quantity,
-            unit="pcs",
-            min_threshold=5,
-            notes=f"Added from procurement. Vendor: {item.vendor}"
-        )
-        db.add(inventory_item)
+        receive_items(db, [item.id], current_user, category_id=category_id)
+    else:
+        # Mark as received
+        item.status = "received"
+        item.received_at = datetime.utcnow()
 
     db.commit()
+    invalidate_procurement_facets()
 
     return {"message": "Item marked as received", "moved_to_inventory": category_id is not None}
 
@@ -317,6 +433,7 @@ def delete_procurement_item(
 
     db.delete(item)
     db.commit()
+    invalidate_procurement_facets()
 
     return {"message": "Procurement item deleted successfully"}
 
@@ -329,5 +446,4 @@ def list_unique_vendors(
     """
     Get list of unique vendors from procurement items.
     """
-    vendors = db.query(ProcurementItem.vendor).distinct().all()
-    return [v[0] for v in vendors]
+    return sorted(entry["value"] for entry in procurement_facets(db)["vendor"])
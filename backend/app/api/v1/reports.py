@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+from app.database import get_db
+from app.schemas.daily_log import ReconciliationRow
+from app.models.user import User
+from app.core.permissions import require_role, Permission
+from app.api.deps import get_current_user
+from app.services.reports import reconciliation_query
+
+router = APIRouter()
+
+
+@router.get("/reconciliation", response_model=List[ReconciliationRow])
+def get_reconciliation_report(
+    start_date: date,
+    end_date: date,
+    tolerance: Decimal = Query(Decimal("0.5"), ge=0),
+    project_id: Optional[UUID] = None,
+    user_id: Optional[UUID] = None,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get days where daily-log hours and timesheet hours differ by more than `tolerance` (admin and manager only).
+
+    Newest days first. Optional: project_id to limit the report to that
+    project's members, user_id for one user.
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN, Permission.MANAGER])
+
+    if end_date < start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end_date must not be before start_date"
+        )
+
+    query = reconciliation_query(db, start_date, end_date, tolerance, project_id=project_id, user_id=user_id)
+    return query.offset(skip).limit(limit).all()
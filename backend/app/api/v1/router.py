@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1 import auth, users, attendance, timesheets, projects, boards, tasks, inventory, dashboard, daily_logs, procurement, leave
+from app.api.v1 import auth, users, attendance, timesheets, projects, boards, tasks, inventory, dashboard, daily_logs, procurement, leave, leave_balances, sites, jobs, reports
 
 api_router = APIRouter()
 
@@ -9,6 +9,7 @@ api_router.include_router(users.router, prefix="/users", tags=["Users"])
 api_router.include_router(attendance.router, prefix="/attendance", tags=["Attendance"])
 api_router.include_router(timesheets.router, prefix="/timesheets", tags=["Timesheets"])
 api_router.include_router(leave.router, prefix="/leave", tags=["Leave"])
+api_router.include_router(leave_balances.router, prefix="/leave-balances", tags=["Leave Balances"])
 api_router.include_router(projects.router, prefix="/projects", tags=["Projects"])
 api_router.include_router(boards.router, prefix="/boards", tags=["Boards"])
 api_router.include_router(tasks.router, prefix="/tasks", tags=["Tasks"])
@@ -16,3 +17,6 @@ api_router.include_router(inventory.router, prefix="/inventory", tags=["Inventor
 api_router.include_router(dashboard.router, prefix="/dashboard", tags=["Dashboard"])
 api_router.include_router(daily_logs.router, prefix="/daily-logs", tags=["Daily Logs"])
 api_router.include_router(procurement.router, prefix="/procurement", tags=["Procurement"])
+api_router.include_router(sites.router, prefix="/sites", tags=["Sites"])
+api_router.include_router(jobs.router, prefix="/jobs", tags=["Jobs"])
+api_router.include_router(reports.router, prefix="/reports", tags=["Reports"])
@@ -0,0 +1,137 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import date
+from uuid import UUID
+from app.database import get_db
+from app.schemas.site import SiteCreate, SiteUpdate, SiteResponse, SiteRevalidateResult
+from app.models.site import Site
+from app.models.user import User
+from app.core.permissions import require_role, Permission
+from app.api.deps import get_current_user
+from app.services.attendance import invalidate_geofence, revalidate_attendance
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[SiteResponse])
+def list_sites(
+    include_inactive: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get sites where users can check in.
+    """
+    query = db.query(Site)
+    if not include_inactive:
+        query = query.filter(Site.is_active == True)
+    return query.order_by(Site.name).all()
+
+
+@router.post("/", response_model=SiteResponse, status_code=status.HTTP_201_CREATED)
+def create_site(
+    site_data: SiteCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Create a new check-in site (admin only).
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN])
+
+    site = Site(
+        name=site_data.name,
+        latitude=site_data.latitude,
+        longitude=site_data.longitude,
+        radius_meters=site_data.radius_meters,
+        closing_time=site_data.closing_time,
+        is_active=True
+    )
+
+    db.add(site)
+    db.commit()
+    invalidate_geofence()
+    db.refresh(site)
+
+    return site
+
+
+@router.post("/revalidate", response_model=SiteRevalidateResult)
+def revalidate_attendance_sites(
+    since: Optional[date] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Re-match recorded check-in and check-out locations against the current sites (admin only).
+
+    Optional: only attendance from `since` onwards.
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN])
+
+    return revalidate_attendance(db, since)
+
+
+@router.put("/{site_id}", response_model=SiteResponse)
+def update_site(
+    site_id: UUID,
+    site_data: SiteUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Update a check-in site (admin only).
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN])
+
+    site = db.query(Site).filter(Site.id == site_id).first()
+
+    if not site:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Site not found"
+        )
+
+    # Update fields
+    update_data = site_data.model_dump(exclude_unset=True)
+    for field, value in update_data.items():
+        setattr(site, field, value)
+
+    db.commit()
+    invalidate_geofence()
+    db.refresh(site)
+
+    return site
+
+
+@router.delete("/{site_id}", status_code=status.HTTP_200_OK)
+def delete_site(
+    site_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Delete a check-in site (admin only).
+
+    Attendance recorded at the site is kept without a site.
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN])
+
+    site = db.query(Site).filter(Site.id == site_id).first()
+
+    if not site:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Site not found"
+        )
+
+    db.delete(site)
+    db.commit()
+    invalidate_geofence()
+
+    return {"message": "Site deleted successfully"}
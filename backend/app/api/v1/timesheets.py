@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date, datetime
@@ -8,12 +9,21 @@ from app.schemas.timesheet import (
     TimesheetResponse,
     TimesheetUpdate,
     TimesheetApprove,
-    TimesheetReject
+    TimesheetReject,
+    TimesheetBulkApprove,
+    TimesheetBulkReject,
+    TimesheetBulkResult,
+    TimesheetPeriodTotal,
+    TimesheetRecompute,
+    TimesheetRecomputeResult
 )
 from app.models.timesheet import Timesheet
 from app.models.user import User
 from app.core.permissions import require_role, Permission, can_approve_timesheet
 from app.api.deps import get_current_user
+from app.services.rollups import refresh_monthly_rollup
+from app.services.timesheet import bulk_review_timesheets, recompute_timesheets
+from app.services.payroll_export import PayrollExport, period_totals_query
 
 router = APIRouter()
 
@@ -50,13 +60,15 @@ def get_all_timesheets(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     status_filter: Optional[str] = None,
+    needs_review: Optional[bool] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get all timesheets (admin and manager only).
 
-    Optionally filter by date range and status.
+    Optionally filter by date range, status and whether the hours came
+    from an automatic check-out that needs review.
     """
     # Check permissions
     require_role(current_user, [Permission.SUPER_ADMIN, Permission.MANAGER])
@@ -69,11 +81,67 @@ def get_all_timesheets(
         query = query.filter(Timesheet.date <= end_date)
     if status_filter:
         query = query.filter(Timesheet.status == status_filter)
+    if needs_review is not None:
+        query = query.filter(Timesheet.needs_review == needs_review)
 
     timesheets = query.order_by(Timesheet.date.desc()).offset(skip).limit(limit).all()
     return timesheets
 
 
+@router.get("/summary", response_model=List[TimesheetPeriodTotal])
+def get_timesheet_summary(
+    period: str = Query("week", pattern="^(week|month)$"),
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    user_id: Optional[List[UUID]] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get each user's timesheet hours per week or month (admin and manager only).
+
+    Hours are split by approval status. Optionally filter by date range
+    and users.
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN, Permission.MANAGER])
+
+    return period_totals_query(db, period, start_date, end_date, user_id).all()
+
+
+@router.get("/summary/export")
+def export_timesheet_summary(
+    period: str = Query("week", pattern="^(week|month)$"),
+    export_format: str = Query("xlsx", alias="format", pattern="^(xlsx|csv)$"),
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    user_id: Optional[List[UUID]] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Download per-user weekly or monthly hours for payroll (admin and manager only).
+
+    Takes the same filters as the summary.
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN, Permission.MANAGER])
+
+    export = PayrollExport(db, period, start_date, end_date, user_id)
+    filename = f"payroll_{period}_{datetime.utcnow():%Y%m%d}.{export_format}"
+
+    if export_format == "csv":
+        body, media_type = export.csv(), "text/csv"
+    else:
+        body, media_type = export.xlsx(), "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
 @router.get("/user/{user_id}", response_model=List[TimesheetResponse])
 def get_user_timesheets(
     user_id: UUID,
@@ -178,6 +246,7 @@ def update_timesheet(
 
     timesheet.updated_at = datetime.utcnow()
 
+    refresh_monthly_rollup(db, timesheet.user_id, timesheet.date)
     db.commit()
     db.refresh(timesheet)
 
@@ -226,10 +295,12 @@ def approve_timesheet(
 
     # Update timesheet
     timesheet.status = "approved"
+    timesheet.needs_review = False
     timesheet.approved_by = current_user.id
     timesheet.approved_at = datetime.utcnow()
     timesheet.updated_at = datetime.utcnow()
 
+    refresh_monthly_rollup(db, timesheet.user_id, timesheet.date)
     db.commit()
     db.refresh(timesheet)
 
@@ -279,6 +350,7 @@ def reject_timesheet(
 
     # Update timesheet
     timesheet.status = "rejected"
+    timesheet.needs_review = False
     timesheet.approved_by = current_user.id  # Track who rejected it
     timesheet.approved_at = datetime.utcnow()
 
@@ -287,7 +359,99 @@ def reject_timesheet(
 
     timesheet.updated_at = datetime.utcnow()
 
+    refresh_monthly_rollup(db, timesheet.user_id, timesheet.date)
     db.commit()
     db.refresh(timesheet)
 
     return timesheet
+
+
+def _bulk_review(data: TimesheetBulkApprove, new_status: str, db: Session, current_user: User, notes: Optional[str] = None):
+    # Check permissions
+    if not can_approve_timesheet(current_user):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only managers and admins can review timesheets"
+        )
+
+    if data.ids is None and not any([data.user_ids, data.start_date, data.end_date, data.status]):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide timesheet ids or a filter"
+        )
+
+    result = bulk_review_timesheets(
+        db,
+        current_user.id,
+        new_status,
+        ids=data.ids,
+        user_ids=data.user_ids,
+        start_date=data.start_date,
+        end_date=data.end_date,
+        status_filter=data.status,
+        notes=notes
+    )
+    db.commit()
+
+    return result
+
+
+@router.post("/bulk-approve", response_model=TimesheetBulkResult)
+def bulk_approve_timesheets(
+    approve_data: TimesheetBulkApprove,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Approve many timesheets at once (manager/admin only).
+
+    Pass `ids`, or a filter of `user_ids`, `start_date`, `end_date` and
+    `status`. Own and already approved timesheets are skipped; every
+    timesheet gets an outcome.
+    """
+    return _bulk_review(approve_data, "approved", db, current_user)
+
+
+@router.post("/bulk-reject", response_model=TimesheetBulkResult)
+def bulk_reject_timesheets(
+    reject_data: TimesheetBulkReject,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Reject many timesheets at once (manager/admin only).
+
+    Takes the same selection as bulk-approve, plus optional rejection notes.
+    """
+    return _bulk_review(reject_data, "rejected", db, current_user, notes=reject_data.notes)
+
+
+@router.post("/recompute", response_model=TimesheetRecomputeResult)
+def recompute_timesheet_hours(
+    recompute_data: TimesheetRecompute,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Recompute auto hours from attendance for a date range (admin only).
+
+    Creates missing timesheets and updates changed ones, a week at a time.
+    Approved timesheets are skipped unless `force` is set. Optional:
+    user_ids to limit the users.
+    """
+    # Check permissions
+    require_role(current_user, [Permission.SUPER_ADMIN])
+
+    if recompute_data.end_date < recompute_data.start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end_date must not be before start_date"
+        )
+
+    return recompute_timesheets(
+        db,
+        recompute_data.start_date,
+        recompute_data.end_date,
+        user_ids=recompute_data.user_ids,
+        force=recompute_data.force
+    )
@@ -18,6 +18,23 @@ class Settings(BaseSettings):
     LAB_LONGITUDE: float = 77.1866
     LAB_RADIUS_METERS: int = 1000
 
+    # Attendance reports: check-ins after this local time count as late
+    ATTENDANCE_TIMEZONE: str = "Asia/Kolkata"
+    LATE_CHECK_IN_AFTER: str = "09:30"
+
+    # Nightly close-out of forgotten check-outs: "closing_time" uses the
+    # site's closing time, "last_activity" the user's last logged activity
+    # that day (falling back to the closing time)
+    AUTO_CHECKOUT_POLICY: str = "closing_time"
+    AUTO_CHECKOUT_CLOSING_TIME: str = "18:00"
+
+    # Background jobs: disable to run no scheduled jobs in this process
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_TIMEZONE: str = "Asia/Kolkata"
+
+    # Leave balances: ISO weekdays (Monday = 1) that are not working days
+    WEEKEND_DAYS: str = "6,7"
+
     # App
     DEBUG: bool = True
     API_V1_PREFIX: str = "/api/v1"
@@ -0,0 +1,41 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class TTLCache:
+    """
+    Small in-process cache whose entries expire after `ttl` seconds.
+
+    Meant for cheap-to-recompute aggregates that many requests read; each
+    worker process keeps its own copy. Expired entries are dropped when a
+    new value is stored, and at most `max_size` entries are kept, evicting
+    the ones closest to expiry first.
+    """
+
+    def __init__(self, ttl: float, max_size: int = 1024):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_set(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for `key`, computing and storing it if missing or expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                return entry[1]
+
+        value = compute()
+        with self._lock:
+            self._entries = {k: e for k, e in self._entries.items() if e[0] > now}
+            if key not in self._entries and len(self._entries) >= self.max_size:
+                oldest = min(self._entries, key=lambda k: self._entries[k][0])
+                del self._entries[oldest]
+            self._entries[key] = (now + self.ttl, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,239 @@
+import asyncio
+import hashlib
+import logging
+import time
+import traceback
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Set
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal, engine
+from app.models.job_run import JobRun
+
+logger = logging.getLogger(__name__)
+
+# Longest the scheduler sleeps between checks, so clock jumps are noticed
+MAX_SLEEP_SECONDS = 60
+
+# Cron fields: minute, hour, day of month, month, day of week (0 or 7 = Sunday)
+CRON_FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+
+class CronSchedule:
+    """
+    Standard five-field cron expression, e.g. "30 2 * * *" or "*/15 9-18 * * 1-5".
+
+    Each field accepts `*`, numbers, ranges `a-b`, steps `*/n` or `a-b/n`
+    and comma-separated lists of those. As in cron, when both day of month
+    and day of week are restricted a day matching either one fires.
+    """
+
+    def __init__(self, expression: str, tz: str):
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expression!r}")
+
+        self.expression = expression
+        self.tz = ZoneInfo(tz)
+        fields = [self._parse(part, low, high) for part, (low, high) in zip(parts, CRON_FIELDS)]
+        self.minutes, self.hours, self.days, self.months, weekdays = [sorted(field) for field in fields]
+        self.weekdays = {day % 7 for day in weekdays}
+        self.any_day = parts[2] == "*"
+        self.any_weekday = parts[4] == "*"
+
+    @staticmethod
+    def _parse(field: str, low: int, high: int) -> Set[int]:
+        values = set()
+        for part in field.split(","):
+            value_range, _, step = part.partition("/")
+            if value_range == "*":
+                start, end = low, high
+            elif "-" in value_range:
+                start, end = map(int, value_range.split("-"))
+            else:
+                start = end = int(value_range)
+            if not low <= start <= end <= high:
+                raise ValueError(f"Cron field out of range: {field!r}")
+            values.update(range(start, end + 1, int(step) if step else 1))
+        return values
+
+    def _day_matches(self, day: datetime) -> bool:
+        day_ok = day.day in self.days
+        weekday_ok = (day.isoweekday() % 7) in self.weekdays
+        if self.any_day:
+            return weekday_ok
+        if self.any_weekday:
+            return day_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, after: datetime) -> datetime:
+        """First matching minute strictly after `after`, as a UTC datetime."""
+        current = (after.astimezone(self.tz) + timedelta(minutes=1)).replace(second=0, microsecond=0)
+
+        # Walk day by day; eight years always contains a Feb 29
+        for _ in range(366 * 8):
+            if current.month in self.months and self._day_matches(current):
+                for hour in self.hours:
+                    if hour < current.hour:
+                        continue
+                    for minute in self.minutes:
+                        if hour == current.hour and minute < current.minute:
+                            continue
+                        return current.replace(hour=hour, minute=minute).astimezone(timezone.utc)
+            current = (current + timedelta(days=1)).replace(hour=0, minute=0)
+
+        raise ValueError(f"Cron expression never fires: {self.expression!r}")
+
+
+class Job:
+    """
+    A registered job. `func` receives a database session; the scheduler
+    commits it when the job returns and rolls it back if the job raises.
+    """
+
+    def __init__(self, name: str, func: Callable[[Session], None], schedule: Optional[CronSchedule] = None,
+                 run_at: Optional[datetime] = None):
+        self.name = name
+        self.func = func
+        self.schedule = schedule
+        self.next_run_at = run_at or (schedule.next_after(datetime.now(timezone.utc)) if schedule else None)
+
+
+def advisory_lock_key(name: str) -> int:
+    """Stable signed 64-bit key for pg_advisory_lock, derived from a job name."""
+    return int.from_bytes(hashlib.sha256(name.encode()).digest()[:8], "big", signed=True)
+
+
+def run_job(job: Job, scheduled_for: datetime) -> Optional[str]:
+    """
+    Run one slot of a job, unless another worker is already running the
+    job or has already run this slot.
+
+    A session-level pg_try_advisory_lock on the job name is held for the
+    whole run, so a job never overlaps itself across uvicorn processes.
+    The run is recorded in job_runs, whose unique (job_name, scheduled_for)
+    stops a second worker from repeating a slot that finished before it
+    got the lock. Returns the final status, or None when skipped.
+    """
+    key = advisory_lock_key(job.name)
+
+    with engine.connect() as lock_conn:
+        acquired = lock_conn.execute(select(func.pg_try_advisory_lock(key))).scalar()
+        lock_conn.commit()
+        if not acquired:
+            return None
+
+        db = SessionLocal()
+        try:
+            run_id = db.execute(
+                pg_insert(JobRun).values(job_name=job.name, scheduled_for=scheduled_for, status="running")
+                .on_conflict_do_nothing(constraint="uq_job_runs_job_slot")
+                .returning(JobRun.id)
+            ).scalar()
+            db.commit()
+            if run_id is None:
+                return None
+
+            started = time.perf_counter()
+            try:
+                job.func(db)
+                db.commit()
+                status, error = "succeeded", None
+            except Exception:
+                db.rollback()
+                status, error = "failed", traceback.format_exc()
+                logger.exception("Job %s failed", job.name)
+
+            db.execute(update(JobRun).where(JobRun.id == run_id).values(
+                status=status,
+                finished_at=func.now(),
+                duration_ms=int((time.perf_counter() - started) * 1000),
+                error=error
+            ))
+            db.commit()
+            return status
+        finally:
+            db.close()
+            lock_conn.execute(select(func.pg_advisory_unlock(key)))
+            lock_conn.commit()
+
+
+class Scheduler:
+    """
+    asyncio scheduler for cron and one-off jobs, started once per worker
+    process. Jobs run in threads, since they use the synchronous session.
+    """
+
+    def __init__(self, tz: str):
+        self.tz = tz
+        self.jobs: Dict[str, Job] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._running: Set[asyncio.Task] = set()
+
+    def cron(self, name: str, expression: str, func: Callable[[Session], None]) -> Job:
+        """Register `func` to run whenever the cron expression fires (in the scheduler's timezone)."""
+        return self._add(Job(name, func, schedule=CronSchedule(expression, self.tz)))
+
+    def once(self, name: str, func: Callable[[Session], None], run_at: Optional[datetime] = None) -> Job:
+        """
+        Run `func` once, at `run_at` or as soon as possible. Safe to call
+        from request handlers; `name` should be unique per call.
+        """
+        return self._add(Job(name, func, run_at=run_at or datetime.now(timezone.utc)))
+
+    def _add(self, job: Job) -> Job:
+        self.jobs[job.name] = job
+        if self._loop and self._wakeup:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        return job
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _due(self, now: datetime) -> List[Job]:
+        return [job for job in self.jobs.values() if job.next_run_at and job.next_run_at <= now]
+
+    async def _run(self) -> None:
+        while True:
+            now = datetime.now(timezone.utc)
+            for job in self._due(now):
+                scheduled_for = job.next_run_at
+                if job.schedule:
+                    job.next_run_at = job.schedule.next_after(now)
+                else:
+                    del self.jobs[job.name]
+                task = asyncio.create_task(asyncio.to_thread(run_job, job, scheduled_for))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+
+            sleep = MAX_SLEEP_SECONDS
+            upcoming = [job.next_run_at for job in self.jobs.values() if job.next_run_at]
+            if upcoming:
+                sleep = min(sleep, (min(upcoming) - now).total_seconds())
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(sleep, 0))
+            except asyncio.TimeoutError:
+                pass
+
+
+scheduler = Scheduler(settings.SCHEDULER_TIMEZONE)
@@ -3,6 +3,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
 from app.api.v1.router import api_router
 from app.database import engine, Base
+from app.core.scheduler import scheduler
+from app.services.scheduled_jobs import register_jobs
 import app.models  # Import models to register them with Base
 
 # Create FastAPI app
@@ -49,3 +51,16 @@ def health_check():
 @app.on_event("startup")
 def on_startup():
     Base.metadata.create_all(bind=engine)
+
+
+# Start background jobs in every worker; advisory locks keep each run on one
+@app.on_event("startup")
+async def start_scheduler():
+    if settings.SCHEDULER_ENABLED:
+        register_jobs(scheduler)
+        scheduler.start()
+
+
+@app.on_event("shutdown")
+async def stop_scheduler():
+    await scheduler.stop()
@@ -1,16 +1,30 @@
 from app.models.user import Role, User
-from app.models.attendance import Attendance
+from app.models.attendance import Attendance, AttendanceSyncEvent
 from app.models.timesheet import Timesheet
+from app.models.leave import Leave, LeaveStatus
+from app.models.leave_balance import LeavePolicy, LeaveBalance, LeaveLedgerEntry, Holiday, WorkingDay
 from app.models.project import Project, ProjectMember, Board, Task, TaskComment
 from app.models.inventory import InventoryCategory, InventoryItem, InventoryTransaction
 from app.models.daily_log import DailyLog
 from app.models.procurement import ProcurementItem
+from app.models.import_job import ImportJob, ImportRowHash
+from app.models.site import Site
+from app.models.attendance_monthly import AttendanceMonthly
+from app.models.job_run import JobRun
 
 __all__ = [
     "Role",
     "User",
     "Attendance",
+    "AttendanceSyncEvent",
     "Timesheet",
+    "Leave",
+    "LeaveStatus",
+    "LeavePolicy",
+    "LeaveBalance",
+    "LeaveLedgerEntry",
+    "Holiday",
+    "WorkingDay",
     "Project",
     "ProjectMember",
     "Board",
@@ -21,4 +35,9 @@ __all__ = [
     "InventoryTransaction",
     "DailyLog",
     "ProcurementItem",
+    "ImportJob",
+    "ImportRowHash",
+    "Site",
+    "AttendanceMonthly",
+    "JobRun",
 ]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Date, Numeric, Text
+from sqlalchemy import Column, String, DateTime, ForeignKey, Date, Numeric, Text, Boolean, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -20,7 +20,11 @@ class Attendance(Base):
     check_out_longitude = Column(Numeric(11, 8), nullable=True)
     check_in_address = Column(Text, nullable=True)
     check_out_address = Column(Text, nullable=True)
+    check_in_site_id = Column(UUID(as_uuid=True), ForeignKey("sites.id", ondelete="SET NULL"), nullable=True)
+    check_out_site_id = Column(UUID(as_uuid=True), ForeignKey("sites.id", ondelete="SET NULL"), nullable=True)
+    check_in_idempotency_key = Column(String(100), nullable=True)  # Idempotency-Key of the request that checked in
     status = Column(String(20), default="present")
+    auto_closed = Column(Boolean, nullable=False, default=False, server_default="false")  # Check-out filled in by the nightly close-out
     notes = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
@@ -29,5 +33,20 @@ class Attendance(Base):
 
     # Unique constraint for user and date
     __table_args__ = (
+        UniqueConstraint("user_id", "date", name="uq_attendance_user_date"),
+        # Covers the reconciliation report with index-only scans
+        Index("ix_attendance_user_date_times", "user_id", "date", postgresql_include=["check_in", "check_out"]),
         {"schema": None},
     )
+
+
+class AttendanceSyncEvent(Base):
+    """A check-in or check-out event applied from a device's offline queue."""
+    __tablename__ = "attendance_sync_events"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    event_id = Column(String(64), primary_key=True)  # Generated on the device; deduplicates retried batches
+    event_type = Column(String(20), nullable=False)  # 'check_in' or 'check_out'
+    occurred_at = Column(DateTime(timezone=True), nullable=False)
+    attendance_id = Column(UUID(as_uuid=True), ForeignKey("attendance.id", ondelete="CASCADE"), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Numeric
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class AttendanceMonthly(Base):
+    """Per-user monthly attendance and hours totals, kept current on every change."""
+    __tablename__ = "attendance_monthly"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    year_month = Column(String(7), primary_key=True)  # 'YYYY-MM'
+    present_days = Column(Integer, nullable=False, default=0)
+    late_days = Column(Integer, nullable=False, default=0)
+    auto_hours = Column(Numeric(7, 2), nullable=False, default=0)
+    manual_hours = Column(Numeric(7, 2), nullable=False, default=0)
+    approved_hours = Column(Numeric(7, 2), nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Date, Numeric, Text
+from sqlalchemy import Column, String, DateTime, ForeignKey, Date, Numeric, Text, Index, DDL, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -21,3 +21,17 @@ class DailyLog(Base):
     # Relationships
     user = relationship("User", back_populates="daily_logs")
     project = relationship("Project", back_populates="daily_logs")
+
+    # Covers per-user daily sums of hours (reconciliation report) with index-only scans
+    __table_args__ = (
+        Index("ix_daily_logs_user_date_hours", "user_id", "date", postgresql_include=["hours_spent"]),
+    )
+
+
+# Several logs per user and day: without multi-column statistics the planner
+# underestimates the (user_id, date) groups and skips the covering index
+event.listen(
+    DailyLog.__table__,
+    "after_create",
+    DDL("CREATE STATISTICS IF NOT EXISTS st_daily_logs_user_date (ndistinct) ON user_id, date FROM daily_logs")
+)
@@ -0,0 +1,35 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, PrimaryKeyConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+from app.database import Base
+
+
+class ImportJob(Base):
+    __tablename__ = "import_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    source = Column(String(255), nullable=False)  # e.g. the uploaded file name
+    file_hash = Column(String(64), nullable=False, index=True)  # sha256 of the uploaded file
+    status = Column(String(20), nullable=False, default="running")  # running, completed, failed
+    last_row = Column(Integer, nullable=False, default=0)  # last source row covered by a committed batch
+    applied_rows = Column(Integer, nullable=False, default=0)
+    skipped_rows = Column(Integer, nullable=False, default=0)
+    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class ImportRowHash(Base):
+    __tablename__ = "import_row_hashes"
+
+    source = Column(String(255), nullable=False)
+    row_hash = Column(String(64), nullable=False)  # sha256 of the parsed row
+    job_id = Column(UUID(as_uuid=True), ForeignKey("import_jobs.id", ondelete="CASCADE"), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # One entry per distinct row content per source
+    __table_args__ = (
+        PrimaryKeyConstraint("source", "row_hash"),
+    )
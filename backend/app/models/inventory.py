@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Numeric, Text
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Numeric, Text, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -6,6 +6,11 @@ import uuid
 from app.database import Base
 
 
+def normalized_name(column):
+    """SQL for a name lower-cased with whitespace collapsed, as normalize_name does in Python."""
+    return func.lower(func.btrim(func.regexp_replace(column, r"\s+", " ", "g")))
+
+
 class InventoryCategory(Base):
     __tablename__ = "inventory_categories"
 
@@ -40,6 +45,11 @@ class InventoryItem(Base):
     category = relationship("InventoryCategory", back_populates="items")
     transactions = relationship("InventoryTransaction", back_populates="item", cascade="all, delete-orphan")
 
+    # Normalized name lookups used when matching imported rows
+    __table_args__ = (
+        Index("ix_inventory_items_name_lower", normalized_name(name)),
+    )
+
 
 class InventoryTransaction(Base):
     __tablename__ = "inventory_transactions"
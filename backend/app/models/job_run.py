@@ -0,0 +1,23 @@
+from sqlalchemy import Column, String, DateTime, Integer, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+from app.database import Base
+
+
+class JobRun(Base):
+    __tablename__ = "job_runs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    job_name = Column(String(100), nullable=False)
+    scheduled_for = Column(DateTime(timezone=True), nullable=False)  # the slot this run covers
+    status = Column(String(20), nullable=False, default="running")  # running, succeeded, failed
+    started_at = Column(DateTime(timezone=True), server_default=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    duration_ms = Column(Integer, nullable=True)
+    error = Column(Text, nullable=True)
+
+    # Each scheduled slot of a job runs once, on whichever worker claims it first
+    __table_args__ = (
+        UniqueConstraint("job_name", "scheduled_for", name="uq_job_runs_job_slot"),
+    )
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, String, Date, DateTime, ForeignKey, Text, Enum
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Date, DateTime, ForeignKey, Text, Enum, Computed
+from sqlalchemy.dialects.postgresql import UUID, DATERANGE
 from sqlalchemy.orm import relationship
 import uuid
 from datetime import datetime
@@ -13,6 +13,12 @@ class LeaveStatus(str, enum.Enum):
     REJECTED = "rejected"
 
 
+# Exclusion constraint (user_id WITH =, period WITH &&) over pending and
+# approved leaves. It needs btree_gist, so only the add_leave_overlap_constraint
+# migration creates it, not create_all on startup.
+LEAVE_OVERLAP_CONSTRAINT = "ex_leaves_user_period"
+
+
 class Leave(Base):
     __tablename__ = "leaves"
 
@@ -20,6 +26,7 @@ class Leave(Base):
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     start_date = Column(Date, nullable=False)
     end_date = Column(Date, nullable=False)
+    period = Column(DATERANGE, Computed("daterange(start_date, end_date, '[]')", persisted=True))
     reason = Column(Text, nullable=True)
     status = Column(Enum(LeaveStatus), default=LeaveStatus.PENDING, nullable=False)
     approved_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
@@ -0,0 +1,78 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, Date, Numeric, Text, Boolean, Integer, Index, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+import uuid
+from app.database import Base
+
+
+class LeavePolicy(Base):
+    """How many leave days users on this policy accrue each month."""
+    __tablename__ = "leave_policies"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    name = Column(String(100), unique=True, nullable=False)
+    days_per_month = Column(Numeric(5, 2), nullable=False)
+    is_active = Column(Boolean, default=True)  # Inactive policies can no longer be assigned
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class LeaveBalance(Base):
+    """Current leave balance of a user, kept equal to the sum of their ledger entries."""
+    __tablename__ = "leave_balances"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    policy_id = Column(UUID(as_uuid=True), ForeignKey("leave_policies.id", ondelete="SET NULL"), nullable=True)
+    balance = Column(Numeric(7, 2), nullable=False, default=0)
+    accrued_through = Column(Date, nullable=True)  # First day of the last month accrued
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    policy = relationship("LeavePolicy")
+
+
+class LeaveLedgerEntry(Base):
+    """Append-only record of every change to a user's leave balance."""
+    __tablename__ = "leave_ledger"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    entry_type = Column(String(20), nullable=False)  # accrual, taken, restored, adjustment
+    days = Column(Numeric(7, 2), nullable=False)  # Positive adds to the balance
+    effective_date = Column(Date, nullable=False)
+    leave_id = Column(UUID(as_uuid=True), ForeignKey("leaves.id", ondelete="SET NULL"), nullable=True)
+    note = Column(Text, nullable=True)
+    created_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_leave_ledger_user_created", "user_id", "created_at"),
+        # One accrual per user and month, so catching up is safe to repeat
+        Index(
+            "uq_leave_ledger_accrual",
+            "user_id",
+            "effective_date",
+            unique=True,
+            postgresql_where=text("entry_type = 'accrual'")
+        ),
+    )
+
+
+class Holiday(Base):
+    __tablename__ = "holidays"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    date = Column(Date, unique=True, nullable=False)
+    name = Column(String(255), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class WorkingDay(Base):
+    """
+    Precomputed calendar: whether each day is a working day, and how many
+    working days there are from the start of the calendar through it.
+    """
+    __tablename__ = "working_days"
+
+    day = Column(Date, primary_key=True)
+    is_working = Column(Boolean, nullable=False)
+    working_day_number = Column(Integer, nullable=False)
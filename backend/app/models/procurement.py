@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Text, Boolean
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Text, Boolean, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -26,3 +26,8 @@ class ProcurementItem(Base):
 
     # Relationships
     requester = relationship("User", back_populates="procurement_requests")
+
+    # Keyset pagination of the procurement list, newest first within a status
+    __table_args__ = (
+        Index("ix_procurement_items_status_created_at_id", "status", created_at.desc(), id.desc()),
+    )
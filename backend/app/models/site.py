@@ -0,0 +1,19 @@
+from sqlalchemy import Column, String, DateTime, Numeric, Integer, Boolean, Time
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+from app.database import Base
+
+
+class Site(Base):
+    __tablename__ = "sites"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    name = Column(String(255), nullable=False)
+    latitude = Column(Numeric(10, 8), nullable=False)
+    longitude = Column(Numeric(11, 8), nullable=False)
+    radius_meters = Column(Integer, nullable=False, default=200)
+    is_active = Column(Boolean, default=True)  # Inactive sites no longer accept check-ins
+    closing_time = Column(Time, nullable=True)  # Local time forgotten check-outs are closed at; defaults to AUTO_CHECKOUT_CLOSING_TIME
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Date, Numeric, Text, Computed
+from sqlalchemy import Column, String, DateTime, ForeignKey, Date, Numeric, Text, Boolean, Computed, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -17,6 +17,7 @@ class Timesheet(Base):
     total_hours = Column(Numeric(4, 2), Computed("auto_hours + manual_hours"), nullable=True)
     notes = Column(Text, nullable=True)
     status = Column(String(20), default="pending")
+    needs_review = Column(Boolean, nullable=False, default=False, server_default="false")  # Hours come from an automatic check-out
     approved_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
     approved_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -28,5 +29,8 @@ class Timesheet(Base):
 
     # Unique constraint for user and date
     __table_args__ = (
+        UniqueConstraint("user_id", "date", name="uq_timesheets_user_date"),
+        # Covers the reconciliation report with index-only scans
+        Index("ix_timesheets_user_date_hours", "user_id", "date", postgresql_include=["total_hours", "status"]),
         {"schema": None},
     )
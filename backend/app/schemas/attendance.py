@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import AwareDatetime, BaseModel, Field
+from typing import Dict, List, Literal, Optional
 from datetime import datetime, date
 from uuid import UUID
 from decimal import Decimal
@@ -52,8 +52,67 @@ class AttendanceResponse(AttendanceBase):
     check_out_longitude: Optional[Decimal] = None
     check_in_address: Optional[str] = None
     check_out_address: Optional[str] = None
+    check_in_site_id: Optional[UUID] = None
+    check_out_site_id: Optional[UUID] = None
     status: str
+    auto_closed: bool = False
     created_at: datetime
 
     class Config:
         from_attributes = True
+
+
+# Offline sync schemas
+class AttendanceSyncEvent(BaseModel):
+    event_id: str = Field(..., min_length=1, max_length=64)
+    type: Literal["check_in", "check_out"]
+    occurred_at: AwareDatetime
+    latitude: float = Field(..., ge=-90, le=90)
+    longitude: float = Field(..., ge=-180, le=180)
+    address: Optional[str] = None
+    notes: Optional[str] = None
+
+
+class AttendanceSyncRequest(BaseModel):
+    events: List[AttendanceSyncEvent] = Field(..., min_length=1, max_length=200)
+
+
+class AttendanceSyncOutcome(BaseModel):
+    event_id: str
+    status: Literal["applied", "duplicate", "rejected"]
+    detail: Optional[str] = None
+    attendance_id: Optional[UUID] = None
+
+
+class AttendanceSyncResult(BaseModel):
+    applied: int
+    duplicate: int
+    rejected: int
+    results: List[AttendanceSyncOutcome]
+
+
+# Monthly rollup schemas
+class AttendanceMonthlyResponse(BaseModel):
+    user_id: UUID
+    full_name: str
+    year_month: str
+    present_days: int
+    late_days: int
+    auto_hours: Decimal
+    manual_hours: Decimal
+    approved_hours: Decimal
+
+
+# Team calendar schemas
+class AttendanceCalendarRow(BaseModel):
+    user_id: UUID
+    full_name: str
+    days: str  # One status character per day of the month
+
+
+class AttendanceCalendar(BaseModel):
+    month: str
+    start_date: date
+    days: int
+    legend: Dict[str, str]
+    users: List[AttendanceCalendarRow]
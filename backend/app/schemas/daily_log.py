@@ -53,3 +53,19 @@ class DailyLogResponse(DailyLogBase):
 
     class Config:
         from_attributes = True
+
+
+# Reconciliation report schemas
+class ReconciliationRow(BaseModel):
+    user_id: UUID
+    full_name: str
+    date: date
+    logged_hours: Decimal
+    log_entries: int
+    timesheet_hours: Optional[Decimal] = None
+    timesheet_status: Optional[str] = None
+    attendance_hours: Optional[Decimal] = None
+    difference: Decimal  # logged_hours - timesheet hours
+
+    class Config:
+        from_attributes = True
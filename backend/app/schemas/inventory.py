@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
@@ -112,3 +112,87 @@ class InventoryItemResponse(InventoryItemBase):
 
     class Config:
         from_attributes = True
+
+
+# Bulk import schemas
+class InventoryImportRowDiff(BaseModel):
+    row: int
+    name: str
+    sku: Optional[str] = None
+    category: Optional[str] = None
+    quantity: Optional[int] = None  # None when the row has no quantity
+    item_id: Optional[UUID] = None
+
+
+class InventoryImportError(BaseModel):
+    row: int
+    detail: str
+
+
+class InventoryImportSamples(BaseModel):
+    new: List[InventoryImportRowDiff] = []
+    updated: List[InventoryImportRowDiff] = []
+    duplicate: List[InventoryImportRowDiff] = []
+
+
+class InventoryImportResult(BaseModel):
+    dry_run: bool
+    job_id: Optional[UUID] = None
+    resumed_from_row: Optional[int] = None
+    total_rows: int
+    new: int
+    updated: int
+    duplicate: int
+    invalid: int
+    skipped: int = 0
+    new_categories: List[str] = []
+    samples: InventoryImportSamples
+    errors: List[InventoryImportError] = []
+
+
+# Duplicate detection and merge schemas
+class InventoryDuplicateItem(BaseModel):
+    id: UUID
+    name: str
+    sku: Optional[str] = None
+    category_id: Optional[UUID] = None
+    quantity: int
+    similarity: float
+
+
+class InventoryDuplicateGroup(BaseModel):
+    items: List[InventoryDuplicateItem]
+
+
+class InventoryMergeRequest(BaseModel):
+    target_id: UUID
+    source_ids: List[UUID]
+
+
+# Reorder forecast schemas
+class ReorderSuggestion(BaseModel):
+    item_id: UUID
+    name: str
+    supplier: Optional[str] = None
+    unit: Optional[str] = None
+    quantity: int
+    on_order: int
+    min_threshold: int
+    daily_usage: float
+    days_of_cover: Optional[float] = None
+    reorder_point: int
+    suggested_quantity: int
+    priority: str
+
+
+class ReorderSupplierGroup(BaseModel):
+    supplier: Optional[str] = None
+    total_quantity: int
+    items: List[ReorderSuggestion]
+
+
+class ReorderDraftRequest(BaseModel):
+    item_ids: Optional[List[UUID]] = None
+    window_days: int = Field(90, ge=7, le=730)
+    lead_time_days: int = Field(14, ge=1, le=365)
+    cover_days: int = Field(30, ge=1, le=365)
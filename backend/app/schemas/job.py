@@ -0,0 +1,24 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+from uuid import UUID
+
+
+class JobRunResponse(BaseModel):
+    id: UUID
+    job_name: str
+    scheduled_for: datetime
+    status: str
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    duration_ms: Optional[int] = None
+    error: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class JobResponse(BaseModel):
+    name: str
+    schedule: Optional[str] = None  # cron expression; None for one-off jobs
+    next_run_at: Optional[datetime] = None
@@ -1,7 +1,8 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import date, datetime
 from uuid import UUID
+from decimal import Decimal
 
 
 class LeaveBase(BaseModel):
@@ -48,3 +49,88 @@ class LeaveResponse(LeaveBase):
 
     class Config:
         from_attributes = True
+
+
+# Team availability schemas
+class LeaveAbsentee(BaseModel):
+    user_id: UUID
+    full_name: str
+    status: str
+
+
+class LeaveAvailabilityDay(BaseModel):
+    date: date
+    available: int
+    on_leave: int  # Approved leave
+    pending: int  # Leave awaiting approval
+    absentees: List[LeaveAbsentee]
+
+
+class LeaveAvailability(BaseModel):
+    start_date: date
+    end_date: date
+    headcount: int  # Active users
+    days: List[LeaveAvailabilityDay]
+
+
+# Leave balance schemas
+class LeavePolicyCreate(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100)
+    days_per_month: Decimal = Field(..., ge=0, le=31)
+
+
+class LeavePolicyResponse(LeavePolicyCreate):
+    id: UUID
+    is_active: bool
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class LeavePolicyAssign(BaseModel):
+    policy_id: Optional[UUID] = None  # None stops accrual
+
+
+class LeaveBalanceResponse(BaseModel):
+    user_id: UUID
+    full_name: str
+    policy_id: Optional[UUID] = None
+    policy_name: Optional[str] = None
+    balance: Decimal
+    accrued_through: Optional[date] = None
+    updated_at: Optional[datetime] = None
+
+
+class LeaveAdjustment(BaseModel):
+    days: Decimal = Field(..., ge=-365, le=365)  # Positive adds to the balance
+    effective_date: Optional[date] = None
+    note: str = Field(..., min_length=1)
+
+
+class LeaveLedgerEntryResponse(BaseModel):
+    id: UUID
+    user_id: UUID
+    entry_type: str
+    days: Decimal
+    effective_date: date
+    leave_id: Optional[UUID] = None
+    note: Optional[str] = None
+    created_by_id: Optional[UUID] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class HolidayCreate(BaseModel):
+    date: date
+    name: str = Field(..., min_length=1, max_length=255)
+
+
+class HolidayResponse(HolidayCreate):
+    id: UUID
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
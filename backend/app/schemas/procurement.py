@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
 
@@ -49,3 +49,46 @@ class ProcurementItemResponse(ProcurementItemBase):
 
     class Config:
         from_attributes = True
+
+
+# Bulk receive schemas
+class ProcurementReceiveRequest(BaseModel):
+    item_ids: List[UUID]
+    category_id: Optional[UUID] = None  # Category for newly created inventory items
+    min_threshold: Optional[int] = None  # Minimum stock level for newly created inventory items
+
+
+class ProcurementReceiveLine(BaseModel):
+    procurement_item_id: UUID
+    inventory_item_id: UUID
+    name: str
+    quantity_received: int
+    quantity_before: int
+    quantity_after: int
+    created: bool
+
+
+class ProcurementReceiveResult(BaseModel):
+    received: int
+    created: int
+    merged: int
+    already_received: List[UUID] = []
+    items: List[ProcurementReceiveLine] = []
+
+
+# Paginated listing schemas
+class ProcurementFacetCount(BaseModel):
+    value: Optional[str] = None
+    count: int
+
+
+class ProcurementFacets(BaseModel):
+    vendor: List[ProcurementFacetCount] = []
+    priority: List[ProcurementFacetCount] = []
+    status: List[ProcurementFacetCount] = []
+
+
+class ProcurementItemPage(BaseModel):
+    items: List[ProcurementItemResponse]
+    next_cursor: Optional[str] = None  # Pass as `cursor` to fetch the next page
+    facets: ProcurementFacets
@@ -0,0 +1,41 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from datetime import datetime, time
+from uuid import UUID
+from decimal import Decimal
+
+
+class SiteBase(BaseModel):
+    name: str
+    latitude: Decimal = Field(..., ge=-90, le=90)
+    longitude: Decimal = Field(..., ge=-180, le=180)
+    radius_meters: int = Field(200, gt=0, le=50000)
+    closing_time: Optional[time] = None
+
+
+class SiteCreate(SiteBase):
+    pass
+
+
+class SiteUpdate(BaseModel):
+    name: Optional[str] = None
+    latitude: Optional[Decimal] = Field(None, ge=-90, le=90)
+    longitude: Optional[Decimal] = Field(None, ge=-180, le=180)
+    radius_meters: Optional[int] = Field(None, gt=0, le=50000)
+    closing_time: Optional[time] = None
+    is_active: Optional[bool] = None
+
+
+class SiteResponse(SiteBase):
+    id: UUID
+    is_active: bool
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class SiteRevalidateResult(BaseModel):
+    checked: int
+    matched: int
+    unmatched: int
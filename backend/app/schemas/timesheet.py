@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
 from datetime import datetime, date
 from uuid import UUID
 from decimal import Decimal
@@ -37,6 +37,7 @@ class TimesheetResponse(TimesheetBase):
     manual_hours: Decimal
     total_hours: Optional[Decimal] = None
     status: str
+    needs_review: bool = False
     approved_by: Optional[UUID] = None
     approved_at: Optional[datetime] = None
     created_at: datetime
@@ -44,3 +45,63 @@ class TimesheetResponse(TimesheetBase):
 
     class Config:
         from_attributes = True
+
+
+# Bulk review schemas
+class TimesheetBulkApprove(BaseModel):
+    """Timesheets to review: explicit ids, or a filter on users, dates and status."""
+    ids: Optional[List[UUID]] = Field(None, max_length=1000)
+    user_ids: Optional[List[UUID]] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    status: Optional[str] = None
+
+
+class TimesheetBulkReject(TimesheetBulkApprove):
+    notes: Optional[str] = None
+
+
+class TimesheetBulkOutcome(BaseModel):
+    id: UUID
+    status: Literal["approved", "rejected", "skipped", "not_found"]
+    detail: Optional[str] = None
+
+
+class TimesheetBulkResult(BaseModel):
+    updated: int
+    skipped: int
+    not_found: int
+    results: List[TimesheetBulkOutcome]
+
+
+# Payroll summary schemas
+class TimesheetPeriodTotal(BaseModel):
+    user_id: UUID
+    full_name: str
+    email: str
+    period_start: date
+    days: int
+    auto_hours: Decimal
+    manual_hours: Decimal
+    total_hours: Decimal
+    approved_hours: Decimal
+    pending_hours: Decimal
+    rejected_hours: Decimal
+    needs_review: int
+
+    class Config:
+        from_attributes = True
+
+
+# Recompute schemas
+class TimesheetRecompute(BaseModel):
+    start_date: date
+    end_date: date
+    user_ids: Optional[List[UUID]] = None
+    force: bool = False  # Also recompute approved timesheets
+
+
+class TimesheetRecomputeResult(BaseModel):
+    inserted: int
+    updated: int
+    chunks: int
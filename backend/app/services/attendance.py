@@ -1,45 +1,152 @@
-from math import radians, cos, sin, asin, sqrt
+from datetime import date, datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import case, or_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
 from app.config import settings
+from app.core.cache import TTLCache
+from app.models.attendance import Attendance
+from app.models.site import Site
+from app.services.geofence import GeofenceIndex, GeofenceSite, SiteMatch
 
+# Sites change rarely; the geofence index is rebuilt at most this often
+SITE_CACHE_SECONDS = 300
 
-def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """
-    Calculate distance in meters between two GPS points using the Haversine formula.
+# Attendance rows re-validated per query and commit
+REVALIDATE_BATCH_SIZE = 5000
 
-    Args:
-        lat1: Latitude of first point
-        lon1: Longitude of first point
-        lat2: Latitude of second point
-        lon2: Longitude of second point
+_geofence_cache = TTLCache(SITE_CACHE_SECONDS)
 
-    Returns:
-        Distance in meters between the two points
-    """
-    R = 6371000  # Earth's radius in meters
 
-    # Convert to radians
-    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
+def _lab_site() -> GeofenceSite:
+    """The configured lab location, used while no sites have been set up."""
+    return GeofenceSite(None, "Lab", settings.LAB_LATITUDE, settings.LAB_LONGITUDE, settings.LAB_RADIUS_METERS)
+
 
-    # Haversine formula
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
+def load_geofence(db: Session) -> GeofenceIndex:
+    """Geofence index over the active sites, cached for SITE_CACHE_SECONDS."""
+    def build():
+        sites = [
+            GeofenceSite(site.id, site.name, float(site.latitude), float(site.longitude), site.radius_meters)
+            for site in db.query(Site).filter(Site.is_active == True)
+        ]
+        return GeofenceIndex(sites or [_lab_site()])
 
-    a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-    c = 2 * asin(sqrt(a))
+    return _geofence_cache.get_or_set("sites", build)
 
-    return R * c
 
+def invalidate_geofence() -> None:
+    _geofence_cache.clear()
 
-def validate_location(lat: float, lon: float) -> bool:
+
+def find_site(db: Session, lat: float, lon: float) -> Optional[SiteMatch]:
     """
-    Check if user is within the allowed radius of the lab location.
+    Find the nearest active site whose radius covers a GPS point.
 
     Args:
+        db: Database session
         lat: User's latitude
         lon: User's longitude
 
     Returns:
-        True if user is within allowed radius of lab, False otherwise
+        The matched site and distance, or None when the user is outside every site
+    """
+    return load_geofence(db).match(lat, lon)
+
+
+# Columns a check-in fills in on an attendance row that has none yet
+CHECK_IN_FIELDS = (
+    "check_in",
+    "check_in_latitude",
+    "check_in_longitude",
+    "check_in_address",
+    "check_in_site_id",
+    "check_in_idempotency_key",
+)
+
+
+def upsert_check_in(
+    db: Session,
+    user_id: UUID,
+    day: date,
+    check_in_values: Dict[str, Any],
+    idempotency_key: Optional[str] = None,
+) -> Optional[Attendance]:
     """
-    distance = haversine(lat, lon, settings.LAB_LATITUDE, settings.LAB_LONGITUDE)
-    return distance <= settings.LAB_RADIUS_METERS
+    Check a user in with a single INSERT ... ON CONFLICT ... RETURNING.
+
+    Creates the user's row for `day`, or fills in the check-in of a row
+    that exists without one. A retry carrying the idempotency key of the
+    original check-in gets the stored row back unchanged. Returns None when
+    the user has already checked in that day with a different or no key.
+    Nothing is committed here.
+    """
+    values = {"check_in": datetime.utcnow(), **check_in_values, "check_in_idempotency_key": idempotency_key}
+    insert = pg_insert(Attendance).values(user_id=user_id, date=day, status="present", **values)
+
+    # Existing check-ins are never overwritten, including by a matching retry
+    not_checked_in = Attendance.check_in.is_(None)
+    statement = insert.on_conflict_do_update(
+        index_elements=[Attendance.user_id, Attendance.date],
+        set_={
+            field: case((not_checked_in, insert.excluded[field]), else_=getattr(Attendance, field))
+            for field in CHECK_IN_FIELDS
+        },
+        where=or_(
+            not_checked_in,
+            Attendance.check_in_idempotency_key == insert.excluded.check_in_idempotency_key
+        )
+    ).returning(Attendance)
+
+    return db.scalars(statement, execution_options={"populate_existing": True}).first()
+
+
+def revalidate_attendance(db: Session, since: Optional[date] = None) -> Dict[str, int]:
+    """
+    Re-match stored check-in and check-out locations against the current sites.
+
+    Rows are read in primary key order REVALIDATE_BATCH_SIZE at a time,
+    matched through the geofence index and updated with one executemany per
+    batch, committing after each batch. `matched` counts rows whose
+    check-in falls within a site.
+    """
+    index = load_geofence(db)
+    checked = matched = 0
+    last_id = None
+
+    while True:
+        query = db.query(
+            Attendance.id,
+            Attendance.check_in_latitude,
+            Attendance.check_in_longitude,
+            Attendance.check_out_latitude,
+            Attendance.check_out_longitude,
+        ).filter(or_(Attendance.check_in_latitude != None, Attendance.check_out_latitude != None))
+        if since:
+            query = query.filter(Attendance.date >= since)
+        if last_id:
+            query = query.filter(Attendance.id > last_id)
+        rows = query.order_by(Attendance.id).limit(REVALIDATE_BATCH_SIZE).all()
+        if not rows:
+            break
+
+        values = []
+        for attendance_id, in_lat, in_lon, out_lat, out_lon in rows:
+            check_in_match = index.match(float(in_lat), float(in_lon)) if in_lat is not None and in_lon is not None else None
+            check_out_match = index.match(float(out_lat), float(out_lon)) if out_lat is not None and out_lon is not None else None
+            values.append({
+                "id": attendance_id,
+                "check_in_site_id": check_in_match.site.key if check_in_match else None,
+                "check_out_site_id": check_out_match.site.key if check_out_match else None,
+            })
+            checked += 1
+            matched += 1 if check_in_match else 0
+
+        db.execute(update(Attendance), values)
+        db.commit()
+        last_id = rows[-1][0]
+
+    return {"checked": checked, "matched": matched, "unmatched": checked - matched}
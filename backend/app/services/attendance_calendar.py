@@ -0,0 +1,76 @@
+from datetime import date
+from typing import Any, Dict
+
+from sqlalchemy import and_, case, exists, func, literal, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session
+
+from app.models.attendance import Attendance
+from app.models.leave import Leave, LeaveStatus
+from app.models.user import User
+from app.services.rollups import month_bounds
+
+# One character per day in a user's calendar string
+PRESENT = "P"
+ON_LEAVE = "L"
+ABSENT = "A"
+UPCOMING = "-"  # Today (until checked in) and later days
+
+LEGEND = {
+    PRESENT: "present",
+    ON_LEAVE: "on leave",
+    ABSENT: "absent",
+    UPCOMING: "upcoming",
+}
+
+
+def attendance_calendar(db: Session, month: str) -> Dict[str, Any]:
+    """
+    Build the team's user x day attendance matrix for month 'YYYY-MM'.
+
+    Active users are crossed with the days of the month from
+    generate_series and matched against attendance and approved leave in a
+    single query. Each user's month comes back as a string with one status
+    character per day, e.g. "PPPLLA-----".
+    """
+    start, end = month_bounds(month)
+    day_count = (end - start).days
+
+    offset = func.generate_series(0, day_count - 1).column_valued("day_offset")
+    days = select((literal(start) + offset).label("day")).subquery("days")
+
+    on_leave = exists().where(
+        Leave.user_id == User.id,
+        Leave.status == LeaveStatus.APPROVED,
+        Leave.period.contains(days.c.day)
+    )
+    code = case(
+        (Attendance.check_in != None, PRESENT),
+        (on_leave, ON_LEAVE),
+        (days.c.day >= date.today(), UPCOMING),
+        else_=ABSENT
+    )
+
+    rows = db.execute(
+        select(
+            User.id,
+            User.full_name,
+            func.string_agg(code, aggregate_order_by(literal_column("''"), days.c.day))
+        ).select_from(User).join(days, literal(True)).outerjoin(
+            Attendance,
+            and_(Attendance.user_id == User.id, Attendance.date == days.c.day)
+        ).where(
+            User.is_active == True
+        ).group_by(User.id, User.full_name).order_by(User.full_name)
+    ).all()
+
+    return {
+        "month": month,
+        "start_date": start,
+        "days": day_count,
+        "legend": LEGEND,
+        "users": [
+            {"user_id": user_id, "full_name": full_name, "days": statuses}
+            for user_id, full_name, statuses in rows
+        ],
+    }
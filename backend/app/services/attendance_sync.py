@@ -0,0 +1,145 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.models.attendance import Attendance, AttendanceSyncEvent
+from app.schemas.attendance import AttendanceSyncEvent as SyncEventData
+from app.services.attendance import find_site
+from app.services.rollups import month_key, refresh_monthly_rollup
+from app.services.timesheet import process_checkout
+
+# Device clocks may run this far ahead of the server
+MAX_CLOCK_SKEW = timedelta(minutes=5)
+
+# Queued events older than this are no longer accepted
+MAX_EVENT_AGE = timedelta(days=7)
+
+
+def sync_events(db: Session, user_id: UUID, events: Sequence[SyncEventData]) -> Dict[str, Any]:
+    """
+    Apply a batch of queued check-in/check-out events for one user.
+
+    Events are replayed in the order they happened. Each is checked for a
+    plausible timestamp, a matching site and a sensible sequence (check-out after a check-in on the same day). Event ids that
+    were applied before, by this or an earlier batch, are reported as
+    duplicates. The days involved are loaded and locked in one query and
+    all changes, including timesheets for check-outs and monthly rollups,
+    are flushed in the caller's transaction. Nothing is committed here.
+
+    Returns per-event outcomes in request order.
+    """
+    now = datetime.now(timezone.utc)
+
+    applied_events = {
+        event_id: attendance_id
+        for event_id, attendance_id in db.query(
+            AttendanceSyncEvent.event_id, AttendanceSyncEvent.attendance_id
+        ).filter(
+            AttendanceSyncEvent.user_id == user_id,
+            AttendanceSyncEvent.event_id.in_({event.event_id for event in events})
+        )
+    }
+
+    # Attendance dates follow the server's local day, like online check-ins
+    days = [event.occurred_at.astimezone().date() for event in events]
+    attendance_by_day = {
+        attendance.date: attendance
+        for attendance in db.query(Attendance).filter(
+            Attendance.user_id == user_id,
+            Attendance.date.in_(set(days))
+        ).with_for_update()
+    }
+
+    outcomes: Dict[int, Dict[str, Any]] = {}
+    checked_out: List[Attendance] = []
+
+    def outcome(index: int, status: str, detail: Optional[str] = None, attendance_id: Optional[UUID] = None):
+        outcomes[index] = {
+            "event_id": events[index].event_id,
+            "status": status,
+            "detail": detail,
+            "attendance_id": attendance_id,
+        }
+
+    replay_order = sorted(range(len(events)), key=lambda i: (events[i].occurred_at, events[i].type != "check_in"))
+    for index in replay_order:
+        event, day = events[index], days[index]
+
+        if event.event_id in applied_events:
+            outcome(index, "duplicate", attendance_id=applied_events[event.event_id])
+            continue
+        if event.occurred_at > now + MAX_CLOCK_SKEW:
+            outcome(index, "rejected", "Event time is in the future")
+            continue
+        if event.occurred_at < now - MAX_EVENT_AGE:
+            outcome(index, "rejected", "Event is too old to sync")
+            continue
+
+        match = find_site(db, event.latitude, event.longitude)
+        if not match:
+            outcome(index, "rejected", "Not within range of any office site")
+            continue
+
+        attendance = attendance_by_day.get(day)
+
+        if event.type == "check_in":
+            if attendance and attendance.check_in:
+                outcome(index, "rejected", "Already checked in on this day")
+                continue
+            if attendance is None:
+                attendance = Attendance(id=uuid.uuid4(), user_id=user_id, date=day, status="present")
+                db.add(attendance)
+                attendance_by_day[day] = attendance
+            attendance.check_in = event.occurred_at
+            attendance.check_in_latitude = event.latitude
+            attendance.check_in_longitude = event.longitude
+            attendance.check_in_address = event.address
+            attendance.check_in_site_id = match.site.key
+            attendance.check_in_idempotency_key = event.event_id
+        else:
+            if not attendance or not attendance.check_in:
+                outcome(index, "rejected", "No check-in on this day")
+                continue
+            if attendance.check_out:
+                outcome(index, "rejected", "Already checked out on this day")
+                continue
+            if event.occurred_at < attendance.check_in:
+                outcome(index, "rejected", "Check-out is before check-in")
+                continue
+            attendance.check_out = event.occurred_at
+            attendance.check_out_latitude = event.latitude
+            attendance.check_out_longitude = event.longitude
+            attendance.check_out_address = event.address
+            attendance.check_out_site_id = match.site.key
+            if event.notes:
+                attendance.notes = event.notes
+            checked_out.append(attendance)
+
+        db.add(AttendanceSyncEvent(
+            user_id=user_id,
+            event_id=event.event_id,
+            event_type=event.type,
+            occurred_at=event.occurred_at,
+            attendance_id=attendance.id
+        ))
+        applied_events[event.event_id] = attendance.id
+        outcome(index, "applied", attendance_id=attendance.id)
+
+    for attendance in checked_out:
+        process_checkout(attendance, db)
+
+    applied_days = {days[index] for index, result in outcomes.items() if result["status"] == "applied"}
+    for day in {month_key(day): day for day in applied_days}.values():
+        refresh_monthly_rollup(db, user_id, day)
+    db.flush()
+
+    results = [outcomes[index] for index in range(len(events))]
+    return {
+        "applied": sum(1 for result in results if result["status"] == "applied"),
+        "duplicate": sum(1 for result in results if result["status"] == "duplicate"),
+        "rejected": sum(1 for result in results if result["status"] == "rejected"),
+        "results": results,
+    }
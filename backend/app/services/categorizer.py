@@ -0,0 +1,161 @@
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Category rules shared by the inventory scripts and the bulk import API.
+# Lower priority numbers win when a name matches keywords from several
+# categories (e.g. "atmega" is both a development board and an MCU).
+CATEGORY_RULES: List[Tuple[int, str, Tuple[str, ...]]] = [
+    (10, 'Development Boards', (
+        'raspberry', 'arduino', 'esp32', 'esp8266', 'teensy',
+        'stm32', 'atmega', 'dev board', 'development board', 'nucleo'
+    )),
+    (20, 'Passive Components - Resistors', (
+        'resistor', ' ohm', 'kohm', 'mohm', 'res thick film'
+    )),
+    (30, 'Passive Components - Capacitors', (
+        'capacitor', 'cap ', ' µf', ' uf', ' pf', ' nf', 'ceramic capacitor'
+    )),
+    (40, 'Active Components - MOSFETs', (
+        'mosfet', 'mos fet', 'n-channel', 'p-channel'
+    )),
+    (50, 'Active Components - Transistors', (
+        'transistor', 'bjt', 'tip122', 'bc547', 'darlington'
+    )),
+    (60, 'Active Components - Diodes', (
+        'diode', 'photodiode', 'led', 'zener'
+    )),
+    (70, 'ICs - Operational Amplifiers', (
+        'op-amp', 'op amp', 'lm358', 'tl071', 'operational amplifier'
+    )),
+    (80, 'ICs - Microcontrollers', (
+        'atmega', 'pic16', 'pic18', 'microcontroller', 'mcu'
+    )),
+    (90, 'ICs - Logic ICs', (
+        'cd4017', 'cd4051', 'cd40106', '74hc', '74ls', 'counter',
+        'mux', 'multiplexer', 'schmitt trigger'
+    )),
+    (100, 'ICs - Voltage Regulators', (
+        'voltage regulator', 'lm334', 'lm234', 'ldo', '7805', 'az1084'
+    )),
+    (110, 'ICs - Special Function', (
+        'dds signal', 'ad9833', 'max4659', 'max4594', 'spdt', 'spst'
+    )),
+    (120, 'Modules - Sensors', (
+        'sensor', 'gyroscope', 'accelerometer', 'temperature sensor'
+    )),
+    (130, 'Modules - Communication', (
+        'wifi', 'bluetooth', 'rf module', 'nrf24', 'lora'
+    )),
+    (140, 'Modules - Relays & Switches', (
+        'relay', 'solid state relay', 'ssr-'
+    )),
+    (150, 'Modules - Motor Control', (
+        'servo', 'motor driver', 'stepper', 'motor'
+    )),
+    (160, 'Connectors & Terminals', (
+        'connector', 'terminal', 'header', 'jst', 'dupont', 'xh2.54'
+    )),
+    (170, 'Cables & Wires', (
+        'wire', 'cable', 'awg', 'wire wrap', 'jtag', 'isp'
+    )),
+    (180, 'Passive Components - Optocouplers', (
+        'optocoupler', 'pc817', 'opto'
+    )),
+    (190, 'Power Supplies & Adapters', (
+        'power supply', 'adapter', 'usb type-c'
+    )),
+    (200, 'Cooling & Thermal', (
+        'heat sink', 'heatsink', 'thermal', 'cooling'
+    )),
+]
+
+DEFAULT_CATEGORY = 'Uncategorized'
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Build a regex that matches any keyword, factored into a character trie."""
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # A keyword ends here, so the longer continuations are optional
+        return '(?:' + body + ')?' if '' in node else body
+
+    return build(trie)
+
+
+class CategoryMatcher:
+    """
+    Keyword categorizer compiled into a single regular expression.
+
+    All keywords are folded into one trie-shaped alternation, so each scan
+    of a lower-cased name is a single C-level regex search instead of a
+    Python loop over every keyword of every category. At any position the
+    regex returns the longest keyword, and every shorter keyword matching
+    there is a prefix of it, so each keyword is mapped to the best priority
+    among its keyword prefixes. Searching again from the next character
+    picks up overlapping keywords, which makes the result identical to
+    checking each category's keywords in priority order.
+    """
+
+    def __init__(self, rules: Iterable[Tuple[int, str, Iterable[str]]] = CATEGORY_RULES,
+                 default: str = DEFAULT_CATEGORY):
+        self.default = default
+
+        keywords: Dict[str, Tuple[int, str]] = {}
+        for priority, category, rule_keywords in rules:
+            for keyword in rule_keywords:
+                keyword = keyword.lower()
+                if keyword not in keywords or priority < keywords[keyword][0]:
+                    keywords[keyword] = (priority, category)
+
+        self._matches = {
+            keyword: min(keywords[other] for other in keywords if keyword.startswith(other))
+            for keyword in keywords
+        }
+        self._search = re.compile(_trie_pattern(keywords)).search if keywords else None
+        self._top_priority = min((p for p, _ in keywords.values()), default=None)
+
+    def categorize(self, name: Optional[str]) -> str:
+        """Return the category for a product name, or the default category."""
+        if not name or self._search is None:
+            return self.default
+
+        text = name.lower()
+        best = None
+        match = self._search(text)
+        while match:
+            found = self._matches[match.group()]
+            if best is None or found < best:
+                best = found
+                if found[0] == self._top_priority:
+                    break
+            match = self._search(text, match.start() + 1)
+
+        return best[1] if best else self.default
+
+    def categorize_many(self, names: Iterable[Optional[str]]) -> List[str]:
+        """Categorize a sequence of product names."""
+        return [self.categorize(name) for name in names]
+
+
+# Compiled once at import time and shared by all callers
+default_matcher = CategoryMatcher()
+
+
+def categorize(name: Optional[str]) -> str:
+    """Categorize a product name with the shared rule set."""
+    return default_matcher.categorize(name)
+
+
+def category_names() -> List[str]:
+    """All category names in priority order, followed by the default category."""
+    return [category for _, category, _ in sorted(CATEGORY_RULES)] + [DEFAULT_CATEGORY]
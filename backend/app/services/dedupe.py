@@ -0,0 +1,174 @@
+import random
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Optional, Tuple
+
+# Minimum Jaccard similarity of two names' token sets to call them duplicates
+DEFAULT_THRESHOLD = 0.7
+
+# MinHash signature length and LSH banding. With 8 bands of 3 rows, pairs at
+# the default threshold become candidates with ~96% probability and pairs at
+# 0.8 with ~99.7%.
+NUM_PERM = 24
+BANDS = 8
+ROWS_PER_BAND = NUM_PERM // BANDS
+
+# Blocks up to this size are compared pairwise; larger ones go through LSH
+SMALL_BLOCK_SIZE = 16
+
+# Cap on comparisons per item inside one LSH bucket, so a bucket of many
+# near-identical names stays linear
+MAX_BUCKET_COMPARISONS = 32
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(20240101)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(_MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+
+# Words that carry no identity ("10K Ohm" and "10k" are the same resistor)
+STOPWORDS = frozenset({
+    "a", "and", "the", "of", "for", "with", "in", "to", "pcs", "pc", "piece",
+    "pieces", "pack", "set", "ohm", "ohms", "r",
+})
+
+_WORD = re.compile(r"[a-z0-9.%+]+")
+# A value with an optional SI prefix and unit, e.g. 10k, 4.7uf, 5v, 100 ohm
+_VALUE = re.compile(r"^(\d+(?:\.\d+)?)([kmunp]?)(ohms?|r|f|v|a|w|hz|mah)?$")
+
+
+def tokenize(name: str) -> FrozenSet[str]:
+    """
+    Split a product name into normalized tokens.
+
+    Values are folded to a canonical spelling (10K Ohm, 10kΩ and 10k all
+    become "10k"), so the same part written in a different order or with a
+    different unit style yields the same token set.
+    """
+    text = name.lower().replace("ω", "ohm").replace("µ", "u").replace("μ", "u")
+    tokens = set()
+    for word in _WORD.findall(text):
+        word = word.strip(".")
+        if not word or word in STOPWORDS:
+            continue
+        value = _VALUE.match(word)
+        if value:
+            number, prefix, unit = value.groups()
+            # Resistance is usually written without a unit, so drop it
+            if unit and unit.startswith(("ohm", "r")):
+                unit = ""
+            word = number + prefix + (unit or "")
+        tokens.add(word)
+    return frozenset(tokens)
+
+
+def spec_key(tokens: FrozenSet[str]) -> FrozenSet[str]:
+    """Tokens containing digits: values, packages and part numbers."""
+    return frozenset(token for token in tokens if any(char.isdigit() for char in token))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def _token_hashes(token: str) -> Tuple[int, ...]:
+    h = zlib.crc32(token.encode())
+    return tuple((a * h + b) % _MERSENNE_PRIME for a, b in _PERMUTATIONS)
+
+
+def _minhash(tokens: FrozenSet[str], cache: Dict[str, Tuple[int, ...]]) -> Tuple[int, ...]:
+    """MinHash signature; per-token hashes are cached since names share most tokens."""
+    rows = []
+    for token in tokens or ("",):
+        hashes = cache.get(token)
+        if hashes is None:
+            hashes = cache[token] = _token_hashes(token)
+        rows.append(hashes)
+    return tuple(map(min, zip(*rows)))
+
+
+class _DisjointSet:
+    def __init__(self):
+        self.parent: Dict[int, int] = {}
+
+    def find(self, x: int) -> int:
+        root = x
+        while self.parent.get(root, root) != root:
+            root = self.parent[root]
+        while x != root:
+            self.parent[x], x = root, self.parent.get(x, x)
+        return root
+
+    def union(self, a: int, b: int) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            # Keep the earliest record as the root so groups stay in input order
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+
+def find_duplicate_groups(
+    records: Iterable[Tuple[Hashable, str, Optional[Hashable]]],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[List[Tuple[Hashable, float]]]:
+    """
+    Group near-duplicate names in roughly linear time.
+
+    `records` are (key, name, category) tuples. Records are first blocked on
+    category plus the digit-bearing tokens of the name, so "10k 0805" and
+    "1k 0805" never meet. Inside a block, small blocks are compared pairwise
+    and large ones only compare records that share a MinHash LSH bucket.
+    Candidate pairs are kept when their token Jaccard similarity reaches
+    `threshold`.
+
+    Returns groups of two or more records as (key, similarity to the first
+    record of the group), in input order.
+    """
+    keys: List[Hashable] = []
+    token_sets: List[FrozenSet[str]] = []
+    blocks: Dict[Tuple[Hashable, FrozenSet[str]], List[int]] = defaultdict(list)
+
+    for key, name, category in records:
+        tokens = tokenize(name or "")
+        index = len(keys)
+        keys.append(key)
+        token_sets.append(tokens)
+        blocks[(category, spec_key(tokens))].append(index)
+
+    clusters = _DisjointSet()
+    hash_cache: Dict[str, Tuple[int, ...]] = {}
+
+    def compare(i: int, j: int) -> None:
+        if clusters.find(i) != clusters.find(j) and jaccard(token_sets[i], token_sets[j]) >= threshold:
+            clusters.union(i, j)
+
+    for members in blocks.values():
+        if len(members) < 2:
+            continue
+        if len(members) <= SMALL_BLOCK_SIZE:
+            for position, i in enumerate(members):
+                for j in members[position + 1:]:
+                    compare(i, j)
+            continue
+
+        buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = defaultdict(list)
+        for i in members:
+            signature = _minhash(token_sets[i], hash_cache)
+            for band in range(BANDS):
+                bucket = buckets[(band, signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND])]
+                for j in bucket[-MAX_BUCKET_COMPARISONS:]:
+                    compare(j, i)
+                bucket.append(i)
+
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for index in range(len(keys)):
+        groups[clusters.find(index)].append(index)
+
+    return [
+        [(keys[i], round(jaccard(token_sets[members[0]], token_sets[i]), 3)) for i in members]
+        for _, members in sorted(groups.items())
+        if len(members) > 1
+    ]
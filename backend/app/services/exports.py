@@ -0,0 +1,60 @@
+import csv
+import io
+import tempfile
+from typing import Any, Collection, Iterable, Iterator, List, Tuple
+
+# Bytes handed to the response per chunk
+CHUNK_SIZE = 64 * 1024
+
+# (kind, cells): the kind lets a format style header, subtotal and total rows
+Row = Tuple[str, List[Any]]
+
+
+def stream_csv(rows: Iterable[Row]) -> Iterator[bytes]:
+    """Stream rows as UTF-8 CSV."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # Excel only detects UTF-8 in a CSV from the byte order mark
+    buffer.write("﻿")
+
+    for _, cells in rows:
+        writer.writerow(cells)
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue().encode()
+
+
+def stream_xlsx(rows: Iterable[Row], sheet_name: str, emphasized: Collection[str] = ()) -> Iterator[bytes]:
+    """
+    Stream rows as an XLSX workbook, with rows of the `emphasized` kinds in bold.
+
+    A zip archive can only be sent once it is complete, so the workbook is
+    written in openpyxl's write-only mode (rows go straight to disk) into a
+    temporary file that is then streamed back.
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_name)
+    bold = Font(bold=True)
+
+    for kind, cells in rows:
+        if kind in emphasized:
+            styled = []
+            for value in cells:
+                cell = WriteOnlyCell(sheet, value=value)
+                cell.font = bold
+                styled.append(cell)
+            cells = styled
+        sheet.append(cells)
+
+    with tempfile.TemporaryFile() as file:
+        workbook.save(file)
+        file.seek(0)
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            yield chunk
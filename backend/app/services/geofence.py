@@ -0,0 +1,108 @@
+import math
+from collections import defaultdict
+from math import radians, cos, sin, asin, sqrt
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+EARTH_RADIUS_METERS = 6371000
+
+# Smallest grid cell, so a set of tiny sites does not produce a huge grid
+MIN_CELL_DEGREES = 0.001
+
+# Sites are indexed into every cell their bounding box touches; the box is
+# padded slightly since a circle on a sphere is not quite an ellipse in degrees
+BOUNDING_BOX_MARGIN = 1.01
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Calculate distance in meters between two GPS points using the Haversine formula.
+
+    Args:
+        lat1: Latitude of first point
+        lon1: Longitude of first point
+        lat2: Latitude of second point
+        lon2: Longitude of second point
+
+    Returns:
+        Distance in meters between the two points
+    """
+    R = EARTH_RADIUS_METERS
+
+    # Convert to radians
+    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
+
+    # Haversine formula
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+
+    a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
+    c = 2 * asin(sqrt(a))
+
+    return R * c
+
+
+class GeofenceSite(NamedTuple):
+    key: Any
+    name: str
+    latitude: float
+    longitude: float
+    radius_meters: float
+
+
+class SiteMatch(NamedTuple):
+    site: GeofenceSite
+    distance_meters: float
+
+
+class GeofenceIndex:
+    """
+    Nearest-site lookup over a fixed grid.
+
+    The grid cell is at least as large as the biggest site radius, and each
+    site is listed under every cell its bounding box overlaps. A point is
+    therefore only ever compared against the few sites listed in its own
+    cell, however many sites there are.
+    """
+
+    def __init__(self, sites: Iterable[GeofenceSite]):
+        self.sites = list(sites)
+        largest = max((site.radius_meters for site in self.sites), default=0)
+        self.cell_degrees = max(self._span_degrees(largest), MIN_CELL_DEGREES)
+        self.cells: Dict[Tuple[int, int], List[GeofenceSite]] = defaultdict(list)
+
+        for site in self.sites:
+            lat_span = self._span_degrees(site.radius_meters) * BOUNDING_BOX_MARGIN
+            lon_span = lat_span / max(cos(radians(site.latitude)), 1e-6)
+            for row in range(self._cell(site.latitude - lat_span), self._cell(site.latitude + lat_span) + 1):
+                for col in range(self._cell(site.longitude - lon_span), self._cell(site.longitude + lon_span) + 1):
+                    self.cells[(row, col)].append(site)
+
+    @staticmethod
+    def _span_degrees(meters: float) -> float:
+        return math.degrees(meters / EARTH_RADIUS_METERS)
+
+    def _cell(self, degrees: float) -> int:
+        return math.floor(degrees / self.cell_degrees)
+
+    def match(self, lat: float, lon: float) -> Optional[SiteMatch]:
+        """Return the nearest site whose radius covers the point, or None."""
+        best = None
+        for site in self.cells.get((self._cell(lat), self._cell(lon)), ()):
+            distance = haversine(lat, lon, site.latitude, site.longitude)
+            if distance <= site.radius_meters and (best is None or distance < best.distance_meters):
+                best = SiteMatch(site, distance)
+        return best
+
+    def match_many(self, points: Iterable[Tuple[float, float]]) -> List[Optional[SiteMatch]]:
+        """Match a batch of (lat, lon) points."""
+        match = self.match
+        return [match(lat, lon) for lat, lon in points]
+
+    def match_scan(self, lat: float, lon: float) -> Optional[SiteMatch]:
+        """Reference lookup that measures the distance to every site."""
+        best = None
+        for site in self.sites:
+            distance = haversine(lat, lon, site.latitude, site.longitude)
+            if distance <= site.radius_meters and (best is None or distance < best.distance_meters):
+                best = SiteMatch(site, distance)
+        return best
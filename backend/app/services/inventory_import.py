@@ -0,0 +1,400 @@
+import csv
+import io
+import re
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import String, func, insert, literal, select, union_all, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+
+from app.models.inventory import InventoryCategory, InventoryItem, InventoryTransaction, normalized_name
+from app.services.categorizer import categorize
+from app.services.import_jobs import ImportJobTracker, applied_row_hashes, row_hash
+from app.services.tabular_reader import Record, TabularFileError, TabularReader
+
+# Rows are validated, matched and written in batches of this size so memory
+# stays bounded no matter how large the uploaded file is.
+IMPORT_BATCH_SIZE = 1000
+
+# Number of example rows kept per diff bucket and number of row errors reported
+MAX_SAMPLES = 20
+MAX_ERRORS = 100
+
+# Accepted header spellings for each inventory field (compared lower-cased)
+COLUMN_ALIASES = {
+    "name": ("name", "product name", "component name", "item", "item name", "description/value", "particulars"),
+    "sku": ("sku", "part_number", "part number"),
+    "category": ("category",),
+    "quantity": ("quantity", "qty"),
+    "unit": ("unit",),
+    "unit_price": ("unit_price", "unit price", "price"),
+    "supplier": ("supplier",),
+    "location": ("location",),
+    "min_threshold": ("min_threshold", "min_stock_level", "min stock"),
+    "description": ("description", "specifications"),
+    "notes": ("notes", "vendor/notes"),
+}
+
+# Columns written with COPY for new items; the rest use server defaults
+COPY_COLUMNS = (
+    "id", "name", "description", "category_id", "sku", "quantity", "unit",
+    "location", "min_threshold", "unit_price", "supplier", "notes",
+)
+
+# Values new items get for fields the file leaves empty
+NEW_ITEM_DEFAULTS = {"quantity": 0, "unit": "pcs", "min_threshold": 0}
+
+# Fields compared against an existing item to decide between "updated" and "duplicate"
+COMPARED_FIELDS = ("category_id", "quantity", "unit", "unit_price", "supplier", "location", "min_threshold")
+
+
+# Currency symbols, thousands separators and the "/-" suffix used in quotations
+_NUMBER_NOISE = re.compile(r"[₹,\s]|/-|^rs\.?", re.IGNORECASE)
+
+
+# Raised when an uploaded file cannot be read as an inventory sheet
+ImportFileError = TabularFileError
+
+
+def normalize_name(name: str) -> str:
+    """
+    Lower-case a name and collapse whitespace so it can be used as a match
+    key. normalized_name is the same normalization in SQL.
+    """
+    return " ".join(name.lower().split())
+
+
+def _unnest(values: List[str]):
+    """
+    Select the values of a single array parameter as rows.
+
+    IN (SELECT unnest(...)) is planned as a semi-join that can use an index,
+    unlike a long IN list, which degrades to a linear scan per row.
+    """
+    return select(func.unnest(literal(values, ARRAY(String))))
+
+
+def match_existing_items(
+    db: Session, skus: List[str], names: List[str], for_update: bool = False
+) -> Tuple[Dict[str, InventoryItem], Dict[str, InventoryItem]]:
+    """
+    Find inventory items by SKU or normalized name in a single query.
+
+    Returns the matches keyed by SKU and by normalized name.
+    """
+    query = db.query(InventoryItem).filter(
+        InventoryItem.id.in_(union_all(
+            select(InventoryItem.id).where(InventoryItem.sku.in_(_unnest(list(set(skus))))),
+            select(InventoryItem.id).where(
+                normalized_name(InventoryItem.name).in_(_unnest(list({normalize_name(name) for name in names})))
+            ),
+        ))
+    )
+    if for_update:
+        query = query.order_by(InventoryItem.id).with_for_update()
+
+    existing = query.all()
+    by_sku = {item.sku: item for item in existing if item.sku}
+    by_name = {normalize_name(item.name): item for item in existing}
+    return by_sku, by_name
+
+
+def _parse_number(value: Any) -> Optional[Decimal]:
+    """Parse spreadsheet numbers such as '1,200', '250/-' or '₹ 45.50'."""
+    if value is None:
+        return None
+    text = str(value).strip()
+    if not text:
+        return None
+    try:
+        number = Decimal(text)
+    except InvalidOperation:
+        text = _NUMBER_NOISE.sub("", text)
+        if not text:
+            return None
+        try:
+            number = Decimal(text)
+        except InvalidOperation:
+            raise ValueError(f"'{value}' is not a number")
+
+    if not number.is_finite():
+        raise ValueError(f"'{value}' is not a number")
+    return number
+
+
+def _clean_text(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def inventory_reader(file: Any, filename: Optional[str] = None) -> TabularReader:
+    """Stream inventory records from a CSV or XLSX file, locating the header row."""
+    return TabularReader(file, filename, COLUMN_ALIASES, required=("name",))
+
+
+def parse_row(values: Record) -> Dict[str, Any]:
+    """
+    Validate one record and convert it into inventory item fields.
+
+    Fields the file leaves empty are None, so they never overwrite an
+    existing item; new items get NEW_ITEM_DEFAULTS for them instead.
+    """
+    name = _clean_text(values.get("name"))
+    if not name:
+        raise ValueError("Name is required")
+    if len(name) > 255:
+        raise ValueError("Name is longer than 255 characters")
+
+    quantity = _parse_number(values.get("quantity"))
+    if quantity is not None and quantity < 0:
+        raise ValueError("Quantity cannot be negative")
+
+    min_threshold = _parse_number(values.get("min_threshold"))
+    if min_threshold is not None and min_threshold < 0:
+        raise ValueError("Minimum threshold cannot be negative")
+
+    unit_price = _parse_number(values.get("unit_price"))
+
+    return {
+        "name": name,
+        "sku": _clean_text(values.get("sku")),
+        "category": _clean_text(values.get("category")),
+        "quantity": int(quantity) if quantity is not None else None,
+        "unit": _clean_text(values.get("unit")),
+        "unit_price": round(unit_price, 2) if unit_price is not None else None,
+        "supplier": _clean_text(values.get("supplier")),
+        "location": _clean_text(values.get("location")),
+        "min_threshold": int(min_threshold) if min_threshold is not None else None,
+        "description": _clean_text(values.get("description")),
+        "notes": _clean_text(values.get("notes")),
+    }
+
+
+class InventoryImport:
+    """
+    Bulk inventory import from a streamed spreadsheet.
+
+    Each batch of rows is matched against existing items (by SKU, then by
+    normalized name) with a single query and written with multi-row
+    INSERT/UPDATE statements.
+
+    With a `source`, rows whose content hash was already applied for that
+    source are skipped. With a `job` tracker each batch is committed as a
+    checkpoint and a re-run resumes after the last committed batch;
+    without one nothing is committed here and the caller commits once at
+    the end, or skips the writes entirely for a dry run.
+    """
+
+    def __init__(self, db: Session, user_id: UUID, dry_run: bool = True,
+                 source: Optional[str] = None, job: Optional[ImportJobTracker] = None):
+        self.db = db
+        self.user_id = user_id
+        self.dry_run = dry_run
+        self.source = source
+        self.job = job
+        self.resume_row = job.resume_row if job else 0
+
+        self.counts = {"total_rows": 0, "new": 0, "updated": 0, "duplicate": 0, "invalid": 0, "skipped": 0}
+        self.samples = {"new": [], "updated": [], "duplicate": []}
+        self.errors = []
+        self.new_categories = []
+        self._seen_keys = set()
+
+        self._categories = {
+            normalize_name(category.name): category.id
+            for category in db.query(InventoryCategory).all()
+        }
+
+    def run(self, reader: TabularReader) -> Dict[str, Any]:
+        """Consume records batch by batch and return the import diff."""
+        for records in reader.batches(IMPORT_BATCH_SIZE):
+            batch = []
+            skipped = 0
+            for row_number, values in records:
+                self.counts["total_rows"] += 1
+                # Already covered by a committed batch of the job being resumed
+                if row_number <= self.resume_row:
+                    skipped += 1
+                    continue
+                try:
+                    batch.append((row_number, parse_row(values)))
+                except ValueError as e:
+                    self._record_error(row_number, str(e))
+
+            hashes = []
+            if self.source and batch:
+                hashed = [(row_hash(data), (row_number, data)) for row_number, data in batch]
+                applied = applied_row_hashes(self.db, self.source, [h for h, _ in hashed])
+                batch = [row for h, row in hashed if h not in applied]
+                hashes = [h for h, _ in hashed if h not in applied]
+                skipped += len(hashed) - len(batch)
+
+            if batch:
+                self._process_batch(batch)
+
+            self.counts["skipped"] += skipped
+            if self.job and not self.dry_run:
+                self.job.checkpoint(records[-1][0], hashes, applied=len(batch), skipped=skipped)
+
+        return {
+            "dry_run": self.dry_run,
+            "job_id": self.job.job_id if self.job else None,
+            "resumed_from_row": self.resume_row or None,
+            **self.counts,
+            "new_categories": self.new_categories,
+            "samples": self.samples,
+            "errors": self.errors,
+        }
+
+    def _record_error(self, row_number: int, detail: str) -> None:
+        self.counts["invalid"] += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append({"row": row_number, "detail": detail})
+
+    def _record(self, kind: str, row_number: int, data: Dict[str, Any], item_id: Optional[UUID] = None) -> None:
+        self.counts[kind] += 1
+        if len(self.samples[kind]) < MAX_SAMPLES:
+            self.samples[kind].append({
+                "row": row_number,
+                "name": data["name"],
+                "sku": data["sku"],
+                "category": data["category"],
+                "quantity": data["quantity"],
+                "item_id": item_id,
+            })
+
+    def _category_id(self, name: Optional[str]) -> Optional[UUID]:
+        """Resolve a category name, creating it if it doesn't exist yet."""
+        if not name:
+            return None
+
+        key = normalize_name(name)
+        if key not in self._categories:
+            category_id = uuid4()
+            if not self.dry_run:
+                self.db.execute(insert(InventoryCategory), [{"id": category_id, "name": name}])
+            self._categories[key] = category_id
+            self.new_categories.append(name)
+
+        return self._categories[key]
+
+    def _process_batch(self, batch: List[Tuple[int, Dict[str, Any]]]) -> None:
+        # Drop rows repeated earlier in the same file (first occurrence wins)
+        unique_rows = []
+        for row_number, data in batch:
+            # Matched like existing items: by SKU (exactly, as in the database
+            # lookup and unique constraint), then by normalized name
+            keys = [("name", normalize_name(data["name"]))]
+            if data["sku"]:
+                keys.insert(0, ("sku", data["sku"]))
+            if any(key in self._seen_keys for key in keys):
+                self._record("duplicate", row_number, data)
+                continue
+            self._seen_keys.update(keys)
+            unique_rows.append((row_number, data))
+
+        if not unique_rows:
+            return
+
+        # One round trip to find every existing item this batch refers to
+        by_sku, by_name = match_existing_items(
+            self.db,
+            [data["sku"] for _, data in unique_rows if data["sku"]],
+            [data["name"] for _, data in unique_rows],
+        )
+
+        new_items = []
+        item_updates = []
+        transactions = []
+
+        for row_number, data in unique_rows:
+            match = by_sku.get(data["sku"]) if data["sku"] else None
+            if match is None:
+                match = by_name.get(normalize_name(data["name"]))
+
+            # Only new items are auto-categorized; existing items keep their
+            # category unless the file names one explicitly
+            if match is None and not data["category"]:
+                data["category"] = categorize(data["name"])
+            category_id = self._category_id(data["category"])
+
+            values = {
+                "name": data["name"],
+                "description": data["description"],
+                "category_id": category_id,
+                "sku": data["sku"],
+                "quantity": data["quantity"],
+                "unit": data["unit"],
+                "location": data["location"],
+                "min_threshold": data["min_threshold"],
+                "unit_price": data["unit_price"],
+                "supplier": data["supplier"],
+                "notes": data["notes"],
+            }
+
+            if match is None:
+                for field, default in NEW_ITEM_DEFAULTS.items():
+                    if values[field] is None:
+                        values[field] = default
+                values["id"] = uuid4()
+                new_items.append(values)
+                self._record("new", row_number, data, values["id"])
+                continue
+
+            changes = {
+                field: values[field]
+                for field in COMPARED_FIELDS
+                if values[field] is not None and values[field] != getattr(match, field)
+            }
+            if not changes:
+                self._record("duplicate", row_number, data, match.id)
+                continue
+
+            if "quantity" in changes:
+                quantity_change = values["quantity"] - match.quantity
+                transactions.append({
+                    "item_id": match.id,
+                    "user_id": self.user_id,
+                    "action": "stock_in" if quantity_change > 0 else "stock_out",
+                    "quantity_change": quantity_change,
+                    "quantity_before": match.quantity,
+                    "quantity_after": values["quantity"],
+                    "reason": "Bulk import",
+                })
+            item_updates.append({"id": match.id, **changes})
+            self._record("updated", row_number, data, match.id)
+
+        if self.dry_run:
+            return
+
+        if new_items:
+            self._copy_items(new_items)
+        if item_updates:
+            self.db.execute(update(InventoryItem), item_updates)
+        if transactions:
+            self.db.execute(insert(InventoryTransaction), transactions)
+
+    def _copy_items(self, items: List[Dict[str, Any]]) -> None:
+        """Load new items with COPY on the session's own connection and transaction."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for item in items:
+            writer.writerow([
+                "\\N" if item[column] is None else item[column]
+                for column in COPY_COLUMNS
+            ])
+        buffer.seek(0)
+
+        cursor = self.db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {InventoryItem.__tablename__} ({', '.join(COPY_COLUMNS)}) "
+                "FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                buffer,
+            )
+        finally:
+            cursor.close()
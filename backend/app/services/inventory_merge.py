@@ -0,0 +1,99 @@
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, update
+from sqlalchemy.orm import Session
+
+from app.models.inventory import InventoryItem, InventoryTransaction
+from app.services.dedupe import DEFAULT_THRESHOLD, find_duplicate_groups
+
+
+def find_inventory_duplicates(
+    db: Session,
+    threshold: float = DEFAULT_THRESHOLD,
+    category_id: Optional[UUID] = None,
+) -> List[List[Tuple[InventoryItem, float]]]:
+    """Find groups of likely duplicate inventory items within each category."""
+    query = db.query(InventoryItem.id, InventoryItem.name, InventoryItem.category_id)
+    if category_id:
+        query = query.filter(InventoryItem.category_id == category_id)
+
+    groups = find_duplicate_groups(query.yield_per(5000), threshold)
+    if not groups:
+        return []
+
+    ids = [item_id for group in groups for item_id, _ in group]
+    items = {item.id: item for item in db.query(InventoryItem).filter(InventoryItem.id.in_(ids))}
+    return [[(items[item_id], similarity) for item_id, similarity in group] for group in groups]
+
+
+# Fields copied from a merged item when the target has no value of its own
+MERGE_FILL_FIELDS = ("description", "category_id", "sku", "location", "unit_price", "supplier", "notes")
+
+
+class MergeError(ValueError):
+    """Raised when a merge request is inconsistent."""
+
+
+def merge_items(db: Session, target_id: UUID, source_ids: List[UUID]) -> InventoryItem:
+    """
+    Merge duplicate items into one.
+
+    The source items' transactions are re-pointed at the target with a single
+    UPDATE and their quantities are added to the target. The moved history
+    already accounts for that stock, so no extra transaction is written.
+    Empty target fields are filled from the sources and the sources are
+    deleted. Nothing is committed here.
+    """
+    source_ids = list(dict.fromkeys(source_ids))
+    if not source_ids:
+        raise MergeError("At least one item to merge is required")
+    if target_id in source_ids:
+        raise MergeError("An item cannot be merged into itself")
+
+    items = {
+        item.id: item
+        for item in db.query(InventoryItem)
+        .filter(InventoryItem.id.in_([target_id, *source_ids]))
+        .order_by(InventoryItem.id)
+        .with_for_update()
+    }
+    missing = [str(item_id) for item_id in [target_id, *source_ids] if item_id not in items]
+    if missing:
+        raise LookupError(f"Inventory items not found: {', '.join(missing)}")
+
+    target = items[target_id]
+    sources = [items[item_id] for item_id in source_ids]
+
+    filled = {}
+    for field in MERGE_FILL_FIELDS:
+        if getattr(target, field) is None:
+            value = next((getattr(s, field) for s in sources if getattr(s, field) is not None), None)
+            if value is not None:
+                filled[field] = value
+    merged_quantity = sum(source.quantity for source in sources)
+
+    db.execute(
+        update(InventoryTransaction)
+        .where(InventoryTransaction.item_id.in_(source_ids))
+        .values(item_id=target_id)
+        .execution_options(synchronize_session=False)
+    )
+    # Delete the sources before copying their fields so a moved SKU
+    # doesn't collide with the unique constraint
+    db.execute(
+        delete(InventoryItem)
+        .where(InventoryItem.id.in_(source_ids))
+        .execution_options(synchronize_session=False)
+    )
+    for source in sources:
+        db.expunge(source)
+
+    target.quantity += merged_quantity
+
+    for field, value in filled.items():
+        setattr(target, field, value)
+
+    db.flush()
+    db.expire(target, ["transactions"])
+    return target
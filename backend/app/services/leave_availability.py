@@ -0,0 +1,91 @@
+from datetime import date, timedelta
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.models.leave import Leave, LeaveStatus
+from app.models.user import User
+
+# Entries are keyed by a version of the leave and user data, so a change
+# made through any worker is seen at once; this only bounds memory
+AVAILABILITY_CACHE_SECONDS = 60
+
+# Longest window one availability request may cover
+MAX_AVAILABILITY_DAYS = 366
+
+_availability_cache = TTLCache(AVAILABILITY_CACHE_SECONDS)
+
+
+def team_availability(db: Session, start: date, end: date) -> Dict[str, Any]:
+    """
+    Per-day headcount, availability and absentees for start..end inclusive,
+    cached per window until leave or users change.
+
+    Approved and pending leave of active users count as out; pending leave
+    is reported separately so planners can tell the two apart.
+    """
+    key = (start, end, _data_version(db))
+    return _availability_cache.get_or_set(key, lambda: _compute_availability(db, start, end))
+
+
+def _data_version(db: Session) -> Tuple[Any, ...]:
+    """
+    Changes whenever a leave or user is created, changed or deleted, in any
+    worker process: the row counts catch deletes, the latest updated_at
+    everything else.
+    """
+    return tuple(db.execute(select(
+        select(func.count(Leave.id)).scalar_subquery(),
+        select(func.max(Leave.updated_at)).scalar_subquery(),
+        select(func.count(User.id)).scalar_subquery(),
+        select(func.max(User.updated_at)).scalar_subquery(),
+    )).one())
+
+
+def _compute_availability(db: Session, start: date, end: date) -> Dict[str, Any]:
+    headcount = db.query(func.count(User.id)).filter(User.is_active == True).scalar()
+
+    # Overlap with the window is answered by the GiST index behind the
+    # leave overlap constraint, which covers exactly these statuses
+    leaves = db.query(
+        Leave.user_id, User.full_name, Leave.status, Leave.start_date, Leave.end_date
+    ).join(User, User.id == Leave.user_id).filter(
+        User.is_active == True,
+        Leave.status.in_([LeaveStatus.PENDING, LeaveStatus.APPROVED]),
+        Leave.period.overlaps(func.daterange(start, end, "[]"))
+    ).all()
+
+    # Sweep the window once: each leave, clipped to the window, adds its
+    # user on its first day and removes them the day after its last
+    starts: Dict[date, List[Any]] = {}
+    ends: Dict[date, List[Any]] = {}
+    for leave in leaves:
+        starts.setdefault(max(leave.start_date, start), []).append(leave)
+        ends.setdefault(min(leave.end_date, end) + timedelta(days=1), []).append(leave)
+
+    out: Dict[Any, Any] = {}
+    days = []
+    day = start
+    while day <= end:
+        for leave in ends.get(day, ()):
+            out.pop((leave.user_id, leave.start_date), None)
+        for leave in starts.get(day, ()):
+            out[(leave.user_id, leave.start_date)] = leave
+
+        absentees = sorted(out.values(), key=lambda leave: leave.full_name)
+        pending = sum(1 for leave in absentees if leave.status == LeaveStatus.PENDING)
+        days.append({
+            "date": day,
+            "available": headcount - len(absentees),
+            "on_leave": len(absentees) - pending,
+            "pending": pending,
+            "absentees": [
+                {"user_id": leave.user_id, "full_name": leave.full_name, "status": leave.status.value}
+                for leave in absentees
+            ],
+        })
+        day += timedelta(days=1)
+
+    return {"start_date": start, "end_date": end, "headcount": headcount, "days": days}
@@ -0,0 +1,212 @@
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import Date, DateTime, and_, case, cast, exists, extract, func, literal, literal_column, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.leave import Leave
+from app.models.leave_balance import Holiday, LeaveBalance, LeaveLedgerEntry, LeavePolicy, WorkingDay
+
+# Ledger entry types
+ACCRUAL = "accrual"
+TAKEN = "taken"
+RESTORED = "restored"
+ADJUSTMENT = "adjustment"
+
+
+def _weekend_days() -> List[int]:
+    """ISO weekdays (Monday = 1) that are never working days."""
+    return [int(day) for day in settings.WEEKEND_DAYS.split(",") if day.strip()]
+
+
+def build_working_calendar(db: Session, start: date, end: date) -> None:
+    """
+    (Re)compute the working-day calendar over start..end, widened to
+    include every day already in it so the running numbers stay continuous.
+
+    One INSERT ... SELECT over generate_series marks weekends and holidays
+    as non-working and numbers the working days with a running sum.
+    """
+    first, last = db.query(func.min(WorkingDay.day), func.max(WorkingDay.day)).one()
+    start = min(start, first) if first else start
+    end = max(end, last) if last else end
+
+    series = select(
+        cast(func.generate_series(
+            cast(start, DateTime), cast(end, DateTime), literal_column("interval '1 day'")
+        ), Date).label("day")
+    ).subquery("series")
+    is_working = and_(
+        extract("isodow", series.c.day).notin_(_weekend_days()),
+        ~exists().where(Holiday.date == series.c.day)
+    )
+
+    insert_stmt = pg_insert(WorkingDay).from_select(
+        ["day", "is_working", "working_day_number"],
+        select(
+            series.c.day,
+            is_working,
+            func.sum(case((is_working, 1), else_=0)).over(order_by=series.c.day)
+        )
+    )
+    db.execute(insert_stmt.on_conflict_do_update(
+        index_elements=[WorkingDay.day],
+        set_={
+            "is_working": insert_stmt.excluded.is_working,
+            "working_day_number": insert_stmt.excluded.working_day_number,
+        }
+    ))
+
+
+def ensure_working_calendar(db: Session, start: date, end: date) -> None:
+    """Extend the calendar to whole years around start..end if it does not cover them."""
+    covered = db.query(func.count()).filter(WorkingDay.day.in_({start, end})).scalar()
+    if covered < len({start, end}):
+        build_working_calendar(db, date(start.year, 1, 1), date(end.year, 12, 31))
+
+
+def rebuild_working_calendar(db: Session) -> None:
+    """Recompute the whole calendar, e.g. after holidays change."""
+    today = date.today()
+    build_working_calendar(db, date(today.year, 1, 1), date(today.year, 12, 31))
+
+
+def working_days(db: Session, start: date, end: date) -> int:
+    """Working days in start..end inclusive, from two calendar lookups."""
+    ensure_working_calendar(db, start, end)
+    days = {
+        row.day: row
+        for row in db.query(WorkingDay).filter(WorkingDay.day.in_({start, end}))
+    }
+    return days[end].working_day_number - days[start].working_day_number + int(days[start].is_working)
+
+
+def record_entry(
+    db: Session,
+    user_id: UUID,
+    entry_type: str,
+    days: Decimal,
+    effective_date: date,
+    leave_id: Optional[UUID] = None,
+    note: Optional[str] = None,
+    created_by_id: Optional[UUID] = None,
+) -> Decimal:
+    """
+    Append a ledger entry and apply it to the user's balance row, in the
+    caller's transaction. Returns the new balance.
+    """
+    db.add(LeaveLedgerEntry(
+        user_id=user_id,
+        entry_type=entry_type,
+        days=days,
+        effective_date=effective_date,
+        leave_id=leave_id,
+        note=note,
+        created_by_id=created_by_id
+    ))
+
+    upsert = pg_insert(LeaveBalance).values(user_id=user_id, balance=days)
+    return db.execute(upsert.on_conflict_do_update(
+        index_elements=[LeaveBalance.user_id],
+        set_={"balance": LeaveBalance.balance + upsert.excluded.balance, "updated_at": func.now()}
+    ).returning(LeaveBalance.balance)).scalar()
+
+
+def _leave_note(leave: Leave) -> str:
+    return f"Leave {leave.start_date} to {leave.end_date}"
+
+
+def debit_approved_leave(db: Session, leave: Leave, approver_id: UUID) -> Decimal:
+    """Take the working days of an approved leave off the user's balance."""
+    days = working_days(db, leave.start_date, leave.end_date)
+    return record_entry(
+        db, leave.user_id, TAKEN, -Decimal(days), leave.start_date,
+        leave_id=leave.id, note=_leave_note(leave), created_by_id=approver_id
+    )
+
+
+def restore_deleted_leave(db: Session, leave: Leave, deleted_by_id: UUID) -> Optional[Decimal]:
+    """
+    Give back whatever a leave took from the balance, before it is deleted.
+    Returns the new balance, or None when the leave had taken nothing.
+    """
+    taken = db.query(func.sum(LeaveLedgerEntry.days)).filter(LeaveLedgerEntry.leave_id == leave.id).scalar()
+    if not taken:
+        return None
+    return record_entry(
+        db, leave.user_id, RESTORED, -taken, leave.start_date,
+        leave_id=leave.id, note=_leave_note(leave), created_by_id=deleted_by_id
+    )
+
+
+def accrue_leave(db: Session, through: date, user_ids: Optional[List[UUID]] = None) -> int:
+    """
+    Credit every month up to and including the month of `through` that
+    users on a policy have not been credited for yet.
+
+    One statement inserts the missing monthly accrual entries from
+    generate_series and adds them to the balance rows, so users who were
+    missed for a while catch up in a single run. Accruals are unique per
+    user and month, which makes overlapping runs harmless. Returns the
+    number of balances credited; nothing is committed here.
+    """
+    this_month = through.replace(day=1)
+    behind = and_(
+        LeaveBalance.policy_id != None,
+        or_(LeaveBalance.accrued_through == None, LeaveBalance.accrued_through < this_month)
+    )
+    if user_ids:
+        behind = and_(behind, LeaveBalance.user_id.in_(user_ids))
+
+    first_month = func.coalesce(
+        cast(LeaveBalance.accrued_through, DateTime) + literal_column("interval '1 month'"),
+        cast(this_month, DateTime)
+    )
+    months = select(
+        func.gen_random_uuid(),
+        LeaveBalance.user_id,
+        literal(ACCRUAL),
+        LeavePolicy.days_per_month,
+        cast(func.generate_series(
+            first_month, cast(this_month, DateTime), literal_column("interval '1 month'")
+        ), Date),
+        LeavePolicy.name
+    ).join(LeavePolicy, LeavePolicy.id == LeaveBalance.policy_id).where(behind)
+
+    accrued = pg_insert(LeaveLedgerEntry).from_select(
+        ["id", "user_id", "entry_type", "days", "effective_date", "note"], months
+    ).on_conflict_do_nothing(
+        index_elements=[LeaveLedgerEntry.user_id, LeaveLedgerEntry.effective_date],
+        index_where=LeaveLedgerEntry.entry_type == ACCRUAL
+    ).returning(LeaveLedgerEntry.user_id, LeaveLedgerEntry.days).cte("accrued")
+
+    credited = select(func.coalesce(func.sum(accrued.c.days), 0)).where(
+        accrued.c.user_id == LeaveBalance.user_id
+    ).scalar_subquery()
+
+    result = db.execute(
+        update(LeaveBalance).where(behind).values(
+            balance=LeaveBalance.balance + credited,
+            accrued_through=this_month,
+            updated_at=func.now()
+        ).add_cte(accrued).execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def assign_policy(db: Session, user_id: UUID, policy_id: Optional[UUID]) -> None:
+    """
+    Put a user on an accrual policy (or none) and credit the current month
+    right away if they have not had it yet.
+    """
+    upsert = pg_insert(LeaveBalance).values(user_id=user_id, policy_id=policy_id, balance=0)
+    db.execute(upsert.on_conflict_do_update(
+        index_elements=[LeaveBalance.user_id],
+        set_={"policy_id": upsert.excluded.policy_id, "updated_at": func.now()}
+    ))
+    if policy_id:
+        accrue_leave(db, date.today(), [user_id])
@@ -0,0 +1,121 @@
+from datetime import datetime
+from typing import Iterator, List, Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.models.procurement import ProcurementItem
+from app.models.user import User
+from app.services.exports import Row, stream_csv, stream_xlsx
+
+# Rows fetched per round trip from the server-side cursor
+FETCH_SIZE = 500
+
+COLUMNS = ["S.No", "Item", "Vendor", "Quantity", "Priority", "Link", "Requested By", "Requested On", "Notes"]
+
+# Row kinds that are written in bold in the workbook
+_EMPHASIZED = {"header", "vendor", "subtotal", "total"}
+
+
+class NonGemExport:
+    """
+    Vendor-grouped Non-Gem document built from a server-side cursor.
+
+    Items are read FETCH_SIZE at a time in vendor order and written out as
+    they arrive: a title row per vendor, its items, and a subtotal row, then
+    a grand total. With `mark_completed`, the exported items are stamped
+    `non_gem_completed_at` and committed once the last row has been written,
+    in the same transaction that read them; an export that fails or is
+    abandoned marks nothing.
+    """
+
+    def __init__(self, db: Session, vendor: Optional[str] = None, mark_completed: bool = False):
+        self.db = db
+        self.vendor = vendor
+        self.mark_completed = mark_completed
+        self.exported_ids: List[UUID] = []
+
+    def _query(self):
+        query = self.db.query(
+            ProcurementItem.id,
+            ProcurementItem.name,
+            ProcurementItem.vendor,
+            ProcurementItem.quantity,
+            ProcurementItem.priority,
+            ProcurementItem.link,
+            ProcurementItem.notes,
+            ProcurementItem.created_at,
+            User.full_name,
+        ).outerjoin(User, ProcurementItem.requested_by == User.id).filter(
+            ProcurementItem.is_non_gem == True,
+            ProcurementItem.status == "pending",
+            ProcurementItem.non_gem_completed_at == None
+        )
+
+        if self.vendor:
+            query = query.filter(ProcurementItem.vendor == self.vendor)
+
+        return query.order_by(
+            ProcurementItem.vendor, ProcurementItem.created_at.desc(), ProcurementItem.id
+        ).execution_options(yield_per=FETCH_SIZE)
+
+    def rows(self) -> Iterator[Row]:
+        """Yield (kind, cells) for every row of the document."""
+        yield "header", list(COLUMNS)
+
+        current_vendor = None
+        vendor_lines = vendor_quantity = 0
+        total_lines = total_quantity = 0
+
+        def subtotal():
+            return "subtotal", ["", f"Subtotal: {current_vendor} ({vendor_lines} items)", "", vendor_quantity]
+
+        for row in self._query():
+            if row.vendor != current_vendor:
+                if current_vendor is not None:
+                    yield subtotal()
+                    yield "blank", []
+                current_vendor = row.vendor
+                vendor_lines = vendor_quantity = 0
+                yield "vendor", [f"Vendor: {row.vendor}"]
+
+            vendor_lines += 1
+            vendor_quantity += row.quantity
+            total_lines += 1
+            total_quantity += row.quantity
+            self.exported_ids.append(row.id)
+
+            yield "item", [
+                vendor_lines,
+                row.name,
+                row.vendor,
+                row.quantity,
+                row.priority,
+                row.link or "",
+                row.full_name or "",
+                row.created_at.date() if row.created_at else "",
+                row.notes or "",
+            ]
+
+        if current_vendor is not None:
+            yield subtotal()
+            yield "blank", []
+        yield "total", ["", f"Total ({total_lines} items)", "", total_quantity]
+
+        if self.mark_completed:
+            self._mark_completed()
+
+    def _mark_completed(self) -> None:
+        if self.exported_ids:
+            self.db.query(ProcurementItem).filter(
+                ProcurementItem.id.in_(self.exported_ids)
+            ).update({ProcurementItem.non_gem_completed_at: datetime.utcnow()}, synchronize_session=False)
+        self.db.commit()
+
+    def csv(self) -> Iterator[bytes]:
+        """Stream the document as UTF-8 CSV."""
+        return stream_csv(self.rows())
+
+    def xlsx(self) -> Iterator[bytes]:
+        """Stream the document as an XLSX workbook."""
+        return stream_xlsx(self.rows(), "Non-Gem", _EMPHASIZED)
@@ -0,0 +1,120 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Iterator, List, Optional
+from uuid import UUID
+
+from sqlalchemy import Date, cast, func
+from sqlalchemy.orm import Session
+
+from app.models.timesheet import Timesheet
+from app.models.user import User
+from app.services.exports import Row, stream_csv, stream_xlsx
+
+PERIODS = ("week", "month")
+
+# Rows fetched per round trip from the server-side cursor
+FETCH_SIZE = 1000
+
+COLUMNS = [
+    "Employee", "Email", "Period Start", "Days", "Auto Hours", "Manual Hours", "Total Hours",
+    "Approved Hours", "Pending Hours", "Rejected Hours", "Needs Review",
+]
+
+# Row kinds that are written in bold in the workbook
+_EMPHASIZED = {"header", "total"}
+
+
+def period_totals_query(
+    db: Session,
+    period: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    user_ids: Optional[List[UUID]] = None,
+):
+    """
+    Per-user totals of timesheet hours for each week (starting Monday) or
+    month, with hours split by approval status, computed with
+    GROUP BY user, date_trunc(period, date).
+    """
+    if period not in PERIODS:
+        raise ValueError(f"Unknown period: {period!r}")
+
+    period_start = cast(func.date_trunc(period, Timesheet.date), Date).label("period_start")
+
+    def hours_with_status(value):
+        return func.coalesce(func.sum(Timesheet.total_hours).filter(Timesheet.status == value), 0)
+
+    query = db.query(
+        Timesheet.user_id,
+        User.full_name,
+        User.email,
+        period_start,
+        func.count().label("days"),
+        func.coalesce(func.sum(Timesheet.auto_hours), 0).label("auto_hours"),
+        func.coalesce(func.sum(Timesheet.manual_hours), 0).label("manual_hours"),
+        func.coalesce(func.sum(Timesheet.total_hours), 0).label("total_hours"),
+        hours_with_status("approved").label("approved_hours"),
+        hours_with_status("pending").label("pending_hours"),
+        hours_with_status("rejected").label("rejected_hours"),
+        func.count().filter(Timesheet.needs_review == True).label("needs_review"),
+    ).join(User, User.id == Timesheet.user_id)
+
+    if start_date:
+        query = query.filter(Timesheet.date >= start_date)
+    if end_date:
+        query = query.filter(Timesheet.date <= end_date)
+    if user_ids:
+        query = query.filter(Timesheet.user_id.in_(user_ids))
+
+    return query.group_by(
+        Timesheet.user_id, User.full_name, User.email, period_start
+    ).order_by(User.full_name, Timesheet.user_id, period_start)
+
+
+class PayrollExport:
+    """
+    Per-user period totals for payroll, streamed from a server-side cursor.
+
+    The totals come from a single SELECT read FETCH_SIZE rows at a time, so
+    memory stays flat however long the range. Postgres runs that statement
+    against one snapshot, which makes every row reflect the approvals as
+    they stood when the export started, even while reviews continue.
+    """
+
+    def __init__(self, db: Session, period: str, start_date: Optional[date] = None,
+                 end_date: Optional[date] = None, user_ids: Optional[List[UUID]] = None):
+        self.db = db
+        self.query = period_totals_query(db, period, start_date, end_date, user_ids)
+
+    def rows(self) -> Iterator[Row]:
+        """Yield (kind, cells) for every row of the document."""
+        yield "info", [f"Exported at {datetime.utcnow():%Y-%m-%d %H:%M} UTC"]
+        yield "header", list(COLUMNS)
+
+        total_hours = approved_hours = Decimal(0)
+        for row in self.query.execution_options(yield_per=FETCH_SIZE):
+            total_hours += row.total_hours
+            approved_hours += row.approved_hours
+            yield "item", [
+                row.full_name,
+                row.email,
+                row.period_start,
+                row.days,
+                row.auto_hours,
+                row.manual_hours,
+                row.total_hours,
+                row.approved_hours,
+                row.pending_hours,
+                row.rejected_hours,
+                row.needs_review,
+            ]
+
+        yield "total", ["Total", "", "", "", "", "", total_hours, approved_hours]
+
+    def csv(self) -> Iterator[bytes]:
+        """Stream the document as UTF-8 CSV."""
+        return stream_csv(self.rows())
+
+    def xlsx(self) -> Iterator[bytes]:
+        """Stream the document as an XLSX workbook."""
+        return stream_xlsx(self.rows(), "Payroll", _EMPHASIZED)
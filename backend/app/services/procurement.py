@@ -0,0 +1,203 @@
+import base64
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.permissions import is_manager_or_admin
+from app.models.inventory import InventoryCategory, InventoryItem, InventoryTransaction
+from app.models.procurement import ProcurementItem
+from app.models.user import User
+from app.services.categorizer import categorize
+from app.services.inventory_import import match_existing_items, normalize_name
+
+
+# Facet counts are shared by every procurement page load for this long
+FACET_CACHE_SECONDS = 30
+
+_facet_cache = TTLCache(FACET_CACHE_SECONDS)
+
+
+def encode_cursor(item: ProcurementItem) -> str:
+    """Opaque keyset cursor for the (created_at, id) position of an item."""
+    return base64.urlsafe_b64encode(f"{item.created_at.isoformat()}|{item.id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Inverse of encode_cursor; raises ValueError for malformed cursors."""
+    try:
+        created_at, item_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(item_id)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor")
+
+
+def procurement_facets(db: Session, status: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Item counts by vendor, priority and status, cached for FACET_CACHE_SECONDS.
+
+    Vendor and priority counts cover items with the given status (all items
+    when None); status counts always cover every item.
+    """
+    return _facet_cache.get_or_set(status, lambda: _compute_facets(db, status))
+
+
+def invalidate_procurement_facets() -> None:
+    _facet_cache.clear()
+
+
+def _compute_facets(db: Session, status: Optional[str]) -> Dict[str, List[Dict[str, Any]]]:
+    # One pass over the table: GROUPING SETS yields the vendor, priority and
+    # status groups together and grouping() tells them apart
+    in_scope = func.count().filter(ProcurementItem.status == status) if status else func.count()
+    rows = db.query(
+        ProcurementItem.vendor,
+        ProcurementItem.priority,
+        ProcurementItem.status,
+        func.grouping(ProcurementItem.vendor),
+        func.grouping(ProcurementItem.priority),
+        func.count(),
+        in_scope,
+    ).group_by(
+        func.grouping_sets(ProcurementItem.vendor, ProcurementItem.priority, ProcurementItem.status)
+    ).all()
+
+    facets = {"vendor": [], "priority": [], "status": []}
+    for vendor, priority, item_status, vendor_grouped, priority_grouped, total, scoped in rows:
+        if vendor_grouped == 0:
+            facet, value, count = "vendor", vendor, scoped
+        elif priority_grouped == 0:
+            facet, value, count = "priority", priority, scoped
+        else:
+            facet, value, count = "status", item_status, total
+        if count:
+            facets[facet].append({"value": value, "count": count})
+
+    for values in facets.values():
+        values.sort(key=lambda entry: (-entry["count"], entry["value"] or ""))
+    return facets
+
+
+class ReceivePermissionError(PermissionError):
+    """Raised when the user may not receive one of the requested items."""
+
+
+def receive_items(
+    db: Session,
+    item_ids: List[UUID],
+    user: User,
+    category_id: Optional[UUID] = None,
+    min_threshold: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Receive procurement items into inventory.
+
+    Every item is matched to an existing inventory item by SKU or normalized
+    name with one query and stocked in with a ledger entry. A new inventory
+    item is created only when nothing matches; it goes into `category_id`,
+    or an auto-detected category when none is given. Items already received
+    are reported and left alone. Nothing is committed here.
+    """
+    item_ids = list(dict.fromkeys(item_ids))
+    items = (
+        db.query(ProcurementItem)
+        .filter(ProcurementItem.id.in_(item_ids))
+        .order_by(ProcurementItem.id)
+        .with_for_update()
+        .all()
+    )
+    by_id = {item.id: item for item in items}
+    missing = [str(item_id) for item_id in item_ids if item_id not in by_id]
+    if missing:
+        raise LookupError(f"Procurement items not found: {', '.join(missing)}")
+
+    # Requester, manager, or admin can mark items as received
+    if not is_manager_or_admin(user):
+        foreign = [item for item in items if item.requested_by != user.id]
+        if foreign:
+            raise ReceivePermissionError(
+                "Only the requester, managers, or admins can mark items as received"
+            )
+
+    pending = [by_id[item_id] for item_id in item_ids if by_id[item_id].status != "received"]
+    already_received = [item_id for item_id in item_ids if by_id[item_id].status == "received"]
+
+    # Procurement lines carry no SKU, but names are often part numbers
+    by_sku, by_name = match_existing_items(
+        db, [item.name for item in pending], [item.name for item in pending], for_update=True
+    )
+
+    categories = None
+    lines = []
+    now = datetime.utcnow()
+
+    for item in pending:
+        inventory_item = by_sku.get(item.name) or by_name.get(normalize_name(item.name))
+        created = inventory_item is None
+
+        if created:
+            if category_id is None and categories is None:
+                categories = {normalize_name(c.name): c for c in db.query(InventoryCategory).all()}
+            inventory_item = InventoryItem(
+                name=item.name,
+                category_id=category_id or _auto_category(db, categories, item.name),
+                quantity=0,
+                unit="pcs",
+                min_threshold=min_threshold if min_threshold is not None else 0,
+                supplier=item.vendor,
+                notes=f"Added from procurement. Vendor: {item.vendor}"
+            )
+            db.add(inventory_item)
+            db.flush()
+            # Later lines of the same delivery stock into the new item
+            by_name[normalize_name(item.name)] = inventory_item
+
+        quantity_before = inventory_item.quantity
+        inventory_item.quantity = quantity_before + item.quantity
+        db.add(InventoryTransaction(
+            item_id=inventory_item.id,
+            user_id=user.id,
+            action="stock_in",
+            quantity_change=item.quantity,
+            quantity_before=quantity_before,
+            quantity_after=inventory_item.quantity,
+            reason=f"Received from procurement. Vendor: {item.vendor}"
+        ))
+
+        item.status = "received"
+        item.received_at = now
+
+        lines.append({
+            "procurement_item_id": item.id,
+            "inventory_item_id": inventory_item.id,
+            "name": inventory_item.name,
+            "quantity_received": item.quantity,
+            "quantity_before": quantity_before,
+            "quantity_after": inventory_item.quantity,
+            "created": created,
+        })
+
+    db.flush()
+
+    return {
+        "received": len(lines),
+        "created": sum(1 for line in lines if line["created"]),
+        "merged": sum(1 for line in lines if not line["created"]),
+        "already_received": already_received,
+        "items": lines,
+    }
+
+
+def _auto_category(db: Session, categories: Dict[str, InventoryCategory], name: str) -> UUID:
+    """Resolve the auto-detected category for a name, creating it if needed."""
+    category_name = categorize(name)
+    key = normalize_name(category_name)
+    if key not in categories:
+        category = InventoryCategory(name=category_name)
+        db.add(category)
+        db.flush()
+        categories[key] = category
+    return categories[key].id
@@ -0,0 +1,208 @@
+import math
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.inventory import InventoryItem, InventoryTransaction
+from app.models.procurement import ProcurementItem
+from app.services.inventory_import import normalize_name
+
+# Days of stock-outs the consumption rate is averaged over
+DEFAULT_WINDOW_DAYS = 90
+
+# Expected days between raising a request and the stock arriving
+DEFAULT_LEAD_TIME_DAYS = 14
+
+# Days of consumption an order should cover once it arrives
+DEFAULT_COVER_DAYS = 30
+
+# Safety stock covers demand up to this many standard deviations above the
+# mean over the lead time (~95% service level)
+SERVICE_LEVEL_Z = 1.65
+
+# Items younger than this are averaged over this many days, so a single
+# stock-out the day after an item is added does not look like a huge rate
+MIN_OBSERVED_DAYS = 7
+
+# ProcurementItem.vendor is shorter than InventoryItem.supplier
+VENDOR_MAX_LENGTH = 100
+
+
+def _usage_by_item(db: Session, since: datetime):
+    """Per-item totals of daily stock-out quantities and their squares since `since`."""
+    day = func.date_trunc("day", InventoryTransaction.created_at)
+    daily = db.query(
+        InventoryTransaction.item_id.label("item_id"),
+        (-func.sum(InventoryTransaction.quantity_change)).label("used"),
+    ).filter(
+        InventoryTransaction.action == "stock_out",
+        InventoryTransaction.created_at >= since
+    ).group_by(InventoryTransaction.item_id, day).subquery()
+
+    return db.query(
+        daily.c.item_id,
+        func.sum(daily.c.used).label("used"),
+        func.sum(daily.c.used * daily.c.used).label("used_squared"),
+    ).group_by(daily.c.item_id).subquery()
+
+
+def _on_order(db: Session) -> Dict[str, int]:
+    """Quantities already requested in pending procurement items, by normalized name."""
+    pending = defaultdict(int)
+    rows = db.query(ProcurementItem.name, func.sum(ProcurementItem.quantity)).filter(
+        ProcurementItem.status == "pending"
+    ).group_by(ProcurementItem.name)
+    for name, quantity in rows:
+        pending[normalize_name(name)] += quantity
+    return pending
+
+
+def reorder_suggestions(
+    db: Session,
+    window_days: int = DEFAULT_WINDOW_DAYS,
+    lead_time_days: int = DEFAULT_LEAD_TIME_DAYS,
+    cover_days: int = DEFAULT_COVER_DAYS,
+    item_ids: Optional[List[UUID]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Forecast which items need reordering from their stock-out history.
+
+    The ledger is reduced to per-item daily usage in a single aggregate
+    query. For each item the mean daily usage and its standard deviation
+    over the window give a reorder point of lead-time demand plus safety
+    stock (never below `min_threshold`). Items whose stock plus quantities
+    already on pending procurement requests is at or below that point are
+    suggested, with enough to last `lead_time_days + cover_days`.
+
+    Suggestions are sorted by days of cover, most urgent first.
+    """
+    now = datetime.now(timezone.utc)
+    since = now - timedelta(days=window_days)
+    usage = _usage_by_item(db, since)
+
+    query = db.query(
+        InventoryItem.id,
+        InventoryItem.name,
+        InventoryItem.supplier,
+        InventoryItem.unit,
+        InventoryItem.quantity,
+        InventoryItem.min_threshold,
+        InventoryItem.created_at,
+        func.coalesce(usage.c.used, 0),
+        func.coalesce(usage.c.used_squared, 0),
+    ).outerjoin(usage, usage.c.item_id == InventoryItem.id)
+
+    if item_ids is not None:
+        query = query.filter(InventoryItem.id.in_(item_ids))
+
+    on_order = _on_order(db)
+    suggestions = []
+
+    for item_id, name, supplier, unit, quantity, min_threshold, created_at, used, used_squared in query.yield_per(5000):
+        min_threshold = min_threshold or 0
+        observed_from = max(created_at or since, since)
+        days = max((now - observed_from).days, MIN_OBSERVED_DAYS)
+
+        rate = float(used) / days
+        variance = max(float(used_squared) / days - rate * rate, 0.0)
+        safety_stock = SERVICE_LEVEL_Z * math.sqrt(variance * lead_time_days)
+        reorder_point = max(math.ceil(rate * lead_time_days + safety_stock), min_threshold)
+
+        pending = on_order.get(normalize_name(name), 0)
+        position = quantity + pending
+        if position > reorder_point or (rate == 0 and quantity >= min_threshold):
+            continue
+
+        target = max(math.ceil(rate * (lead_time_days + cover_days) + safety_stock), min_threshold)
+        suggested = target - position
+        if suggested <= 0:
+            continue
+
+        days_of_cover = quantity / rate if rate else None
+        suggestions.append({
+            "item_id": item_id,
+            "name": name,
+            "supplier": supplier,
+            "unit": unit,
+            "quantity": quantity,
+            "on_order": pending,
+            "min_threshold": min_threshold,
+            "daily_usage": round(rate, 3),
+            "days_of_cover": round(days_of_cover, 1) if days_of_cover is not None else None,
+            "reorder_point": reorder_point,
+            "suggested_quantity": suggested,
+            "priority": _priority(days_of_cover, lead_time_days),
+        })
+
+    suggestions.sort(key=lambda s: (s["days_of_cover"] is None, s["days_of_cover"] or 0, s["name"]))
+    return suggestions
+
+
+def _priority(days_of_cover: Optional[float], lead_time_days: int) -> str:
+    """Stock that runs out well before an order can arrive is urgent."""
+    if days_of_cover is None:
+        return "medium"
+    if days_of_cover <= lead_time_days / 2:
+        return "urgent"
+    if days_of_cover <= lead_time_days:
+        return "high"
+    return "medium"
+
+
+def group_by_supplier(suggestions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Group suggestions by supplier, keeping the most urgent supplier first."""
+    groups: Dict[Optional[str], List[Dict[str, Any]]] = {}
+    for suggestion in suggestions:
+        groups.setdefault(suggestion["supplier"], []).append(suggestion)
+
+    return [
+        {
+            "supplier": supplier,
+            "total_quantity": sum(s["suggested_quantity"] for s in items),
+            "items": items,
+        }
+        for supplier, items in groups.items()
+    ]
+
+
+def draft_procurement_items(
+    db: Session,
+    suggestions: List[Dict[str, Any]],
+    user_id: UUID,
+) -> List[ProcurementItem]:
+    """
+    Create pending procurement requests for reorder suggestions.
+
+    Requests are added supplier by supplier; items without a supplier go
+    under "Other". Drafted quantities count as on order, so running the
+    forecast again does not draft the same items twice. Nothing is
+    committed here.
+    """
+    drafted = []
+    for group in group_by_supplier(suggestions):
+        vendor = (group["supplier"] or "Other")[:VENDOR_MAX_LENGTH]
+        for suggestion in group["items"]:
+            cover = suggestion["days_of_cover"]
+            notes = (
+                f"Drafted from reorder forecast: {suggestion['daily_usage']} {suggestion['unit'] or 'pcs'}/day, "
+                f"{suggestion['quantity']} in stock"
+                + (f", {cover} days of cover" if cover is not None else "")
+            )
+            item = ProcurementItem(
+                name=suggestion["name"],
+                vendor=vendor,
+                quantity=suggestion["suggested_quantity"],
+                priority=suggestion["priority"],
+                notes=notes,
+                requested_by=user_id,
+                status="pending"
+            )
+            db.add(item)
+            drafted.append(item)
+
+    db.flush()
+    return drafted
@@ -0,0 +1,84 @@
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import Numeric, and_, cast, extract, func, or_, select
+from sqlalchemy.orm import Session
+
+from app.models.attendance import Attendance
+from app.models.daily_log import DailyLog
+from app.models.project import ProjectMember
+from app.models.timesheet import Timesheet
+from app.models.user import User
+
+
+def reconciliation_query(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    tolerance: Decimal,
+    project_id: Optional[UUID] = None,
+    user_id: Optional[UUID] = None,
+):
+    """
+    Days where hours logged in daily logs and timesheet hours disagree by
+    more than `tolerance`, in one query.
+
+    Daily-log hours are summed per (user, date) and full-outer-joined to
+    timesheets, so days with only logs or only a timesheet show up too;
+    attendance hours are joined alongside for context. Every table is read
+    through a covering (user_id, date) index. Optionally limited to the
+    members of a project or to one user.
+    """
+    def scoped(model):
+        conditions = [model.date >= start_date, model.date <= end_date]
+        if user_id:
+            conditions.append(model.user_id == user_id)
+        if project_id:
+            conditions.append(model.user_id.in_(
+                select(ProjectMember.user_id).where(ProjectMember.project_id == project_id)
+            ))
+        return conditions
+
+    logs = select(
+        DailyLog.user_id,
+        DailyLog.date,
+        func.coalesce(func.sum(DailyLog.hours_spent), 0).label("logged_hours"),
+        func.count().label("log_entries"),
+    ).where(*scoped(DailyLog)).group_by(DailyLog.user_id, DailyLog.date).subquery("logs")
+
+    timesheets = select(
+        Timesheet.user_id, Timesheet.date, Timesheet.total_hours, Timesheet.status
+    ).where(*scoped(Timesheet)).subquery("timesheets")
+
+    row_user = func.coalesce(logs.c.user_id, timesheets.c.user_id)
+    row_date = func.coalesce(logs.c.date, timesheets.c.date)
+    logged_hours = func.coalesce(logs.c.logged_hours, 0)
+    timesheet_hours = func.coalesce(timesheets.c.total_hours, 0)
+    difference = (logged_hours - timesheet_hours).label("difference")
+    attendance_hours = func.round(
+        cast(extract("epoch", Attendance.check_out - Attendance.check_in) / 3600, Numeric), 2
+    )
+
+    return db.query(
+        row_user.label("user_id"),
+        User.full_name,
+        row_date.label("date"),
+        logged_hours.label("logged_hours"),
+        func.coalesce(logs.c.log_entries, 0).label("log_entries"),
+        timesheets.c.total_hours.label("timesheet_hours"),
+        timesheets.c.status.label("timesheet_status"),
+        attendance_hours.label("attendance_hours"),
+        difference,
+    ).select_from(logs).join(
+        timesheets,
+        and_(logs.c.user_id == timesheets.c.user_id, logs.c.date == timesheets.c.date),
+        full=True
+    ).join(
+        User, User.id == row_user
+    ).outerjoin(
+        Attendance, and_(Attendance.user_id == row_user, Attendance.date == row_date)
+    ).filter(
+        or_(difference > tolerance, difference < -tolerance)
+    ).order_by(row_date.desc(), User.full_name, row_user)
@@ -0,0 +1,147 @@
+from datetime import date, time
+from collections import defaultdict
+from typing import Iterable, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import Time, and_, cast, delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.attendance import Attendance
+from app.models.attendance_monthly import AttendanceMonthly
+from app.models.timesheet import Timesheet
+
+ROLLUP_FIELDS = ("present_days", "late_days", "auto_hours", "manual_hours", "approved_hours")
+
+
+def month_key(day: date) -> str:
+    return day.strftime("%Y-%m")
+
+
+def month_bounds(year_month: str):
+    """First day of month 'YYYY-MM' and first day of the next month."""
+    year, month = map(int, year_month.split("-"))
+    start = date(year, month, 1)
+    end = date(year + month // 12, month % 12 + 1, 1)
+    return start, end
+
+
+def _rollup_rows(user_ids: Optional[Iterable[UUID]] = None, start: Optional[date] = None, end: Optional[date] = None):
+    """
+    SELECT of rollup rows per (user_id, year_month), optionally limited to
+    some users and a date range.
+    """
+    def scoped(model):
+        conditions = []
+        if user_ids is not None:
+            conditions.append(model.user_id.in_(user_ids))
+        if start is not None:
+            conditions.append(model.date >= start)
+        if end is not None:
+            conditions.append(model.date < end)
+        return conditions
+
+    late_after = time.fromisoformat(settings.LATE_CHECK_IN_AFTER)
+    local_check_in = cast(func.timezone(settings.ATTENDANCE_TIMEZONE, Attendance.check_in), Time)
+    attendance_month = func.to_char(Attendance.date, "YYYY-MM")
+    attendance_totals = select(
+        Attendance.user_id,
+        attendance_month.label("year_month"),
+        func.count().label("present_days"),
+        func.count().filter(local_check_in > late_after).label("late_days"),
+    ).where(Attendance.check_in != None, *scoped(Attendance)).group_by(
+        Attendance.user_id, attendance_month
+    ).subquery()
+
+    timesheet_month = func.to_char(Timesheet.date, "YYYY-MM")
+    timesheet_totals = select(
+        Timesheet.user_id,
+        timesheet_month.label("year_month"),
+        func.sum(Timesheet.auto_hours).label("auto_hours"),
+        func.sum(Timesheet.manual_hours).label("manual_hours"),
+        func.sum(Timesheet.total_hours).filter(Timesheet.status == "approved").label("approved_hours"),
+    ).where(*scoped(Timesheet)).group_by(Timesheet.user_id, timesheet_month).subquery()
+
+    a, t = attendance_totals.c, timesheet_totals.c
+    return select(
+        func.coalesce(a.user_id, t.user_id).label("user_id"),
+        func.coalesce(a.year_month, t.year_month).label("year_month"),
+        func.coalesce(a.present_days, 0).label("present_days"),
+        func.coalesce(a.late_days, 0).label("late_days"),
+        func.coalesce(t.auto_hours, 0).label("auto_hours"),
+        func.coalesce(t.manual_hours, 0).label("manual_hours"),
+        func.coalesce(t.approved_hours, 0).label("approved_hours"),
+    ).select_from(
+        attendance_totals.join(
+            timesheet_totals,
+            and_(a.user_id == t.user_id, a.year_month == t.year_month),
+            full=True
+        )
+    )
+
+
+def _upsert(rows):
+    insert = pg_insert(AttendanceMonthly).from_select(["user_id", "year_month", *ROLLUP_FIELDS], rows)
+    return insert.on_conflict_do_update(
+        index_elements=[AttendanceMonthly.user_id, AttendanceMonthly.year_month],
+        set_={**{field: insert.excluded[field] for field in ROLLUP_FIELDS}, "updated_at": func.now()}
+    )
+
+
+def refresh_monthly_rollup(db: Session, user_id: UUID, day: date) -> None:
+    """
+    Bring the rollup row of one user and month up to date.
+
+    The row is recomputed from that month's attendance and timesheets (at
+    most a month of rows each) and upserted in the caller's transaction,
+    so it always matches the data it summarizes; if nothing is left to
+    summarize, the row is deleted by the same statement. Call after any
+    change to a user's attendance or timesheet on `day`. Nothing is
+    committed here.
+    """
+    refresh_monthly_rollups(db, [user_id], day)
+
+
+def refresh_monthly_rollups(db: Session, user_ids: Iterable[UUID], day: date) -> None:
+    """Like refresh_monthly_rollup, for several users in one statement."""
+    db.flush()
+    user_ids = list(user_ids)
+    year_month = month_key(day)
+    start, end = month_bounds(year_month)
+
+    rows = _rollup_rows(user_ids, start, end).cte("rollup")
+    upserted = _upsert(select(rows)).cte("upserted")
+    db.execute(
+        delete(AttendanceMonthly).where(
+            AttendanceMonthly.user_id.in_(user_ids),
+            AttendanceMonthly.year_month == year_month,
+            AttendanceMonthly.user_id.notin_(select(rows.c.user_id))
+        ).add_cte(rows).add_cte(upserted).execution_options(synchronize_session=False)
+    )
+
+
+def refresh_rollups_for_days(db: Session, user_days: Iterable[Tuple[UUID, date]]) -> None:
+    """Refresh the rollups touched by a set of (user_id, date) changes, one statement per month."""
+    users_by_month = defaultdict(set)
+    days_by_month = {}
+    for user_id, day in user_days:
+        users_by_month[month_key(day)].add(user_id)
+        days_by_month[month_key(day)] = day
+    for year_month, user_ids in users_by_month.items():
+        refresh_monthly_rollups(db, user_ids, days_by_month[year_month])
+
+
+def rebuild_monthly_rollups(db: Session, since: Optional[str] = None) -> int:
+    """
+    Recompute all rollup rows, or those from month `since` ('YYYY-MM') on,
+    with one set-based query. Nothing is committed here.
+    """
+    start = month_bounds(since)[0] if since else None
+
+    clear = delete(AttendanceMonthly)
+    if since:
+        clear = clear.where(AttendanceMonthly.year_month >= since)
+    db.execute(clear)
+
+    return db.execute(_upsert(_rollup_rows(start=start))).rowcount
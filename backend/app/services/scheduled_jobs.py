@@ -0,0 +1,45 @@
+from datetime import date, timedelta
+
+from sqlalchemy import delete, func
+from sqlalchemy.orm import Session
+
+from app.core.scheduler import Scheduler
+from app.models.job_run import JobRun
+from app.services.leave_balance import accrue_leave, ensure_working_calendar
+from app.services.rollups import month_key, rebuild_monthly_rollups
+from app.services.timesheet import auto_close_attendance
+
+# job_runs rows older than this are pruned
+JOB_RUN_RETENTION_DAYS = 90
+
+
+def close_forgotten_check_outs(db: Session) -> None:
+    """Close attendance left open on earlier days and create their timesheets."""
+    auto_close_attendance(db, date.today())
+
+
+def rebuild_recent_rollups(db: Session) -> None:
+    """Recompute last month's and this month's attendance rollups."""
+    last_month = date.today().replace(day=1) - timedelta(days=1)
+    rebuild_monthly_rollups(db, month_key(last_month))
+
+
+def accrue_monthly_leave(db: Session) -> None:
+    """Credit this month's leave, catching up missed months, and keep next year's calendar ready."""
+    today = date.today()
+    ensure_working_calendar(db, date(today.year, 1, 1), date(today.year + 1, 12, 31))
+    accrue_leave(db, today)
+
+
+def prune_job_runs(db: Session) -> None:
+    db.execute(delete(JobRun).where(
+        JobRun.started_at < func.now() - timedelta(days=JOB_RUN_RETENTION_DAYS)
+    ))
+
+
+def register_jobs(scheduler: Scheduler) -> None:
+    """Register the recurring jobs; times are in SCHEDULER_TIMEZONE."""
+    scheduler.cron("close-forgotten-check-outs", "15 0 * * *", close_forgotten_check_outs)
+    scheduler.cron("rebuild-attendance-rollups", "30 2 * * *", rebuild_recent_rollups)
+    scheduler.cron("accrue-leave", "45 0 * * *", accrue_monthly_leave)
+    scheduler.cron("prune-job-runs", "0 3 * * 0", prune_job_runs)
@@ -0,0 +1,184 @@
+import csv
+import io
+import os
+import re
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+# Records are handed out in batches of this size by default
+DEFAULT_BATCH_SIZE = 1000
+
+# How many leading rows are searched for the header (quotations often start
+# with a letterhead, address block or title rows)
+HEADER_SCAN_ROWS = 30
+
+# Summary rows at the bottom of quotations and invoices, e.g. "Sub Total",
+# "GST @ 18%", "Grand Total:"
+_TOTALS_LABEL = re.compile(
+    r"(sub ?total|grand total|total( amount)?|net amount|amount payable|"
+    r"[cis]?gst|tax|vat|discount|round(ing)? off)[\s\d.%@:()+-]*"
+)
+
+Record = Dict[str, Any]
+
+
+class TabularFileError(ValueError):
+    """Raised when a file cannot be read as a table with the expected columns."""
+
+
+def normalize_label(value: Any) -> str:
+    """
+    Normalize a header cell for alias matching.
+
+    "Qty. (Nos.)" becomes "qty" and "Unit Price (INR)" becomes "unit price".
+    """
+    if value is None:
+        return ""
+    label = re.sub(r"\([^)]*\)", " ", str(value).lower())
+    label = re.sub(r"[^\w/#%]+", " ", label)
+    return " ".join(label.split())
+
+
+def iter_raw_rows(source: Union[str, os.PathLike, BinaryIO], filename: Optional[str] = None) -> Iterator[Tuple[Any, ...]]:
+    """
+    Stream raw rows from a CSV or XLSX file path or binary file object.
+
+    CSV files are decoded incrementally and XLSX files are opened in
+    openpyxl's read-only mode, so neither is loaded into memory at once.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            yield from iter_raw_rows(file, filename or os.fspath(source))
+        return
+
+    lower_name = (filename or "").lower()
+
+    if lower_name.endswith(".csv"):
+        text_stream = io.TextIOWrapper(source, encoding="utf-8-sig", newline="")
+        try:
+            for row in csv.reader(text_stream):
+                yield tuple(row)
+        except UnicodeDecodeError:
+            raise TabularFileError("CSV files must be UTF-8 encoded")
+        finally:
+            text_stream.detach()
+    elif lower_name.endswith((".xlsx", ".xlsm")):
+        from openpyxl import load_workbook
+
+        try:
+            workbook = load_workbook(source, read_only=True, data_only=True)
+        except Exception:
+            raise TabularFileError("Could not read the uploaded workbook")
+        try:
+            for row in workbook.active.iter_rows(values_only=True):
+                yield row
+        finally:
+            workbook.close()
+    else:
+        raise TabularFileError("Unsupported file type. Upload a .csv or .xlsx file")
+
+
+def _clean_cell(value: Any) -> Any:
+    if isinstance(value, str):
+        value = value.strip()
+        return value or None
+    return value
+
+
+def _is_totals_row(row: Sequence[Any]) -> bool:
+    first = next((cell for cell in row if cell is not None), None)
+    return isinstance(first, str) and _TOTALS_LABEL.fullmatch(normalize_label(first)) is not None
+
+
+class TabularReader:
+    """
+    Stream typed records from a spreadsheet with a fixed memory footprint.
+
+    The header row is located automatically: the first HEADER_SCAN_ROWS rows
+    are scored by how many columns match `fields` (a mapping of field name to
+    accepted header labels) and the best row containing every `required`
+    field wins. Data rows after it are yielded as (row_number, record) pairs,
+    where a record maps each field to its cell value. XLSX cells keep their
+    native types, blank cells become None, and `converters` can coerce
+    individual fields. Blank rows and totals rows are skipped.
+    """
+
+    def __init__(
+        self,
+        source: Union[str, os.PathLike, BinaryIO],
+        filename: Optional[str] = None,
+        fields: Optional[Dict[str, Iterable[str]]] = None,
+        required: Sequence[str] = (),
+        converters: Optional[Dict[str, Callable[[Any], Any]]] = None,
+    ):
+        self.source = source
+        self.filename = filename
+        self.fields = {field: {normalize_label(alias) for alias in aliases} for field, aliases in (fields or {}).items()}
+        self.required = tuple(required)
+        self.converters = converters or {}
+        self.positions: Dict[str, int] = {}
+
+    def _match_header(self, row: Sequence[Any]) -> Dict[str, int]:
+        positions = {}
+        for index, cell in enumerate(row):
+            label = normalize_label(cell)
+            if not label:
+                continue
+            for field, aliases in self.fields.items():
+                if label in aliases and field not in positions:
+                    positions[field] = index
+                    break
+        return positions
+
+    def _find_header(self, rows: Iterator[Tuple[Any, ...]]) -> Tuple[int, List[Tuple[int, Tuple[Any, ...]]]]:
+        """Return the header row number and the scanned rows that follow it."""
+        scanned = []
+        best_row, best_positions = None, {}
+        for row_number, row in enumerate(rows, start=1):
+            scanned.append((row_number, row))
+            positions = self._match_header(row)
+            if all(field in positions for field in self.required) and len(positions) > len(best_positions):
+                best_row, best_positions = row_number, positions
+            if row_number >= HEADER_SCAN_ROWS:
+                break
+
+        if not scanned:
+            raise TabularFileError("File is empty")
+        if best_row is None:
+            missing = ", ".join(f"'{field}'" for field in self.required) or "known"
+            raise TabularFileError(f"Header row must contain a {missing} column")
+
+        self.positions = best_positions
+        return best_row, [(number, row) for number, row in scanned if number > best_row]
+
+    def __iter__(self) -> Iterator[Tuple[int, Record]]:
+        rows = iter_raw_rows(self.source, self.filename)
+        header_row, pending = self._find_header(rows)
+
+        def remaining():
+            yield from pending
+            yield from enumerate(rows, start=header_row + len(pending) + 1)
+
+        for row_number, row in remaining():
+            row = [_clean_cell(cell) for cell in row]
+            if all(cell is None for cell in row) or _is_totals_row(row):
+                continue
+
+            record = {field: (row[index] if index < len(row) else None) for field, index in self.positions.items()}
+            for field, convert in self.converters.items():
+                if record.get(field) is not None:
+                    try:
+                        record[field] = convert(record[field])
+                    except (TypeError, ValueError):
+                        raise ValueError(f"Row {row_number}: invalid {field} '{record[field]}'")
+            yield row_number, record
+
+    def batches(self, size: int = DEFAULT_BATCH_SIZE) -> Iterator[List[Tuple[int, Record]]]:
+        """Yield records in lists of at most `size`."""
+        batch = []
+        for item in self:
+            batch.append(item)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
@@ -1,16 +1,40 @@
+import uuid
+from datetime import date, time, timedelta
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import DateTime, Numeric, Time, cast, extract, func, literal, literal_column, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
-from datetime import datetime
-from decimal import Decimal
+from app.config import settings
 from app.models.attendance import Attendance
+from app.models.daily_log import DailyLog
+from app.models.inventory import InventoryTransaction
+from app.models.project import TaskComment
+from app.models.site import Site
 from app.models.timesheet import Timesheet
+from app.services.rollups import refresh_rollups_for_days
+
+AUTO_CHECKOUT_POLICIES = ("closing_time", "last_activity")
+
+# Days of attendance recomputed per statement and commit
+RECOMPUTE_CHUNK_DAYS = 7
+
+
+def _hours_between(check_in, check_out):
+    """SQL expression for the hours between two timestamps, to 2 decimal places."""
+    return func.round(cast(extract("epoch", check_out - check_in) / 3600, Numeric), 2)
 
 
 def process_checkout(attendance: Attendance, db: Session) -> None:
     """
     Process checkout and auto-generate/update timesheet.
 
-    When a user checks out, calculate the hours worked and create or update
-    the corresponding timesheet entry.
+    Upserts the timesheet for the attendance's user and date with a single
+    INSERT ... ON CONFLICT, with auto_hours computed in SQL from the stored
+    check_out - check_in. The attendance changes are flushed first and
+    nothing is committed, so the checkout and its timesheet are written in
+    the caller's transaction.
 
     Args:
         attendance: The attendance record with check_in and check_out times
@@ -19,30 +43,259 @@ def process_checkout(attendance: Attendance, db: Session) -> None:
     if not attendance.check_in or not attendance.check_out:
         return
 
-    # Calculate hours worked
-    time_diff = attendance.check_out - attendance.check_in
-    hours = Decimal(str(time_diff.total_seconds() / 3600))
-    hours = round(hours, 2)
-
-    # Find existing timesheet for this user and date
-    timesheet = db.query(Timesheet).filter(
-        Timesheet.user_id == attendance.user_id,
-        Timesheet.date == attendance.date
-    ).first()
-
-    if timesheet:
-        # Update existing timesheet
-        timesheet.auto_hours = hours
-        timesheet.updated_at = datetime.utcnow()
-    else:
-        # Create new timesheet
-        timesheet = Timesheet(
-            user_id=attendance.user_id,
-            date=attendance.date,
-            auto_hours=hours,
-            manual_hours=Decimal("0.00"),
-            status="pending"
+    db.flush()
+
+    rows = select(
+        literal(uuid.uuid4()),
+        Attendance.user_id,
+        Attendance.date,
+        _hours_between(Attendance.check_in, Attendance.check_out),
+        literal(0),
+        literal("pending"),
+    ).where(Attendance.id == attendance.id)
+
+    insert = pg_insert(Timesheet).from_select(
+        ["id", "user_id", "date", "auto_hours", "manual_hours", "status"], rows
+    )
+    db.execute(insert.on_conflict_do_update(
+        index_elements=[Timesheet.user_id, Timesheet.date],
+        set_={"auto_hours": insert.excluded.auto_hours, "updated_at": func.now()}
+    ))
+
+
+def _auto_check_out_time(policy: str):
+    """
+    SQL expression for the check-out time of an open attendance row.
+
+    "closing_time" uses the closing time of the check-in site (or
+    AUTO_CHECKOUT_CLOSING_TIME) on the attendance date, in
+    ATTENDANCE_TIMEZONE. "last_activity" uses the latest daily log, task
+    comment or inventory transaction between the check-in and the end of
+    that day, and the closing time when there is none. Never earlier than
+    the check-in.
+    """
+    tz = settings.ATTENDANCE_TIMEZONE
+    closing_time = func.coalesce(
+        select(Site.closing_time).where(Site.id == Attendance.check_in_site_id).scalar_subquery(),
+        cast(literal(time.fromisoformat(settings.AUTO_CHECKOUT_CLOSING_TIME)), Time)
+    )
+    check_out = func.timezone(tz, Attendance.date + closing_time)
+
+    if policy == "last_activity":
+        day_end = func.timezone(tz, cast(Attendance.date + 1, DateTime))
+
+        def latest(column, user_column):
+            return select(func.max(column)).where(
+                user_column == Attendance.user_id,
+                column > Attendance.check_in,
+                column < day_end
+            ).scalar_subquery()
+
+        last_activity = func.greatest(
+            latest(DailyLog.updated_at, DailyLog.user_id),
+            latest(TaskComment.created_at, TaskComment.user_id),
+            latest(InventoryTransaction.created_at, InventoryTransaction.user_id),
+        )
+        check_out = func.coalesce(last_activity, check_out)
+
+    return func.greatest(check_out, Attendance.check_in)
+
+
+def auto_close_attendance(db: Session, before: date, policy: Optional[str] = None) -> int:
+    """
+    Close every attendance row before `before` that was checked in but never
+    checked out, and create the missing timesheets.
+
+    One statement does it all: an UPDATE ... RETURNING of the open rows
+    (check-out set by `policy`, default AUTO_CHECKOUT_POLICY, and marked
+    auto_closed) feeds an INSERT ... SELECT ... ON CONFLICT into timesheets,
+    which flags each timesheet as needing review; approved timesheets are
+    not touched. The affected monthly
+    rollups are then refreshed. Nothing is committed here.
+
+    Returns the number of attendance rows closed.
+    """
+    policy = policy or settings.AUTO_CHECKOUT_POLICY
+    if policy not in AUTO_CHECKOUT_POLICIES:
+        raise ValueError(f"Unknown auto check-out policy: {policy!r}")
+
+    closed = update(Attendance).where(
+        Attendance.check_in != None,
+        Attendance.check_out == None,
+        Attendance.date < before
+    ).values(
+        check_out=_auto_check_out_time(policy),
+        auto_closed=True
+    ).returning(
+        Attendance.user_id, Attendance.date, Attendance.check_in, Attendance.check_out
+    ).cte("closed")
+
+    rows = select(
+        func.gen_random_uuid(),
+        closed.c.user_id,
+        closed.c.date,
+        _hours_between(closed.c.check_in, closed.c.check_out),
+        literal(0),
+        literal("pending"),
+        literal(True),
+    )
+    insert = pg_insert(Timesheet).from_select(
+        ["id", "user_id", "date", "auto_hours", "manual_hours", "status", "needs_review"], rows
+    )
+    # Signed-off timesheets are left as approved
+    timesheets = insert.on_conflict_do_update(
+        index_elements=[Timesheet.user_id, Timesheet.date],
+        set_={"auto_hours": insert.excluded.auto_hours, "needs_review": True, "updated_at": func.now()},
+        where=Timesheet.status != "approved"
+    ).returning(Timesheet.id).cte("timesheets")
+
+    closed_days = db.execute(
+        select(closed.c.user_id, closed.c.date).add_cte(closed).add_cte(timesheets)
+    ).all()
+    refresh_rollups_for_days(db, closed_days)
+
+    return len(closed_days)
+
+
+def bulk_review_timesheets(
+    db: Session,
+    reviewer_id: UUID,
+    new_status: str,
+    ids: Optional[List[UUID]] = None,
+    user_ids: Optional[List[UUID]] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    status_filter: Optional[str] = None,
+    notes: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Approve or reject many timesheets with one UPDATE ... RETURNING.
+
+    Timesheets are picked by `ids` and/or the filters. The reviewer's own
+    timesheets and those already in `new_status` are excluded in the
+    UPDATE itself; one follow-up SELECT explains why each remaining
+    timesheet was skipped, and requested ids that do not exist are
+    reported as not found. Rejection notes replace existing notes when
+    given. Nothing is committed here.
+    """
+    conditions = []
+    if ids is not None:
+        conditions.append(Timesheet.id.in_(ids))
+    if user_ids is not None:
+        conditions.append(Timesheet.user_id.in_(user_ids))
+    if start_date:
+        conditions.append(Timesheet.date >= start_date)
+    if end_date:
+        conditions.append(Timesheet.date <= end_date)
+    if status_filter:
+        conditions.append(Timesheet.status == status_filter)
+
+    values = {
+        "status": new_status,
+        "needs_review": False,
+        "approved_by": reviewer_id,  # Also tracks who rejected it
+        "approved_at": func.now(),
+        "updated_at": func.now(),
+    }
+    if notes:
+        values["notes"] = notes
+
+    updated = db.execute(
+        update(Timesheet).where(
+            *conditions,
+            Timesheet.user_id != reviewer_id,
+            Timesheet.status.is_distinct_from(new_status)
+        ).values(**values).returning(Timesheet.id, Timesheet.user_id, Timesheet.date),
+        execution_options={"synchronize_session": False}
+    ).all()
+    updated_ids = {row.id for row in updated}
+
+    skipped = db.execute(
+        select(Timesheet.id, Timesheet.user_id, Timesheet.status).where(
+            *conditions, Timesheet.id.notin_(updated_ids)
+        )
+    ).all()
+
+    refresh_rollups_for_days(db, [(row.user_id, row.date) for row in updated])
+
+    results = [{"id": row.id, "status": new_status, "detail": None} for row in updated]
+    for timesheet_id, user_id, current_status in skipped:
+        detail = "Own timesheet" if user_id == reviewer_id else f"Timesheet is already {current_status}"
+        results.append({"id": timesheet_id, "status": "skipped", "detail": detail})
+
+    seen = updated_ids | {row.id for row in skipped}
+    missing = [timesheet_id for timesheet_id in dict.fromkeys(ids or []) if timesheet_id not in seen]
+    results.extend({"id": timesheet_id, "status": "not_found", "detail": None} for timesheet_id in missing)
+
+    return {
+        "updated": len(updated),
+        "skipped": len(skipped),
+        "not_found": len(missing),
+        "results": results,
+    }
+
+
+def recompute_timesheets(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    user_ids: Optional[List[UUID]] = None,
+    force: bool = False,
+) -> Dict[str, int]:
+    """
+    Recompute auto_hours from attendance for a date range and optional users.
+
+    Each RECOMPUTE_CHUNK_DAYS of the range is one INSERT ... SELECT from
+    checked-out attendance with ON CONFLICT DO UPDATE, committed before the
+    next chunk so row locks are only held briefly. Missing timesheets are
+    created; existing ones are only written when their hours change, and
+    approved ones are left alone unless `force` is set. The monthly rollups
+    of the changed rows are refreshed in the same transaction.
+    """
+    inserted = updated = chunks = 0
+    chunk_start = start_date
+
+    while chunk_start <= end_date:
+        chunk_end = min(chunk_start + timedelta(days=RECOMPUTE_CHUNK_DAYS - 1), end_date)
+
+        rows = select(
+            func.gen_random_uuid(),
+            Attendance.user_id,
+            Attendance.date,
+            _hours_between(Attendance.check_in, Attendance.check_out),
+            literal(0),
+            literal("pending"),
+        ).where(
+            Attendance.check_in != None,
+            Attendance.check_out != None,
+            Attendance.date >= chunk_start,
+            Attendance.date <= chunk_end
+        )
+        if user_ids is not None:
+            rows = rows.where(Attendance.user_id.in_(user_ids))
+
+        insert = pg_insert(Timesheet).from_select(
+            ["id", "user_id", "date", "auto_hours", "manual_hours", "status"], rows
         )
-        db.add(timesheet)
+        changed = Timesheet.auto_hours.is_distinct_from(insert.excluded.auto_hours)
+        statement = insert.on_conflict_do_update(
+            index_elements=[Timesheet.user_id, Timesheet.date],
+            set_={"auto_hours": insert.excluded.auto_hours, "updated_at": func.now()},
+            where=changed if force else changed & Timesheet.status.is_distinct_from("approved")
+        ).returning(
+            Timesheet.user_id,
+            Timesheet.date,
+            # xmax is 0 on a freshly inserted row
+            literal_column("xmax = 0").label("inserted")
+        )
+
+        written = db.execute(statement).all()
+        refresh_rollups_for_days(db, [(row.user_id, row.date) for row in written])
+        db.commit()
+
+        inserted += sum(1 for row in written if row.inserted)
+        updated += sum(1 for row in written if not row.inserted)
+        chunks += 1
+        chunk_start = chunk_end + timedelta(days=1)
 
-    db.commit()
+    return {"inserted": inserted, "updated": updated, "chunks": chunks}
@@ -0,0 +1,64 @@
+"""
+Benchmark the compiled category matcher against the per-keyword substring scan.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_categorizer [count]
+"""
+
+import random
+import sys
+import time
+
+from app.services.categorizer import CATEGORY_RULES, DEFAULT_CATEGORY, categorize
+
+FILLER = [
+    '10k', '0805', 'smd', 'module', 'kit', 'pack', 'of', '5', 'board', 'red',
+    'blue', '3.3v', '5v', 'pin', 'pcs', 'black', 'original', 'india', '1/4w',
+]
+
+
+def naive_categorize(name: str) -> str:
+    """The original approach: test every keyword of every category in order."""
+    name = name.lower()
+    for _, category, keywords in sorted(CATEGORY_RULES):
+        for keyword in keywords:
+            if keyword in name:
+                return category
+    return DEFAULT_CATEGORY
+
+
+def make_names(count: int, seed: int = 42):
+    """Generate product-like names, roughly half of which contain a keyword."""
+    rng = random.Random(seed)
+    keywords = [keyword for _, _, rule_keywords in CATEGORY_RULES for keyword in rule_keywords]
+    names = []
+    for _ in range(count):
+        words = [rng.choice(FILLER) for _ in range(rng.randint(3, 12))]
+        if rng.random() < 0.5:
+            words.insert(rng.randrange(len(words)), rng.choice(keywords))
+        names.append(' '.join(words).title())
+    return names
+
+
+def timed(func, names):
+    start = time.perf_counter()
+    result = [func(name) for name in names]
+    return result, time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    names = make_names(count)
+
+    expected, naive_seconds = timed(naive_categorize, names)
+    actual, compiled_seconds = timed(categorize, names)
+
+    mismatches = sum(1 for a, b in zip(expected, actual) if a != b)
+    print(f"Names:      {count:,}")
+    print(f"Substring:  {naive_seconds:.3f}s")
+    print(f"Compiled:   {compiled_seconds:.3f}s ({naive_seconds / compiled_seconds:.2f}x)")
+    print(f"Mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
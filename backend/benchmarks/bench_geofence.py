@@ -0,0 +1,77 @@
+"""
+Benchmark the grid-indexed geofence against a haversine scan of every site.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_geofence [points] [sites]
+"""
+
+import random
+import sys
+import time
+
+from app.services.geofence import GeofenceIndex, GeofenceSite
+
+# Sites are scattered over roughly the Delhi NCR area
+CENTER = (28.6, 77.2)
+SPREAD_DEGREES = 0.5
+
+
+def make_sites(count: int, rng: random.Random):
+    return [
+        GeofenceSite(
+            index,
+            f"Site {index}",
+            CENTER[0] + rng.uniform(-SPREAD_DEGREES, SPREAD_DEGREES),
+            CENTER[1] + rng.uniform(-SPREAD_DEGREES, SPREAD_DEGREES),
+            rng.choice([100, 200, 500, 1000]),
+        )
+        for index in range(count)
+    ]
+
+
+def make_points(count: int, sites, rng: random.Random):
+    """Half the points are near a site, the rest anywhere in the area."""
+    points = []
+    for _ in range(count):
+        if rng.random() < 0.5:
+            site = rng.choice(sites)
+            points.append((site.latitude + rng.gauss(0, 0.005), site.longitude + rng.gauss(0, 0.005)))
+        else:
+            points.append((
+                CENTER[0] + rng.uniform(-SPREAD_DEGREES, SPREAD_DEGREES),
+                CENTER[1] + rng.uniform(-SPREAD_DEGREES, SPREAD_DEGREES),
+            ))
+    return points
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    point_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    site_count = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    rng = random.Random(42)
+
+    sites = make_sites(site_count, rng)
+    points = make_points(point_count, sites, rng)
+    index, build_seconds = timed(GeofenceIndex, sites)
+
+    expected, scan_seconds = timed(lambda: [index.match_scan(lat, lon) for lat, lon in points])
+    actual, grid_seconds = timed(index.match_many, points)
+
+    key = lambda match: match.site.key if match else None
+    mismatches = sum(1 for a, b in zip(expected, actual) if key(a) != key(b))
+    matched = sum(1 for match in actual if match)
+
+    print(f"Points:     {point_count:,} ({matched:,} within a site)")
+    print(f"Sites:      {site_count:,} ({len(index.cells):,} grid cells, built in {build_seconds * 1000:.1f}ms)")
+    print(f"Scan:       {scan_seconds:.3f}s")
+    print(f"Grid:       {grid_seconds:.3f}s ({scan_seconds / grid_seconds:.2f}x)")
+    print(f"Mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
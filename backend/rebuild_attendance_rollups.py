@@ -0,0 +1,39 @@
+"""
+Script to rebuild the monthly attendance and hours rollups.
+Run this once after migrating, and whenever the rollups may have drifted
+(e.g. after editing attendance or timesheets directly in the database).
+
+Usage:
+    python rebuild_attendance_rollups.py [YYYY-MM]
+
+With a month, only that month and later ones are rebuilt.
+"""
+
+import sys
+
+from app.database import SessionLocal
+from app.services.rollups import rebuild_monthly_rollups
+
+
+def rebuild_attendance_rollups(since=None):
+    """Recompute attendance_monthly from attendance and timesheets."""
+    db = SessionLocal()
+
+    try:
+        rows = rebuild_monthly_rollups(db, since)
+        db.commit()
+
+        print("✓ Monthly attendance rollups rebuilt successfully!")
+        print(f"  From: {since or 'the beginning'}")
+        print(f"  Rows: {rows}")
+
+    except Exception as e:
+        print(f"ERROR: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    rebuild_attendance_rollups(sys.argv[1] if len(sys.argv) > 1 else None)
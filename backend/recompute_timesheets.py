@@ -0,0 +1,43 @@
+"""
+Script to recompute timesheet auto hours from attendance.
+Run this after changing how auto hours are calculated, or after fixing
+attendance records by hand.
+
+Usage:
+    python recompute_timesheets.py START_DATE END_DATE [--force]
+
+Dates are YYYY-MM-DD. Approved timesheets are only recomputed with --force.
+"""
+
+import sys
+from datetime import date
+
+from app.database import SessionLocal
+from app.services.timesheet import recompute_timesheets as recompute
+
+
+def recompute_timesheets(start_date, end_date, force=False):
+    """Recompute auto_hours for every user between the two dates."""
+    db = SessionLocal()
+
+    try:
+        result = recompute(db, start_date, end_date, force=force)
+
+        print("✓ Timesheets recomputed successfully!")
+        print(f"  Range: {start_date} to {end_date}{' (including approved)' if force else ''}")
+        print(f"  Created: {result['inserted']}")
+        print(f"  Updated: {result['updated']}")
+
+    except Exception as e:
+        print(f"ERROR: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--force"]
+    if len(args) != 2:
+        sys.exit(__doc__)
+    recompute_timesheets(date.fromisoformat(args[0]), date.fromisoformat(args[1]), force="--force" in sys.argv)
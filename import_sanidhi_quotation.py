@@ -1,6 +1,12 @@
-import pandas as pd
-import requests
+import csv
+import io
+import os
 import sys
+import requests
+
+# Share the spreadsheet reader with the CRM backend
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+from app.services.tabular_reader import TabularReader
 
 # Configuration
 API_BASE_URL = "https://team-crm-software-production.up.railway.app/api/v1"
@@ -29,89 +35,81 @@ print("Login successful!")
 
 # Read Excel file
 print("\nReading Excel file...")
-# Read data starting from row 10 (data rows), row 9 has headers but pandas doesn't read them well
-df = pd.read_excel(EXCEL_FILE, header=None, skiprows=10)
-
-# Remove the last 3 rows (subtotal, GST, total)
-df = df[:-3]
-
-# Manually assign column names
-df.columns = ['Sr_No', 'Description', 'Quantity', 'Unit_Price', 'Total_Price']
+# The header row is found automatically and subtotal/GST/total rows are skipped
+reader = TabularReader(
+    EXCEL_FILE,
+    fields={
+        'description': ('description/value', 'description'),
+        'quantity': ('qty', 'quantity'),
+        'unit_price': ('unit price', 'rate'),
+    },
+    required=('description',),
+)
 
-# Remove rows with NaN in Description
-df = df.dropna(subset=['Description'])
 
-# Convert numeric columns
-df['Quantity'] = pd.to_numeric(df['Quantity'], errors='coerce').fillna(1).astype(int)
-df['Unit_Price'] = pd.to_numeric(df['Unit_Price'], errors='coerce').fillna(0)
+def to_number(value, default):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
 
-print(f"Found {len(df)} items in the Excel file")
 
-# Create or get category
-print("\nCreating/Getting 'Electronic Components' category...")
+# Build the upload for the bulk import endpoint, one row at a time
 category_name = "Electronic Components"
 
-# Get existing categories
-categories_response = requests.get(f"{API_BASE_URL}/inventory/categories", headers=headers)
-categories = categories_response.json()
-
-# Find or create category
-category_id = None
-for cat in categories:
-    if cat['name'] == category_name:
-        category_id = cat['id']
-        print(f"Found existing category: {category_name}")
-        break
-
-if not category_id:
-    # Create new category
-    create_cat_response = requests.post(
-        f"{API_BASE_URL}/inventory/categories",
+buffer = io.StringIO()
+writer = csv.writer(buffer)
+writer.writerow(["name", "category", "quantity", "unit", "unit_price", "min_threshold", "notes"])
+item_count = 0
+for _, record in reader:
+    if record['description'] is None:
+        continue
+    quantity = int(to_number(record['quantity'], 1))
+    writer.writerow([
+        str(record['description']).strip(),
+        category_name,
+        quantity,
+        "pcs",
+        to_number(record['unit_price'], 0),
+        max(int(quantity * 0.1), 5),  # 10% of quantity or 5, whichever is higher
+        "From Sannidhi Quotation",
+    ])
+    item_count += 1
+csv_bytes = buffer.getvalue().encode("utf-8")
+
+print(f"Found {item_count} items in the Excel file")
+
+def upload(dry_run):
+    response = requests.post(
+        f"{API_BASE_URL}/inventory/import",
         headers=headers,
-        json={"name": category_name, "description": "Electronic components from Sannidhi quotation"}
+        params={"dry_run": str(dry_run).lower()},
+        files={"file": ("sannidhi_quotation.csv", csv_bytes, "text/csv")}
     )
-    if create_cat_response.status_code == 201:
-        category_id = create_cat_response.json()['id']
-        print(f"Created new category: {category_name}")
-    else:
-        print(f"Failed to create category: {create_cat_response.text}")
+    if response.status_code != 200:
+        print(f"[FAIL] Import failed: {response.text}")
         sys.exit(1)
+    return response.json()
 
-# Import items
-print(f"\nImporting {len(df)} items to inventory...")
-success_count = 0
-error_count = 0
-
-for idx, row in df.iterrows():
-    item_name = str(row['Description']).strip()
-    quantity = int(row['Quantity'])
-    unit_price = float(row['Unit_Price'])
-
-    # Create inventory item
-    item_data = {
-        "name": item_name,
-        "category_id": category_id,
-        "quantity": quantity,
-        "unit": "pcs",
-        "min_threshold": max(5, int(quantity * 0.1)),  # 10% of quantity or 5, whichever is higher
-        "notes": f"Unit Price: ₹{unit_price} | From Sannidhi Quotation"
-    }
 
-    response = requests.post(
-        f"{API_BASE_URL}/inventory/",
-        headers=headers,
-        json=item_data
-    )
+# Preview changes before writing anything
+print(f"\nChecking {item_count} items against inventory (dry run)...")
+preview = upload(dry_run=True)
+print(f"New: {preview['new']} | Updated: {preview['updated']} | Duplicate: {preview['duplicate']} | Invalid: {preview['invalid']} | Already imported: {preview['skipped']}")
+for error in preview['errors']:
+    print(f"[FAIL] Row {error['row']}: {error['detail']}")
+
+if input("\nApply import? (yes/no): ").strip().lower() != "yes":
+    print("Cancelled.")
+    sys.exit(0)
 
-    if response.status_code == 201:
-        success_count += 1
-        print(f"[OK] Added: {item_name} (Qty: {quantity})")
-    else:
-        error_count += 1
-        print(f"[FAIL] {item_name} - {response.text}")
+result = upload(dry_run=False)
 
 print(f"\n{'='*60}")
 print(f"Import Complete!")
-print(f"Successfully imported: {success_count} items")
-print(f"Errors: {error_count} items")
+print(f"New items: {result['new']}")
+print(f"Updated items: {result['updated']}")
+print(f"Duplicates skipped: {result['duplicate']}")
+print(f"Already imported: {result['skipped']}")
+print(f"Errors: {result['invalid']} items")
 print(f"{'='*60}")
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Check the column-wise spec extraction against a golden file and time it
+against the original per-row loops.
+
+Usage (from the repository root):
+    python inventory_data/bench_spec_extraction.py [copies]
+    python inventory_data/bench_spec_extraction.py --write-expected
+
+spec_extraction_expected.json holds the items the original per-row
+process_robu_file / process_components_file produced for the bundled Robu
+and components sheets, before extraction was made column-wise. The script
+exits non-zero if the column-wise output differs from it in any item.
+
+--write-expected regenerates the file with the per-row file processors of
+whichever import_inventory.py is first on the path. Only do that on purpose,
+when the expected output really changes.
+
+For the timings each sheet is repeated `copies` times (default 200) so they
+reflect a large order export.
+"""
+
+import json
+import math
+import os
+import sys
+import time
+
+import pandas as pd
+
+from import_inventory import InventoryImporter
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+EXPECTED_FILE = os.path.join(DATA_DIR, 'spec_extraction_expected.json')
+
+SHEETS = [
+    ('Robu', 'robu_orders.xlsx'),
+    ('Components', 'components_inventory.xlsx'),
+]
+
+
+def json_value(value):
+    """Make an item value JSON-safe: timestamps as ISO strings, NaN/NaT as None"""
+    if value is None or value is pd.NaT:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    return value
+
+
+def json_items(items):
+    return [{key: json_value(value) for key, value in item.items()} for item in items]
+
+
+def write_expected():
+    """Record the per-row output for the bundled sheets"""
+    expected = {}
+    for label, filename in SHEETS:
+        importer = InventoryImporter()
+        process = importer.process_robu_file if label == 'Robu' else importer.process_components_file
+        process(os.path.join(DATA_DIR, filename))
+        expected[label] = json_items(importer.items)
+
+    with open(EXPECTED_FILE, 'w', encoding='utf-8') as f:
+        json.dump(expected, f, indent=1, ensure_ascii=False)
+    print(f"Wrote {EXPECTED_FILE}")
+
+
+def robu_rows(importer: InventoryImporter, df: pd.DataFrame):
+    """The original iterrows loop from process_robu_file, kept as the timing baseline"""
+    items = []
+    for _, row in df.iterrows():
+        product_name = row['Product Name']
+        category = importer.categorize_item(product_name)
+        specs = importer.extract_specs(product_name, category)
+        part_number = importer.extract_part_number(product_name)
+        clean_name = importer.clean_product_name(product_name, specs)
+
+        items.append({
+            'name': clean_name,
+            'part_number': part_number or '',
+            'category': category,
+            'specifications': ', '.join([f"{k}: {v}" for k, v in specs.items()]),
+        })
+    return items
+
+
+def components_rows(importer: InventoryImporter, df: pd.DataFrame):
+    """The original iterrows loop from process_components_file, kept as the timing baseline"""
+    items = []
+    for _, row in df.iterrows():
+        component_name = row['Component Name']
+        category = importer.categorize_item(component_name)
+        specs = importer.extract_specs(component_name, category)
+        part_number = importer.extract_part_number(component_name)
+        supplier = importer.extract_supplier(component_name, str(row['Vendor/Notes']))
+
+        items.append({
+            'part_number': part_number or '',
+            'category': category,
+            'supplier': supplier,
+            'specifications': ', '.join([f"{k}: {v}" for k, v in specs.items()]),
+        })
+    return items
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def compare(label, expected, actual):
+    """Return the number of differing items, printing the first few"""
+    if len(expected) != len(actual):
+        print(f"{label}: {len(expected)} expected items vs {len(actual)} column-wise items")
+        return max(len(expected), len(actual))
+
+    mismatches = 0
+    for index, (want, got) in enumerate(zip(expected, actual)):
+        keys = want.keys() | got.keys()
+        diff = {key: (want.get(key), got.get(key)) for key in keys if want.get(key) != got.get(key)}
+        if diff:
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"{label} item {index}: {diff}")
+    return mismatches
+
+
+def main():
+    if '--write-expected' in sys.argv[1:]:
+        write_expected()
+        return
+
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    importer = InventoryImporter()
+    with open(EXPECTED_FILE, encoding='utf-8') as f:
+        expected = json.load(f)
+
+    processors = {
+        'Robu': (robu_rows, importer.process_robu_frame),
+        'Components': (components_rows, importer.process_components_frame),
+    }
+
+    failures = 0
+    for label, filename in SHEETS:
+        per_row, column_wise = processors[label]
+        sheet = pd.read_excel(os.path.join(DATA_DIR, filename))
+
+        mismatches = compare(label, expected[label], json_items(column_wise(sheet)))
+        failures += mismatches
+
+        df = pd.concat([sheet] * copies, ignore_index=True)
+        _, row_seconds = timed(per_row, importer, df)
+        _, column_seconds = timed(column_wise, df)
+
+        print(f"{label}: {len(sheet):,} rows checked, {len(df):,} rows timed")
+        print(f"  Mismatches:  {mismatches}")
+        print(f"  Per-row:     {row_seconds:.3f}s")
+        print(f"  Column-wise: {column_seconds:.3f}s ({row_seconds / column_seconds:.2f}x)")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
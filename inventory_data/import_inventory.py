@@ -4,133 +4,116 @@ Electronics Lab Inventory Import Script
 Automatically categorizes and imports inventory from Excel files
 """
 
+import os
+import sys
+import numpy as np
 import pandas as pd
 import re
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 
+# Share the category rules with the CRM backend
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+from app.services.categorizer import categorize, default_matcher
+from app.services.dedupe import find_duplicate_groups
+from app.services.tabular_reader import TabularReader
+
+# Spec patterns, compiled once and shared by the per-row and column-wise paths
+VOLTAGE_PATTERN = re.compile(r'(\d+\.?\d*)\s*V(?!\w)', re.IGNORECASE)
+CURRENT_PATTERN = re.compile(r'(\d+\.?\d*)\s*(A|mA)(?!\w)', re.IGNORECASE)
+RESISTANCE_PATTERN = re.compile(r'(\d+\.?\d*)\s*(Ohm|ohm|Ω|kohm|mohm)', re.IGNORECASE)
+TOLERANCE_PATTERN = re.compile(r'±?\s*(\d+)%')
+POWER_PATTERN = re.compile(r'(\d+\.?\d*)\s*W(?!\w)', re.IGNORECASE)
+CAPACITANCE_PATTERN = re.compile(r'(\d+\.?\d*)\s*(µF|uF|pF|nF)', re.IGNORECASE)
+PACKAGE_PATTERN = re.compile(
+    r'\b(SOT-\d+|TO-\d+|PDIP-\d+|SMD|DIP|QFP|SOIC|0201|0402|0603|0805|1206)\b', re.IGNORECASE
+)
+LONG_PARENTHESES_PATTERN = re.compile(r'\([^)]{50,}\)')
+
+# Common part number patterns, tried in order: ABC123-DEF, ABC123DEF, etc.
+PART_NUMBER_PATTERNS = [
+    re.compile(r'\b([A-Z]{2,}[\d]{3,}[A-Z\d\-]*)\b', re.IGNORECASE),  # e.g., IRLML6344TRPBF
+    re.compile(r'\b([A-Z]{2}\d{4}[A-Z]*)\b', re.IGNORECASE),  # e.g., CD4017BE
+    re.compile(r'\b(LM\s*\d{3,}[A-Z]*)\b', re.IGNORECASE),    # e.g., LM358
+]
+
+# Order in which extracted specs are listed in the specifications column
+SPEC_FIELDS = ['voltage', 'current', 'resistance', 'tolerance', 'power', 'capacitance', 'package']
+
+# Spreadsheets are read in batches of this many rows so memory stays flat
+READ_BATCH_SIZE = 5000
+
+# Columns read from each export; the header row is located automatically
+ROBU_COLUMNS = {
+    'Product Name': ('product name',),
+    'Quantity': ('quantity', 'qty'),
+    'Order Number': ('order number', 'order #', 'order no'),
+    'Order Date': ('order date',),
+}
+COMPONENTS_COLUMNS = {
+    'Component Name': ('component name',),
+    'Quantity': ('quantity', 'qty'),
+    'Unit Price': ('unit price',),
+    'Date': ('date',),
+    'Vendor/Notes': ('vendor/notes',),
+}
+
+SUPPLIERS = {
+    'Robu': ['robu'],
+    'Amazon': ['amazon'],
+    'Element14': ['element14', 'element 14'],
+    'Mouser': ['mouser'],
+    'Digikey': ['digikey', 'digi-key'],
+    'Navrang Electronics': ['navrang'],
+}
+
+
 class InventoryImporter:
     def __init__(self):
-        # Define category mapping based on keywords
-        self.category_rules = {
-            'Development Boards': [
-                'raspberry pi', 'arduino', 'esp32', 'esp8266', 'teensy',
-                'stm32', 'atmega', 'dev board', 'development board', 'nucleo'
-            ],
-            'Passive Components - Resistors': [
-                'resistor', ' ohm', 'kohm', 'mohm', 'res thick film'
-            ],
-            'Passive Components - Capacitors': [
-                'capacitor', 'cap ', ' µf', ' uf', ' pf', ' nf', 'ceramic capacitor'
-            ],
-            'Active Components - MOSFETs': [
-                'mosfet', 'mos fet', 'n-channel', 'p-channel'
-            ],
-            'Active Components - Transistors': [
-                'transistor', 'bjt', 'tip122', 'bc547', 'darlington'
-            ],
-            'Active Components - Diodes': [
-                'diode', 'photodiode', 'led', 'zener'
-            ],
-            'ICs - Operational Amplifiers': [
-                'op-amp', 'op amp', 'lm358', 'tl071', 'operational amplifier'
-            ],
-            'ICs - Microcontrollers': [
-                'atmega', 'pic16', 'pic18', 'microcontroller', 'mcu'
-            ],
-            'ICs - Logic ICs': [
-                'cd4017', 'cd4051', 'cd40106', '74hc', '74ls', 'counter',
-                'mux', 'multiplexer', 'schmitt trigger'
-            ],
-            'ICs - Voltage Regulators': [
-                'voltage regulator', 'lm334', 'lm234', 'ldo', '7805', 'az1084'
-            ],
-            'ICs - Special Function': [
-                'dds signal', 'ad9833', 'max4659', 'max4594', 'spdt', 'spst'
-            ],
-            'Modules - Sensors': [
-                'sensor', 'gyroscope', 'accelerometer', 'temperature sensor'
-            ],
-            'Modules - Communication': [
-                'wifi', 'bluetooth', 'rf module', 'nrf24', 'lora'
-            ],
-            'Modules - Relays & Switches': [
-                'relay', 'solid state relay', 'ssr-'
-            ],
-            'Modules - Motor Control': [
-                'servo', 'motor driver', 'stepper'
-            ],
-            'Connectors & Terminals': [
-                'connector', 'terminal', 'header', 'jst', 'dupont', 'xh2.54'
-            ],
-            'Cables & Wires': [
-                'wire', 'cable', 'awg', 'wire wrap', 'jtag', 'isp'
-            ],
-            'Passive Components - Optocouplers': [
-                'optocoupler', 'pc817', 'opto'
-            ],
-            'Power Supplies & Adapters': [
-                'power supply', 'adapter', 'usb type-c'
-            ],
-            'Cooling & Thermal': [
-                'heat sink', 'heatsink', 'thermal', 'cooling'
-            ],
-            'Uncategorized': []  # Default category
-        }
-
         self.items = []
 
     def categorize_item(self, product_name: str) -> str:
         """Auto-categorize item based on product name keywords"""
-        product_lower = product_name.lower()
-
-        for category, keywords in self.category_rules.items():
-            if category == 'Uncategorized':
-                continue
-            for keyword in keywords:
-                if keyword in product_lower:
-                    return category
-
-        return 'Uncategorized'
+        return categorize(product_name)
 
     def extract_specs(self, product_name: str, category: str) -> Dict[str, str]:
         """Extract specifications from product name"""
         specs = {}
 
         # Extract voltage ratings (e.g., "30V", "5V")
-        voltage_match = re.search(r'(\d+\.?\d*)\s*V(?!\w)', product_name, re.IGNORECASE)
+        voltage_match = VOLTAGE_PATTERN.search(product_name)
         if voltage_match:
             specs['voltage'] = voltage_match.group(1) + 'V'
 
         # Extract current ratings (e.g., "5A", "120mA")
-        current_match = re.search(r'(\d+\.?\d*)\s*(A|mA)(?!\w)', product_name, re.IGNORECASE)
+        current_match = CURRENT_PATTERN.search(product_name)
         if current_match:
             specs['current'] = current_match.group(1) + current_match.group(2)
 
         # Extract resistance (e.g., "22 Ohm", "10kΩ")
         if 'Resistor' in category:
-            ohm_match = re.search(r'(\d+\.?\d*)\s*(Ohm|ohm|Ω|kohm|mohm)', product_name, re.IGNORECASE)
+            ohm_match = RESISTANCE_PATTERN.search(product_name)
             if ohm_match:
                 specs['resistance'] = ohm_match.group(1) + ' ' + ohm_match.group(2)
 
             # Extract tolerance
-            tolerance_match = re.search(r'±?\s*(\d+)%', product_name)
+            tolerance_match = TOLERANCE_PATTERN.search(product_name)
             if tolerance_match:
                 specs['tolerance'] = tolerance_match.group(1) + '%'
 
             # Extract power rating
-            power_match = re.search(r'(\d+\.?\d*)\s*W(?!\w)', product_name, re.IGNORECASE)
+            power_match = POWER_PATTERN.search(product_name)
             if power_match:
                 specs['power'] = power_match.group(1) + 'W'
 
         # Extract capacitance
         if 'Capacitor' in category:
-            cap_match = re.search(r'(\d+\.?\d*)\s*(µF|uF|pF|nF)', product_name, re.IGNORECASE)
+            cap_match = CAPACITANCE_PATTERN.search(product_name)
             if cap_match:
                 specs['capacitance'] = cap_match.group(1) + ' ' + cap_match.group(2)
 
         # Extract package type
-        package_match = re.search(r'\b(SOT-\d+|TO-\d+|PDIP-\d+|SMD|DIP|QFP|SOIC|0201|0402|0603|0805|1206)\b', product_name, re.IGNORECASE)
+        package_match = PACKAGE_PATTERN.search(product_name)
         if package_match:
             specs['package'] = package_match.group(1).upper()
 
@@ -141,7 +124,7 @@ class InventoryImporter:
         clean_name = name
 
         # Remove very long descriptions in parentheses
-        clean_name = re.sub(r'\([^)]{50,}\)', '', clean_name)
+        clean_name = LONG_PARENTHESES_PATTERN.sub('', clean_name)
 
         # Keep only the essential part for very long names
         if len(clean_name) > 100:
@@ -154,15 +137,8 @@ class InventoryImporter:
 
     def extract_part_number(self, product_name: str) -> Optional[str]:
         """Extract manufacturer part number from product name"""
-        # Common patterns: ABC123-DEF, ABC123DEF, etc.
-        patterns = [
-            r'\b([A-Z]{2,}[\d]{3,}[A-Z\d\-]*)\b',  # e.g., IRLML6344TRPBF
-            r'\b([A-Z]{2}\d{4}[A-Z]*)\b',  # e.g., CD4017BE
-            r'\b(LM\s*\d{3,}[A-Z]*)\b',    # e.g., LM358
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, product_name, re.IGNORECASE)
+        for pattern in PART_NUMBER_PATTERNS:
+            match = pattern.search(product_name)
             if match:
                 return match.group(1).upper().replace(' ', '')
 
@@ -172,94 +148,176 @@ class InventoryImporter:
         """Extract supplier from product or vendor notes"""
         combined = (product_name + ' ' + vendor_notes).lower()
 
-        suppliers = {
-            'Robu': ['robu'],
-            'Amazon': ['amazon'],
-            'Element14': ['element14', 'element 14'],
-            'Mouser': ['mouser'],
-            'Digikey': ['digikey', 'digi-key'],
-            'Navrang Electronics': ['navrang'],
-        }
-
-        for supplier, keywords in suppliers.items():
+        for supplier, keywords in SUPPLIERS.items():
             for keyword in keywords:
                 if keyword in combined:
                     return supplier
 
         return 'Unknown'
 
+    def parse_unit_price(self, value) -> Optional[float]:
+        """Parse a price cell such as '1,250/-' into a float"""
+        if pd.isna(value):
+            return None
+        price_str = str(value).replace('/-', '').replace(',', '')
+        try:
+            return float(price_str)
+        except ValueError:
+            return None
+
+    def extract_specs_frame(self, names: pd.Series, categories: pd.Series) -> pd.DataFrame:
+        """Column-wise extract_specs: one column per spec, NaN where absent"""
+        specs = pd.DataFrame(index=names.index)
+
+        voltage = names.str.extract(VOLTAGE_PATTERN)
+        specs['voltage'] = voltage[0] + 'V'
+
+        current = names.str.extract(CURRENT_PATTERN)
+        specs['current'] = current[0] + current[1]
+
+        # Resistor and capacitor specs only apply to those categories, so
+        # only those rows are searched; the rest are left as NaN
+        resistors = names[categories.str.contains('Resistor', regex=False)]
+        resistance = resistors.str.extract(RESISTANCE_PATTERN)
+        specs['resistance'] = resistance[0] + ' ' + resistance[1]
+        specs['tolerance'] = resistors.str.extract(TOLERANCE_PATTERN)[0] + '%'
+        specs['power'] = resistors.str.extract(POWER_PATTERN)[0] + 'W'
+
+        capacitors = names[categories.str.contains('Capacitor', regex=False)]
+        capacitance = capacitors.str.extract(CAPACITANCE_PATTERN)
+        specs['capacitance'] = capacitance[0] + ' ' + capacitance[1]
+
+        specs['package'] = names.str.extract(PACKAGE_PATTERN)[0].str.upper()
+
+        return specs[SPEC_FIELDS]
+
+    def format_specs(self, specs: pd.DataFrame) -> pd.Series:
+        """Join spec columns into 'key: value, ...' strings"""
+        joined = pd.Series('', index=specs.index, dtype=object)
+        for field in SPEC_FIELDS:
+            values = specs[field]
+            present = values.notna()
+            entry = field + ': ' + values[present]
+            joined[present] = np.where(joined[present] == '', entry, joined[present] + ', ' + entry)
+        return joined
+
+    def clean_product_names(self, names: pd.Series) -> pd.Series:
+        """Column-wise clean_product_name"""
+        clean = names.str.replace(LONG_PARENTHESES_PATTERN, '', regex=True)
+
+        # Keep only the part before the first dash for very long names
+        too_long = clean.str.len() > 100
+        clean = clean.where(~too_long, clean.str.split('-', n=1).str[0].str.strip())
+
+        return clean.str.strip()
+
+    def extract_part_numbers(self, names: pd.Series) -> pd.Series:
+        """Column-wise extract_part_number, '' where nothing matches"""
+        part_numbers = pd.Series('', index=names.index, dtype=object)
+        missing = names
+        for pattern in PART_NUMBER_PATTERNS:
+            found = missing.str.extract(pattern)[0].dropna()
+            part_numbers[found.index] = found.str.upper().str.replace(' ', '', regex=False)
+            # Later patterns only need to look at rows still without a match
+            missing = missing.drop(found.index)
+            if missing.empty:
+                break
+        return part_numbers
+
+    def extract_suppliers(self, names: pd.Series, vendor_notes: pd.Series) -> pd.Series:
+        """Column-wise extract_supplier"""
+        combined = (names + ' ' + vendor_notes.astype(str)).str.lower()
+        conditions, choices = [], []
+        for supplier, keywords in SUPPLIERS.items():
+            for keyword in keywords:
+                conditions.append(combined.str.contains(keyword, regex=False).to_numpy(dtype=bool))
+                choices.append(supplier)
+        return pd.Series(np.select(conditions, choices, default='Unknown'), index=names.index)
+
+    def suggest_min_stock_levels(self, categories: pd.Series, quantities: pd.Series) -> pd.Series:
+        """Column-wise suggest_min_stock"""
+        is_passive = (categories.str.contains('Resistor', regex=False)
+                      | categories.str.contains('Capacitor', regex=False))
+        is_board = categories.str.contains('Development Board', regex=False)
+        is_ic = (categories.str.contains('IC', regex=False)
+                 | categories.str.contains('Component', regex=False))
+
+        qty = quantities.to_numpy(dtype=float)
+        levels = np.select(
+            [is_passive, is_board, is_ic],
+            [np.maximum(10, (qty * 0.2).astype(int)),
+             np.maximum(1, (qty * 0.1).astype(int)),
+             np.maximum(5, (qty * 0.15).astype(int))],
+            default=np.maximum(2, (qty * 0.1).astype(int)),
+        )
+        return pd.Series(levels, index=quantities.index)
+
+    def build_items(self, names: pd.Series, quantities: pd.Series) -> pd.DataFrame:
+        """Shared column-wise pipeline: category, specs, part number and min stock"""
+        categories = pd.Series(default_matcher.categorize_many(names), index=names.index)
+        return pd.DataFrame({
+            'original_name': names,
+            'part_number': self.extract_part_numbers(names),
+            'category': categories,
+            'quantity': quantities.astype(int),
+            'specifications': self.format_specs(self.extract_specs_frame(names, categories)),
+            'min_stock_level': self.suggest_min_stock_levels(categories, quantities),
+            'location': '',
+        })
+
+    def read_batches(self, filepath: str, columns: Dict[str, Tuple[str, ...]], required: Tuple[str, ...]):
+        """Stream a spreadsheet as DataFrames of at most READ_BATCH_SIZE rows"""
+        reader = TabularReader(filepath, fields=columns, required=required)
+        for batch in reader.batches(READ_BATCH_SIZE):
+            yield pd.DataFrame([record for _, record in batch], columns=list(reader.positions))
+
     def process_robu_file(self, filepath: str):
         """Process Robu orders Excel file"""
         print(f"📖 Reading Robu orders from {filepath}...")
-        df = pd.read_excel(filepath)
-
-        for _, row in df.iterrows():
-            product_name = row['Product Name']
-            category = self.categorize_item(product_name)
-            specs = self.extract_specs(product_name, category)
-            part_number = self.extract_part_number(product_name)
-            clean_name = self.clean_product_name(product_name, specs)
-
-            item = {
-                'name': clean_name,
-                'original_name': product_name,
-                'part_number': part_number or '',
-                'category': category,
-                'quantity': int(row['Quantity']),
-                'unit_price': None,
-                'supplier': 'Robu',
-                'purchase_date': row['Order Date'] if 'Order Date' in row else None,
-                'order_number': str(row['Order Number']) if 'Order Number' in row else '',
-                'specifications': ', '.join([f"{k}: {v}" for k, v in specs.items()]),
-                'min_stock_level': self.suggest_min_stock(category, int(row['Quantity'])),
-                'location': '',
-                'notes': f"Order #{row['Order Number']}" if 'Order Number' in row else ''
-            }
-
-            self.items.append(item)
-
-        print(f"✅ Processed {len(df)} items from Robu orders")
+        count = 0
+        for df in self.read_batches(filepath, ROBU_COLUMNS, ('Product Name', 'Quantity')):
+            self.items.extend(self.process_robu_frame(df))
+            count += len(df)
+        print(f"✅ Processed {count} items from Robu orders")
+
+    def process_robu_frame(self, df: pd.DataFrame) -> List[Dict]:
+        """Turn a Robu orders frame into item dicts"""
+        names = df['Product Name']
+        items = self.build_items(names, df['Quantity'])
+        items['name'] = self.clean_product_names(names)
+        items['unit_price'] = None
+        items['supplier'] = 'Robu'
+        items['purchase_date'] = df['Order Date'] if 'Order Date' in df else None
+        if 'Order Number' in df:
+            items['order_number'] = df['Order Number'].astype(str)
+            items['notes'] = 'Order #' + items['order_number']
+        else:
+            items['order_number'] = ''
+            items['notes'] = ''
+        return items.to_dict('records')
 
     def process_components_file(self, filepath: str):
         """Process general components inventory Excel file"""
         print(f"📖 Reading components inventory from {filepath}...")
-        df = pd.read_excel(filepath)
-
-        for _, row in df.iterrows():
-            component_name = row['Component Name']
-            category = self.categorize_item(component_name)
-            specs = self.extract_specs(component_name, category)
-            part_number = self.extract_part_number(component_name)
-            supplier = self.extract_supplier(component_name, str(row['Vendor/Notes']))
-
-            # Parse unit price
-            unit_price = None
-            if pd.notna(row['Unit Price']):
-                price_str = str(row['Unit Price']).replace('/-', '').replace(',', '')
-                try:
-                    unit_price = float(price_str)
-                except:
-                    pass
-
-            item = {
-                'name': component_name,
-                'original_name': component_name,
-                'part_number': part_number or '',
-                'category': category,
-                'quantity': int(row['Quantity']),
-                'unit_price': unit_price,
-                'supplier': supplier,
-                'purchase_date': row['Date'] if 'Date' in row else None,
-                'order_number': '',
-                'specifications': ', '.join([f"{k}: {v}" for k, v in specs.items()]),
-                'min_stock_level': self.suggest_min_stock(category, int(row['Quantity'])),
-                'location': '',
-                'notes': str(row['Vendor/Notes']) if pd.notna(row['Vendor/Notes']) else ''
-            }
-
-            self.items.append(item)
-
-        print(f"✅ Processed {len(df)} items from components inventory")
+        count = 0
+        for df in self.read_batches(filepath, COMPONENTS_COLUMNS, ('Component Name', 'Quantity', 'Unit Price', 'Vendor/Notes')):
+            self.items.extend(self.process_components_frame(df))
+            count += len(df)
+        print(f"✅ Processed {count} items from components inventory")
+
+    def process_components_frame(self, df: pd.DataFrame) -> List[Dict]:
+        """Turn a components inventory frame into item dicts"""
+        names = df['Component Name']
+        vendor_notes = df['Vendor/Notes']
+        items = self.build_items(names, df['Quantity'])
+        items['name'] = names
+        items['unit_price'] = df['Unit Price'].map(self.parse_unit_price).astype(object)
+        items['unit_price'] = items['unit_price'].where(items['unit_price'].notna(), None)
+        items['supplier'] = self.extract_suppliers(names, vendor_notes)
+        items['purchase_date'] = df['Date'] if 'Date' in df else None
+        items['order_number'] = ''
+        items['notes'] = vendor_notes.where(vendor_notes.notna(), '').astype(str)
+        return items.to_dict('records')
 
     def suggest_min_stock(self, category: str, current_qty: int) -> int:
         """Suggest minimum stock level based on category and current quantity"""
@@ -276,7 +334,7 @@ class InventoryImporter:
         """Identify and merge potential duplicates"""
         print("🔍 Checking for duplicates...")
 
-        # Group by part number or similar names
+        # Group by part number or exact name first
         unique_items = {}
         duplicates_merged = 0
 
@@ -285,22 +343,41 @@ class InventoryImporter:
             key = key.lower().strip()
 
             if key in unique_items:
-                # Merge quantities
-                unique_items[key]['quantity'] += item['quantity']
-                # Keep the one with price if available
-                if item['unit_price'] and not unique_items[key]['unit_price']:
-                    unique_items[key]['unit_price'] = item['unit_price']
+                self._merge_item(unique_items[key], item)
                 duplicates_merged += 1
             else:
                 unique_items[key] = item
 
-        self.items = list(unique_items.values())
+        items = list(unique_items.values())
+
+        # Then merge near-duplicate names within a category, e.g.
+        # "10K Ohm 0805 Resistor" and "Resistor 10k 0805"
+        merged_indexes = set()
+        groups = find_duplicate_groups(
+            (index, item['original_name'], item['category']) for index, item in enumerate(items)
+        )
+        for group in groups:
+            keep = items[group[0][0]]
+            for index, _ in group[1:]:
+                self._merge_item(keep, items[index])
+                merged_indexes.add(index)
+        duplicates_merged += len(merged_indexes)
+
+        self.items = [item for index, item in enumerate(items) if index not in merged_indexes]
 
         if duplicates_merged > 0:
             print(f"✅ Merged {duplicates_merged} duplicate items")
         else:
             print("✅ No duplicates found")
 
+    def _merge_item(self, keep: Dict, duplicate: Dict):
+        """Fold a duplicate into the item that is kept"""
+        # Merge quantities
+        keep['quantity'] += duplicate['quantity']
+        # Keep the one with price if available
+        if duplicate['unit_price'] and not keep['unit_price']:
+            keep['unit_price'] = duplicate['unit_price']
+
     def generate_report(self):
         """Generate summary report"""
         print("\n" + "="*60)
@@ -1,45 +1,13 @@
 # -*- coding: utf-8 -*-
+import os
+import sys
 import pandas as pd
 import re
 
-def categorize(name):
-    n = name.lower()
-    if any(x in n for x in ['raspberry', 'arduino', 'esp32', 'teensy', 'atmega328']):
-        return 'Development Boards'
-    elif any(x in n for x in ['resistor', ' ohm']):
-        return 'Passive Components - Resistors'
-    elif any(x in n for x in ['capacitor', ' uf', ' pf']):
-        return 'Passive Components - Capacitors'
-    elif 'mosfet' in n:
-        return 'Active Components - MOSFETs'
-    elif any(x in n for x in ['transistor', 'darlington', 'tip122']):
-        return 'Active Components - Transistors'
-    elif any(x in n for x in ['diode', 'photodiode']):
-        return 'Active Components - Diodes'
-    elif any(x in n for x in ['lm358', 'op-amp', 'tl071']):
-        return 'ICs - Operational Amplifiers'
-    elif any(x in n for x in ['cd4017', 'cd4051', 'cd40106', '74hc', 'mux', 'counter']):
-        return 'ICs - Logic ICs'
-    elif any(x in n for x in ['voltage regulator', 'lm334', 'lm234', 'ldo', 'az1084']):
-        return 'ICs - Voltage Regulators'
-    elif any(x in n for x in ['ad9833', 'max4659', 'max4594']):
-        return 'ICs - Special Function'
-    elif 'relay' in n or 'ssr-' in n:
-        return 'Modules - Relays & Switches'
-    elif 'servo' in n or 'motor' in n:
-        return 'Modules - Motor Control'
-    elif any(x in n for x in ['connector', 'terminal', 'jst', 'dupont']):
-        return 'Connectors & Terminals'
-    elif any(x in n for x in ['wire', 'cable', 'awg']):
-        return 'Cables & Wires'
-    elif 'optocoupler' in n or 'pc817' in n:
-        return 'Passive Components - Optocouplers'
-    elif 'power supply' in n or 'adapter' in n:
-        return 'Power Supplies & Adapters'
-    elif 'heat sink' in n or 'heatsink' in n:
-        return 'Cooling & Thermal'
-    else:
-        return 'Uncategorized'
+# Share the category rules with the CRM backend
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+from app.services.categorizer import categorize
+from app.services.tabular_reader import TabularReader
 
 def get_supplier(name, vendor=''):
     combined = (name + ' ' + vendor).lower()
@@ -67,9 +35,14 @@ def get_min_stock(category, qty):
     return max(2, int(qty * 0.1))
 
 print('Processing Robu orders...')
-df_robu = pd.read_excel('robu_orders.xlsx')
+# Rows are streamed from the workbook; the header row is located automatically
+robu_reader = TabularReader(
+    'robu_orders.xlsx',
+    fields={'Product Name': ('product name',), 'Quantity': ('quantity', 'qty'), 'Order Number': ('order number',)},
+    required=('Product Name', 'Quantity', 'Order Number'),
+)
 robu_items = []
-for _, row in df_robu.iterrows():
+for _, row in robu_reader:
     robu_items.append({
         'category': categorize(row['Product Name']),
         'name': row['Product Name'][:100],
@@ -84,25 +57,35 @@ for _, row in df_robu.iterrows():
 print(f'Processed {len(robu_items)} Robu items')
 
 print('Processing components inventory...')
-df_comp = pd.read_excel('components_inventory.xlsx')
+comp_reader = TabularReader(
+    'components_inventory.xlsx',
+    fields={
+        'Component Name': ('component name',),
+        'Quantity': ('quantity', 'qty'),
+        'Unit Price': ('unit price',),
+        'Vendor/Notes': ('vendor/notes',),
+    },
+    required=('Component Name', 'Quantity', 'Unit Price', 'Vendor/Notes'),
+)
 comp_items = []
-for _, row in df_comp.iterrows():
+for _, row in comp_reader:
     price = None
-    if pd.notna(row['Unit Price']):
+    if row['Unit Price'] is not None:
         try:
             price = float(str(row['Unit Price']).replace('/-', '').replace(',', ''))
-        except:
+        except ValueError:
             pass
 
+    vendor = row['Vendor/Notes']
     comp_items.append({
         'category': categorize(row['Component Name']),
         'name': row['Component Name'],
         'quantity': int(row['Quantity']),
         'unit_price': price,
-        'supplier': get_supplier(row['Component Name'], str(row['Vendor/Notes'])),
+        'supplier': get_supplier(row['Component Name'], str(vendor) if vendor is not None else ''),
         'min_stock_level': get_min_stock(categorize(row['Component Name']), int(row['Quantity'])),
         'location': '',
-        'notes': str(row['Vendor/Notes']) if pd.notna(row['Vendor/Notes']) else ''
+        'notes': str(vendor) if vendor is not None else ''
     })
 
 print(f'Processed {len(comp_items)} component items')
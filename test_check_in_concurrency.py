@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Fire hundreds of simultaneous check-ins at a running API and verify that
+every user ends up with exactly one attendance record.
+
+Each test user double-taps check-in with the same Idempotency-Key (both taps
+must return the same record) and also sends one tap without a key (which
+must either be the first check-in or be rejected).
+
+Usage:
+    python test_check_in_concurrency.py [users] [base_url]
+
+Creates `users` throwaway employee accounts (default 200) through the admin
+account used by the other test scripts.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+USERS = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+BASE_URL = sys.argv[2] if len(sys.argv) > 2 else "http://localhost:8000/api/v1"
+
+ADMIN = {"email": "admin@example.com", "password": "admin123"}
+# Must be inside a site (or the LAB_* location) of the server under test
+LAT = float(os.environ.get("CHECK_IN_LAT", 28.544396761789827))
+LON = float(os.environ.get("CHECK_IN_LON", 77.19271651688473))
+
+
+def request(method, path, body=None, token=None, headers=None):
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(BASE_URL + path, data=data, method=method)
+    req.add_header("Content-Type", "application/json")
+    if token:
+        req.add_header("Authorization", f"Bearer {token}")
+    for name, value in (headers or {}).items():
+        req.add_header(name, value)
+    try:
+        with urllib.request.urlopen(req, timeout=60) as response:
+            return response.status, json.loads(response.read() or b"null")
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read() or b"null")
+
+
+def login(email, password):
+    status, body = request("POST", "/auth/login", {"email": email, "password": password})
+    if status != 200:
+        sys.exit(f"❌ Login failed for {email}: {body}")
+    return body["access_token"]
+
+
+def main():
+    admin_token = login(ADMIN["email"], ADMIN["password"])
+    _, roles = request("GET", "/users/roles", token=admin_token)
+    employee_role = next(role["id"] for role in roles if role["name"] == "employee")
+
+    print(f"1. Creating {USERS} test users...")
+    stamp = int(time.time())
+    emails = [f"checkin.load{stamp}.{i}@example.com" for i in range(USERS)]
+
+    def create(email):
+        request("POST", "/users/", {
+            "email": email,
+            "password": "test123",
+            "full_name": "Check-in Load Test",
+            "role_id": employee_role
+        }, token=admin_token)
+        return email, login(email, "test123")
+
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        tokens = dict(pool.map(create, emails))
+
+    # Two taps with the same key and one without, all released at once
+    taps = [(email, f"tap-{email}") for email in emails] * 2 + [(email, None) for email in emails]
+    start = threading.Barrier(len(taps))
+
+    def tap(job):
+        email, key = job
+        start.wait()
+        headers = {"Idempotency-Key": key} if key else {}
+        status, body = request("POST", "/attendance/check-in", {"latitude": LAT, "longitude": LON},
+                               token=tokens[email], headers=headers)
+        return email, key, status, body
+
+    print(f"2. Sending {len(taps)} simultaneous check-ins...")
+    began = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(taps)) as pool:
+        results = list(pool.map(tap, taps))
+    elapsed = time.perf_counter() - began
+
+    records = defaultdict(set)
+    keyed = defaultdict(set)
+    failures = []
+    for email, key, status, body in results:
+        if status == 201:
+            records[email].add(body["id"])
+            if key:
+                keyed[email].add(body["check_in"])
+        elif status != 400:
+            failures.append((email, status, body))
+
+    duplicated = [email for email, ids in records.items() if len(ids) > 1]
+    diverged = [email for email, check_ins in keyed.items() if len(check_ins) > 1]
+    missing = [email for email in emails if email not in records]
+
+    print(f"   {len(results)} requests in {elapsed:.2f}s")
+    print(f"   Users with more than one record:    {len(duplicated)}")
+    print(f"   Keyed retries with different data:  {len(diverged)}")
+    print(f"   Users without a check-in:           {len(missing)}")
+    print(f"   Unexpected responses:               {len(failures)}")
+
+    if duplicated or diverged or missing or failures:
+        print("❌ CONCURRENT CHECK-IN TEST FAILED")
+        sys.exit(1)
+    print("✅ CONCURRENT CHECK-IN TEST PASSED")
+
+
+if __name__ == "__main__":
+    main()
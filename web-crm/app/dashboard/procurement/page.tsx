@@ -29,6 +29,11 @@ interface ProcurementItem {
   };
 }
 
+interface ProcurementPage {
+  items: ProcurementItem[];
+  next_cursor: string | null;
+}
+
 interface InventoryCategory {
   id: string;
   name: string;
@@ -49,6 +54,8 @@ export default function ProcurementPage() {
   const { user } = useAuthStore();
   const [activeTab, setActiveTab] = useState<'procurement' | 'non-gem'>('procurement');
   const [items, setItems] = useState<ProcurementItem[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [nonGemItems, setNonGemItems] = useState<ProcurementItem[]>([]);
   const [categories, setCategories] = useState<InventoryCategory[]>([]);
   const [loading, setLoading] = useState(true);
@@ -91,16 +98,17 @@ export default function ProcurementPage() {
     try {
       if (showLoading) setLoading(true);
       const [itemsRes, nonGemRes, categoriesRes] = await Promise.all([
-        api.get<ProcurementItem[]>('/procurement/'),
+        api.get<ProcurementPage>('/procurement/'),
         api.get<ProcurementItem[]>('/procurement/non-gem'),
         api.get<InventoryCategory[]>('/inventory/categories')
       ]);
-      setItems(itemsRes.data);
+      setItems(itemsRes.data.items);
+      setNextCursor(itemsRes.data.next_cursor);
       setNonGemItems(nonGemRes.data);
       setCategories(categoriesRes.data);
 
       // Update cache
-      cache.set(CACHE_KEY_ITEMS, itemsRes.data);
+      cache.set(CACHE_KEY_ITEMS, itemsRes.data.items);
       cache.set(CACHE_KEY_NON_GEM, nonGemRes.data);
       cache.set(CACHE_KEY_CATEGORIES, categoriesRes.data);
     } catch (error) {
@@ -110,6 +118,22 @@ export default function ProcurementPage() {
     }
   };
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    try {
+      setLoadingMore(true);
+      const response = await api.get<ProcurementPage>('/procurement/', {
+        params: { cursor: nextCursor }
+      });
+      setItems(prev => [...prev, ...response.data.items]);
+      setNextCursor(response.data.next_cursor);
+    } catch (error) {
+      console.error('Failed to load more items:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   // Get unique vendors from items
   const uniqueVendors = Array.from(new Set(items.map(item => item.vendor))).sort();
 
@@ -588,6 +612,17 @@ export default function ProcurementPage() {
               </div>
             ))
           )}
+          {nextCursor && (
+            <div className="text-center">
+              <button
+                onClick={loadMore}
+                disabled={loadingMore}
+                className="px-4 py-2 bg-white border border-gray-300 text-gray-700 rounded-lg hover:bg-gray-50 text-sm disabled:opacity-50"
+              >
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </button>
+            </div>
+          )}
         </div>
       )}
 